@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Dict, List
 
 try:
@@ -71,6 +72,7 @@ SECTOR_EVENT_TYPES = {
 }
 
 AMBIGUITY_WORDS = ["may", "could", "might", "reportedly", "sources", "rumor", "rumour", "likely", "possible"]
+_AMBIGUITY_RES = tuple(re.compile(rf"\b{re.escape(w)}\b") for w in AMBIGUITY_WORDS)
 
 NUMERIC_SHOCK_RE = re.compile(
     r"\b\d+(?:\.\d+)?\s?(?:%|bp|bps|bpd|mbpd|million|billion|trillion)\b",
@@ -163,7 +165,7 @@ def _numeric_shock(text: str) -> bool:
 
 
 def _ambiguity_penalty(text: str) -> int:
-    hits = sum(1 for w in AMBIGUITY_WORDS if re.search(rf"\b{re.escape(w)}\b", text))
+    hits = sum(1 for pattern in _AMBIGUITY_RES if pattern.search(text))
     return min(15, hits * 5)
 
 
@@ -207,6 +209,22 @@ def _effective_giants() -> Dict[str, List[str]]:
     return giants
 
 
+@lru_cache(maxsize=1)
+def _sector_table() -> tuple:
+    # Built on first use, not at import: news_engine imports this module and owns CRYPTO_WATCHLIST.
+    giants = _effective_giants()
+    return tuple(
+        (
+            sector,
+            tuple(k.lower() for k in cfg.get("required", [])),
+            tuple(k.lower() for k in cfg.get("boost", [])),
+            tuple(k.lower() for k in cfg.get("exclude", [])),
+            tuple((name.lower(), name) for name in giants.get(sector, [])),
+        )
+        for sector, cfg in _effective_sector_rules().items()
+    )
+
+
 def infer_news_scope(item: Any) -> dict:
     title = str(_get(item, "title") or "")
     text = _combined_text(item).lower()
@@ -272,23 +290,17 @@ def infer_sector_impacts(item: Any, max_sectors: int = 5) -> List[dict]:
     title = str(_get(item, "title") or "")
     text = _combined_text(item).lower()
     entities = [str(e) for e in (_get(item, "entities") or [])]
-    rules = _effective_sector_rules()
-    giants = _effective_giants()
     numeric_shock = _numeric_shock(text)
     ambiguity_penalty = _ambiguity_penalty(text)
 
     impacts: List[dict] = []
-    for sector, cfg in rules.items():
-        required = [k.lower() for k in cfg.get("required", [])]
-        boost = [k.lower() for k in cfg.get("boost", [])]
-        exclude = [k.lower() for k in cfg.get("exclude", [])]
-
+    for sector, required, boost, exclude, giant_names in _sector_table():
         required_hits = sum(1 for k in required if k in text)
         boost_hits = sum(1 for k in boost if k in text)
         exclude_hits = sum(1 for k in exclude if k in text)
         giant_hits = 0
-        for name in giants.get(sector, []):
-            if name.lower() in text:
+        for lowered, name in giant_names:
+            if lowered in text:
                 giant_hits += 1
             elif name in entities:
                 giant_hits += 1
@@ -8,6 +8,26 @@ from threading import RLock
 import redis
 from cachetools import TTLCache
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _dumps(value) -> bytes | str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass
 class Cache:
@@ -22,7 +42,7 @@ class Cache:
             try:
                 data = self.redis_client.get(key)
                 if data:
-                    return json.loads(data)
+                    return _loads(data)
             except Exception:
                 pass
         with self.lock:
@@ -40,7 +60,7 @@ class Cache:
     def set(self, key: str, value, ttl_seconds: int):
         if self.redis_client is not None:
             try:
-                self.redis_client.setex(key, ttl_seconds, json.dumps(value))
+                self.redis_client.setex(key, ttl_seconds, _dumps(value))
             except Exception:
                 pass
         with self.lock:
@@ -32,7 +32,7 @@ db = init_db(settings.database_url)
 purge_old(db, settings.retention_days)
 pipeline = IntelPipelineService(settings, cache, db)
 
-_fallback_quote_cache = TTLCache(60, time.time)
+_fallback_quote_cache = TTLCache(60, time.monotonic)
 PROVIDER_ONLY_ASSETS = {
     "NASDAQ",
     "AAPL",
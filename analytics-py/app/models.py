@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 
 
 class IntelRequest(BaseModel):
@@ -42,6 +42,8 @@ class NewsItem(BaseModel):
     sector_impacts: List["SectorImpact"] = Field(default_factory=list)
     max_sector_impact: int = 0
     sector_summary: str | None = None
+    # (title, entities, normalized title, normalized entities); filled lazily by portfolio matching.
+    _norm_cache: tuple | None = PrivateAttr(default=None)
 
 
 class PersonEvent(BaseModel):
@@ -399,3 +401,7 @@ class EventClusterView(BaseModel):
 class EventClusterResponse(BaseModel):
     last_scan_ts: str | None = None
     clusters: List[EventClusterView] = Field(default_factory=list)
+
+
+# Whole-list (de)serialization for news cache payloads in a single pydantic-core call.
+NEWS_ITEM_LIST = TypeAdapter(List[NewsItem])
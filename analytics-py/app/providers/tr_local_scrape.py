@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import html
 import json
 import re
@@ -83,9 +84,10 @@ _ANCHOR_RE = re.compile(
     flags=re.IGNORECASE | re.DOTALL,
 )
 
-_ATTR_RE = re.compile(r"\b{name}\s*=\s*([\"'])(.*?)\1", flags=re.IGNORECASE | re.DOTALL)
+_ATTR_TEMPLATE = r"\b{name}\s*=\s*([\"'])(.*?)\1"
 _TOKEN_RE = re.compile(r"[A-Za-z0-9ÇĞİÖŞÜçğıöşü]+")
 _TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
 
 
 def _canonical_domain(url: str) -> str:
@@ -131,12 +133,17 @@ def _text_clean(value: str | None) -> str:
         return ""
     plain = _TAG_RE.sub(" ", value)
     plain = html.unescape(plain)
-    return re.sub(r"\s+", " ", plain).strip()
+    return _WS_RE.sub(" ", plain).strip()
+
+
+@lru_cache(maxsize=8)
+def _attr_re(name: str) -> re.Pattern:
+    # Attribute names come from a fixed set, so each pattern is built once rather than per anchor.
+    return re.compile(_ATTR_TEMPLATE.format(name=re.escape(name)), flags=re.IGNORECASE | re.DOTALL)
 
 
 def _extract_attr(attrs: str, name: str) -> str:
-    pattern = re.compile(_ATTR_RE.pattern.format(name=re.escape(name)), flags=_ATTR_RE.flags)
-    match = pattern.search(attrs or "")
+    match = _attr_re(name).search(attrs or "")
     if not match:
         return ""
     return _text_clean(match.group(2))
@@ -4,9 +4,11 @@ import math
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from threading import Lock
 from typing import Any
 
 import pandas as pd
+from cachetools import TTLCache
 
 from app.infra.http import get_json
 from app.providers.base import ProviderResult
@@ -67,6 +69,24 @@ def _fetch_chart(symbol: str, range_: str, interval: str, timeout: float):
     return {"df": df}
 
 
+CHART_CACHE_TTL_S = 300
+_CHART_CACHE: TTLCache = TTLCache(maxsize=256, ttl=CHART_CACHE_TTL_S)
+_CHART_CACHE_LOCK = Lock()
+
+
+def _fetch_chart_cached(symbol: str, range_: str, interval: str, timeout: float):
+    key = (symbol, range_, interval)
+    with _CHART_CACHE_LOCK:
+        cached = _CHART_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _fetch_chart(symbol, range_, interval, timeout)
+    if result:
+        with _CHART_CACHE_LOCK:
+            _CHART_CACHE[key] = result
+    return result
+
+
 def get_yahoo_snapshot(timeout: float = 10.0):
     out = {
         "dxy": 0.0,
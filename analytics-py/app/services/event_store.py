@@ -61,6 +61,26 @@ def _direction_from_text(text: str | None) -> int:
     return 0
 
 
+_ALT_KEYWORDS = (
+    "layer 2", "layer-2", "l2", "l1", "defi", "staking", "rollup", "bridge",
+    "solana", "avalanche", "polygon", "arbitrum", "optimism",
+)
+_REG_KEYWORDS = (
+    "exchange", "custody", "license", "regulation", "sec", "cftc", "lawsuit",
+    "enforcement", "ban", "framework", "mica", "market structure",
+)
+_RISK_OFF_SECTORS = ("OIL_GAS_UPSTREAM", "LNG_NATGAS", "DEFENSE_AEROSPACE", "SHIPPING_LOGISTICS")
+_MACRO_DEFAULTS = {"BTC": 0.45, "ETH": 0.35, "ALTS": 0.35, "STABLES": 0.5}
+# Floor scores per news_scope for assets no rule matched; "" is the fallback.
+_DEFAULT_TARGETS = {
+    "": {"BTC": 0.3, "ETH": 0.25, "ALTS": 0.3, "STABLES": 0.3},
+    "MACRO": _MACRO_DEFAULTS,
+    "GEOPOLITICS": _MACRO_DEFAULTS,
+    "SYSTEMIC": _MACRO_DEFAULTS,
+    "COMPANY": {"BTC": 0.2, "ETH": 0.2, "ALTS": 0.2, "STABLES": 0.2},
+}
+
+
 def _relevance_targets(item: NewsItem) -> list[tuple[str, float]]:
     title = (item.title or "").lower()
     tags = item.tags or []
@@ -96,13 +116,11 @@ def _relevance_targets(item: NewsItem) -> list[tuple[str, float]]:
             _add("BTC", 0.9)
             _add("ALTS", 0.55)
 
-    if any(k in title for k in ["layer 2", "layer-2", "l2", "l1", "defi", "staking", "rollup", "bridge", "solana", "avalanche", "polygon", "arbitrum", "optimism"]):
+    if any(k in title for k in _ALT_KEYWORDS):
         _add("ALTS", 0.8)
         _add("ETH", 0.65)
 
-    if event_type in ("CRYPTO_MARKET_STRUCTURE", "REGULATION_LEGAL") or "Reg" in tags or any(
-        k in title for k in ["exchange", "custody", "license", "regulation", "sec", "cftc", "lawsuit", "enforcement", "ban", "framework", "mica", "market structure"]
-    ):
+    if event_type in ("CRYPTO_MARKET_STRUCTURE", "REGULATION_LEGAL") or "Reg" in tags or any(k in title for k in _REG_KEYWORDS):
         _add("STABLES", 0.8)
         _add("ALTS", 0.7)
         _add("ETH", 0.6)
@@ -124,16 +142,12 @@ def _relevance_targets(item: NewsItem) -> list[tuple[str, float]]:
         _add("BTC", 0.6)
         _add("ALTS", 0.45)
         _add("STABLES", 0.5)
-    if any(s in top_sectors for s in ("OIL_GAS_UPSTREAM", "LNG_NATGAS", "DEFENSE_AEROSPACE", "SHIPPING_LOGISTICS")):
+    if any(s in top_sectors for s in _RISK_OFF_SECTORS):
         _add("BTC", 0.45)
         _add("ALTS", 0.35)
         _add("STABLES", 0.55)
 
-    defaults = {"BTC": 0.3, "ETH": 0.25, "ALTS": 0.3, "STABLES": 0.3}
-    if news_scope in ("MACRO", "GEOPOLITICS", "SYSTEMIC"):
-        defaults = {"BTC": 0.45, "ETH": 0.35, "ALTS": 0.35, "STABLES": 0.5}
-    elif news_scope == "COMPANY":
-        defaults = {"BTC": 0.2, "ETH": 0.2, "ALTS": 0.2, "STABLES": 0.2}
+    defaults = _DEFAULT_TARGETS.get(news_scope, _DEFAULT_TARGETS[""])
     for asset, score in defaults.items():
         if asset not in targets:
             targets[asset] = score
@@ -28,7 +28,7 @@ from app.models import (
     IntelResponse,
     LeadersGroup,
     MarketSnapshot,
-    NewsItem,
+    NEWS_ITEM_LIST,
     EventFeed,
     RiskPanel,
 )
@@ -322,7 +322,7 @@ class IntelPipelineService:
         notes: List[str] = []
         low_news = False
         if cached_news:
-            top_news = [NewsItem(**n) for n in cached_news]
+            top_news = NEWS_ITEM_LIST.validate_python(cached_news)
             debug.notes.append("news_cache_hit")
         else:
             maxrecords = 48
@@ -344,7 +344,7 @@ class IntelPipelineService:
             low_news = any("haber_verisi_zayıf" in note for note in notes)
             if low_news:
                 ttl = 180
-            self.cache.set(news_cache_key, [n.model_dump() for n in top_news], ttl)
+            self.cache.set(news_cache_key, NEWS_ITEM_LIST.dump_python(top_news), ttl)
 
         last_ingest = get_kv(self.db, "news_ingest_at")
         if should_ingest(last_ingest, self.settings.news_ingest_interval_minutes):
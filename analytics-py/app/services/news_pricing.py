@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import re
+import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -733,7 +734,8 @@ def compute_news_pricing_model(
         evidence = item.get("evidence")
         prepricing_ratio = _extract_prepricing_ratio(evidence)
         for symbol, score in by_symbol.items():
-            sym = str(symbol).upper()
+            # Interned so downstream lookups keyed by these symbols hit the identity fast path.
+            sym = sys.intern(str(symbol).upper())
             if not sym:
                 continue
             try:
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import os
 import re
 import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, List
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 import numpy as np
+from cachetools import TTLCache
 
-from app.models import IntelRequest, NewsItem
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+except Exception:  # pragma: no cover - optional dependency
+    _rapidfuzz_ratio = None
+
+from app.models import NEWS_ITEM_LIST, IntelRequest, NewsItem
 from app.engine.news_engine import (
     annotate_items,
     collect_local_news,
@@ -29,7 +45,7 @@ from app.providers.rss import fetch_rss
 from app.infra.cache import cache_key
 from app.llm.gemini_client import generate_portfolio_summary
 from app.services.quote_router import get_quote_router
-from app.providers.yahoo import _fetch_chart
+from app.providers.yahoo import CHART_CACHE_TTL_S, _fetch_chart, _fetch_chart_cached
 from app.services.news_pricing import build_announcement_tracker, compute_news_pricing_model
 
 
@@ -74,24 +90,49 @@ DEFAULT_HOLDINGS = [
 
 APP_STATE_PORTFOLIO_SEEDED = "portfolio_holdings_seeded"
 
+# Shared read-only fallback for missing alias-map sections; never mutate.
+_EMPTY: dict = {}
+
+_NOTE_PRICE_SOURCE = "portfolio_price_source=yahoo"
+_NOTE_OPT_OK = "portfolio_opt_status=ok"
+_NOTE_OPT_PARTIAL = "portfolio_opt_status=partial"
+_NOTE_GEMINI_OK = "gemini_portfolio_summary=ok"
+
+# One summary call per in-flight portfolio request, so size the pool to expected request concurrency.
+SUMMARY_MAX_WORKERS = max(1, int(os.getenv("PORTFOLIO_SUMMARY_WORKERS", "8")))
+_SUMMARY_POOL = ThreadPoolExecutor(max_workers=SUMMARY_MAX_WORKERS, thread_name_prefix="portfolio-summary")
+# Headroom past GEMINI_PORTFOLIO_TIMEOUT before the summary join gives up and the response goes out without it.
+SUMMARY_JOIN_SLACK_S = 2.0
+
+
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
 
 def _truthy(value: str | None, default: bool = False) -> bool:
     if value is None:
         return default
-    return value.lower() in ("1", "true", "yes", "on")
+    return value.lower() in _TRUTHY_VALUES
 
 
-def _classify_holding(h: dict) -> dict:
-    symbol = (h.get("symbol") or "").upper()
-    sector = (h.get("sector") or "").upper()
-    asset_class = (h.get("asset_class") or "").upper()
+@lru_cache(maxsize=512)
+def _classify_fields(symbol: str, sector: str, asset_class: str) -> tuple[str, str | None, bool, bool]:
+    symbol = symbol.upper()
+    sector = sector.upper()
+    asset_class = asset_class.upper()
     is_precious = symbol in PRECIOUS_METAL_SYMBOLS or sector in PRECIOUS_METAL_SECTORS
     is_crypto = asset_class == "CRYPTO" or sector == "CRYPTO"
+    return asset_class or "UNKNOWN", sector or None, bool(is_precious), bool(is_crypto)
+
+
+def _classify_holding(h: dict) -> dict:
+    asset_class, sector, is_precious, is_crypto = _classify_fields(
+        h.get("symbol") or "", h.get("sector") or "", h.get("asset_class") or ""
+    )
     return {
-        "asset_class": asset_class or "UNKNOWN",
-        "sector": sector or None,
-        "is_precious_metal": bool(is_precious),
-        "is_crypto": bool(is_crypto),
+        "asset_class": asset_class,
+        "sector": sector,
+        "is_precious_metal": is_precious,
+        "is_crypto": is_crypto,
     }
 
 
@@ -118,38 +159,92 @@ def _to_tsi(iso: str | None) -> str | None:
     return dt.astimezone(timezone(timedelta(hours=3))).isoformat()
 
 
+_NON_TOKEN_RE = re.compile(r"[^a-z0-9\s$]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def normalize(text: str) -> str:
     text = text.translate(TR_MAP).lower()
-    text = re.sub(r"[^a-z0-9\s$]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _NON_TOKEN_RE.sub(" ", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     return text
 
 
-def recency_weight(ts: str | None) -> float:
+_RECENCY_STEPS = (
+    (timedelta(hours=1), 1.0),
+    (timedelta(hours=6), 0.7),
+    (timedelta(hours=24), 0.4),
+)
+
+
+def recency_weight(ts: str | None, now: datetime | None = None) -> float:
     if not ts:
         return 0.2
     try:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(ts[:-1] + "+00:00" if ts.endswith("Z") else ts)
     except Exception:
         return 0.2
-    hours = (datetime.now(timezone.utc) - dt).total_seconds() / 3600.0
-    if hours <= 1:
-        return 1.0
-    if hours <= 6:
-        return 0.7
-    if hours <= 24:
-        return 0.4
+    age = (now or datetime.now(timezone.utc)) - dt
+    for max_age, weight in _RECENCY_STEPS:
+        if age <= max_age:
+            return weight
     return 0.2
 
 
+_ALIAS_CACHE: dict[tuple[str, int], dict] = {}
+
+
 def load_aliases() -> dict:
-    if ALIASES_PATH.exists():
+    try:
+        stat = ALIASES_PATH.stat()
+    except OSError:
+        stat = None
+    if stat is not None:
+        key = (str(ALIASES_PATH), stat.st_mtime_ns)
+        cached = _ALIAS_CACHE.get(key)
+        if cached is not None:
+            return cached
         try:
-            return json.loads(ALIASES_PATH.read_text(encoding="utf-8"))
+            raw = ALIASES_PATH.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
         except Exception:
-            pass
+            data = None
+        if data is not None:
+            _compile_alias_map(data)
+            data["_version"] = key
+            _ALIAS_CACHE.clear()
+            with _NEWS_IMPACT_LOCK:
+                _NEWS_IMPACT_CACHE.clear()
+            _ALIAS_CACHE[key] = data
+            return data
     return {"symbols": {}, "fx": {"USDTRY": "USDTRY=X"}}
 
+
+def _compile_alias_map(data: dict) -> dict:
+    """Precompute alias-match lookup fields in place, so matching never re-normalizes aliases per news item."""
+    # A recompiled map may have new content; only load_aliases stamps a _version, after compiling.
+    data.pop("_version", None)
+    for entry in (data.get("symbols") or {}).values():
+        entry["_norm_aliases"] = tuple(normalize(a) for a in entry.get("aliases", []))
+    data["_sector_symbols"] = _sector_symbol_pairs(data)
+    data["_holding_meta"] = {sym: _holding_meta_row(sym, entry) for sym, entry in (data.get("symbols") or {}).items()}
+    return data
+
+
+def _holding_meta_row(symbol: str, data: dict) -> tuple[str, str, str, str | None]:
+    return data.get("yahoo", symbol), data.get("currency", "USD"), data.get("asset_class", "UNKNOWN"), data.get("sector")
+
+
+def _holding_meta(alias_map: dict, symbol: str) -> tuple[str, str, str, str | None]:
+    """(yahoo_symbol, currency, asset_class, sector) for a holding, from the table load_aliases prebuilds."""
+    table = alias_map.get("_holding_meta")
+    row = table.get(symbol) if table is not None else None
+    if row is None:
+        row = _holding_meta_row(symbol, (alias_map.get("symbols") or _EMPTY).get(symbol) or _EMPTY)
+    return row
+
+
 def _get_app_state(db, key: str) -> str | None:
     row = db.fetchone("SELECT value FROM app_state WHERE key = ?", (key,))
     if not row:
@@ -181,17 +276,15 @@ def load_portfolio_holdings(db, seed_defaults: bool = True) -> list[dict]:
 
 
 def upsert_portfolio_holding(db, symbol: str, qty: float) -> None:
+    upsert_portfolio_holdings_bulk(db, [(symbol, qty)])
+
+
+def upsert_portfolio_holdings_bulk(db, items: list[tuple[str, float]]) -> None:
     now = datetime.now(timezone.utc).isoformat()
-    existing = db.fetchone("SELECT symbol FROM portfolio_holdings WHERE symbol = ?", (symbol,))
-    if existing:
-        db.execute(
-            "UPDATE portfolio_holdings SET qty = ?, updated_at = ? WHERE symbol = ?",
-            (qty, now, symbol),
-        )
-        return
-    db.execute(
-        "INSERT INTO portfolio_holdings (symbol, qty, created_at, updated_at) VALUES (?, ?, ?, ?)",
-        (symbol, qty, now, now),
+    db.executemany(
+        "INSERT INTO portfolio_holdings (symbol, qty, created_at, updated_at) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (symbol) DO UPDATE SET qty = excluded.qty, updated_at = excluded.updated_at",
+        [(symbol, float(qty), now, now) for symbol, qty in items],
     )
 
 
@@ -202,6 +295,7 @@ def remove_portfolio_holding(db, symbol: str) -> None:
 def _build_portfolio_watchlist(alias_map: dict, holdings: list[dict]) -> list[str]:
     terms: list[str] = []
     seen: set[str] = set()
+    symbols_map = alias_map.get("symbols") or _EMPTY
     for holding in holdings:
         symbol = holding.get("symbol")
         if not symbol:
@@ -209,7 +303,7 @@ def _build_portfolio_watchlist(alias_map: dict, holdings: list[dict]) -> list[st
         if symbol not in seen:
             terms.append(symbol)
             seen.add(symbol)
-        aliases = alias_map.get("symbols", {}).get(symbol, {}).get("aliases", [])
+        aliases = (symbols_map.get(symbol) or _EMPTY).get("aliases", ())
         added = 0
         for alias in aliases:
             if not alias:
@@ -234,60 +328,112 @@ def _build_portfolio_watchlist(alias_map: dict, holdings: list[dict]) -> list[st
     return terms
 
 
-def _token_set_ratio(a: str, b: str) -> float:
-    tokens_a = set(re.findall(r"\w+", a))
-    tokens_b = set(re.findall(r"\w+", b))
+def _norm_tokens(text: str) -> list[str]:
+    # Inputs are normalize()d ([a-z0-9 $], single spaces), so splitting on
+    # spaces and "$" yields exactly the \w+ tokens without a regex pass.
+    return text.replace("$", " ").split()
+
+
+@lru_cache(maxsize=4096)
+def _fuzzy_alias_tokens(alias: str) -> frozenset[str] | None:
+    """Token set of a normalized alias, or None for single-token aliases (never fuzzy-matched)."""
+    if len(alias.split()) < 2:
+        return None
+    return frozenset(_norm_tokens(alias))
+
+
+def _token_set_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    return _token_set_ratio_tokens(frozenset(_norm_tokens(a)), frozenset(_norm_tokens(b)), score_cutoff)
+
+
+def _token_set_ratio_tokens(
+    tokens_a: frozenset[str], tokens_b: frozenset[str], score_cutoff: float = 0.0
+) -> float:
     if not tokens_a or not tokens_b:
         return 0.0
     intersect = " ".join(sorted(tokens_a & tokens_b))
-    combined_a = " ".join(sorted(tokens_a))
-    combined_b = " ".join(sorted(tokens_b))
-    ra = difflib_ratio(intersect, combined_a)
-    rb = difflib_ratio(intersect, combined_b)
-    return max(ra, rb)
+    best = 0.0
+    for combined in (" ".join(sorted(tokens_a)), " ".join(sorted(tokens_b))):
+        # At most len(intersect) characters can match, so 2*I/(I+X) bounds the ratio from above.
+        if 2.0 * len(intersect) / (len(intersect) + len(combined)) < score_cutoff:
+            continue
+        best = max(best, difflib_ratio(intersect, combined, score_cutoff))
+    return best
 
 
-def difflib_ratio(a: str, b: str) -> float:
+def difflib_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """SequenceMatcher-style similarity in [0, 1]; scores below score_cutoff report 0.0."""
+    if _rapidfuzz_ratio is not None:
+        # Same 2*M/T similarity as difflib for these token strings, computed in C with early exit.
+        return _rapidfuzz_ratio(a, b, score_cutoff=score_cutoff * 100.0) / 100.0
     import difflib
 
-    return difflib.SequenceMatcher(None, a, b).ratio()
+    score = difflib.SequenceMatcher(None, a, b).ratio()
+    return score if score >= score_cutoff else 0.0
+
+
+_NEAR_TICKER_PATTERNS = (
+    (re.compile(r"\bnear protocol\b"), "near protocol"),
+    (re.compile(r"\bnearprotocol\b"), "nearprotocol"),
+    (re.compile(r"\bNEAR\b"), "NEAR"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _ticker_patterns(symbol: str) -> tuple[re.Pattern, re.Pattern]:
+    """Case-insensitive ``$SYMBOL`` and bare ``SYMBOL`` word patterns, compiled once per symbol."""
+    escaped = re.escape(symbol)
+    return (
+        re.compile(rf"\${escaped}\b", re.IGNORECASE),
+        re.compile(rf"\b{escaped}\b", re.IGNORECASE),
+    )
 
 
 def _direct_ticker_match(text: str, symbol: str) -> tuple[bool, str | None]:
+    if symbol == "NEAR":
+        for pattern, phrase in _NEAR_TICKER_PATTERNS:
+            if pattern.search(text):
+                return True, phrase
+        return False, None
+    cashtag_re, word_re = _ticker_patterns(symbol)
     if symbol in SHORT_TICKERS:
-        text_lower = text.lower()
-        if re.search(rf"\${symbol}\b", text, flags=re.IGNORECASE):
+        if cashtag_re.search(text):
             return True, f"${symbol}"
-        if re.search(rf"\b{symbol}\b", text, flags=re.IGNORECASE):
+        if word_re.search(text):
+            text_lower = text.lower()
             if any(ctx in text_lower for ctx in SHORT_TICKER_CONTEXT):
                 return True, symbol
         return False, None
-    if symbol == "NEAR":
-        if re.search(r"\bnear protocol\b", text):
-            return True, "near protocol"
-        if re.search(r"\bnearprotocol\b", text):
-            return True, "nearprotocol"
-        if re.search(r"\bNEAR\b", text):
-            return True, "NEAR"
-        return False, None
-    if re.search(rf"\b{re.escape(symbol)}\b", text, flags=re.IGNORECASE):
+    if word_re.search(text):
         return True, symbol
     return False, None
 
 
+def _normalized_fields(item: NewsItem) -> tuple[str, tuple[str, ...]]:
+    title = item.title or ""
+    entities = tuple(item.entities or ())
+    cached = item._norm_cache
+    if cached is not None and cached[0] == title and cached[1] == entities:
+        return cached[2], cached[3]
+    norm_title = normalize(title)
+    norm_entities = tuple(normalize(e) for e in entities)
+    item._norm_cache = (title, entities, norm_title, norm_entities)
+    return norm_title, norm_entities
+
+
 def match_news_item(item: NewsItem, alias_map: dict) -> tuple[list[dict], dict]:
     title = item.title or ""
     url = item.url or ""
-    entities = item.entities or []
-    norm_title = normalize(title)
-    norm_entities = [normalize(e) for e in entities]
+    norm_title, norm_entities = _normalized_fields(item)
+    title_tokens: frozenset[str] | None = None
 
     matches: list[dict] = []
     debug_counts = {"direct": 0, "entity": 0, "title": 0, "fuzzy": 0, "sector": 0, "guarded": 0}
 
-    for symbol, data in alias_map.get("symbols", {}).items():
-        aliases = data.get("aliases", [])
-        norm_aliases = [normalize(a) for a in aliases]
+    for symbol, data in (alias_map.get("symbols") or _EMPTY).items():
+        norm_aliases = data.get("_norm_aliases")
+        if norm_aliases is None:
+            norm_aliases = [normalize(a) for a in data.get("aliases", [])]
         matched = False
         # Direct ticker match (title/url)
         direct, phrase = _direct_ticker_match(f"{title} {url}", symbol)
@@ -310,11 +456,12 @@ def match_news_item(item: NewsItem, alias_map: dict) -> tuple[list[dict], dict]:
 
         # Title alias match
         if not matched:
+            short_ticker = symbol in SHORT_TICKERS
             for alias in norm_aliases:
+                # Guard short tickers before paying for the substring scan.
+                if short_ticker and len(alias) <= 2:
+                    continue
                 if alias and alias in norm_title:
-                    # Guard short tickers
-                    if symbol in SHORT_TICKERS and len(alias) <= 2:
-                        continue
                     if symbol == "NEAR" and alias == "near" and "near protocol" not in norm_title:
                         continue
                     matches.append({"symbol": symbol, "method": "title", "score": 0.7, "matched_phrase": alias})
@@ -322,12 +469,18 @@ def match_news_item(item: NewsItem, alias_map: dict) -> tuple[list[dict], dict]:
                     matched = True
                     break
 
-        # Fuzzy match
-        if not matched:
+        # Fuzzy match; skipped once the fuzzy guard below is certain to drop it anyway.
+        if not matched and len(matches) - debug_counts["fuzzy"] < 4:
             for alias in norm_aliases:
-                if len(alias.split()) < 2:
+                alias_tokens = _fuzzy_alias_tokens(alias)
+                if alias_tokens is None:
                     continue
-                ratio = _token_set_ratio(alias, norm_title)
+                # Cheap anchor: with no shared token the intersection is empty and the ratio is 0.
+                if title_tokens is None:
+                    title_tokens = frozenset(_norm_tokens(norm_title))
+                if title_tokens.isdisjoint(alias_tokens):
+                    continue
+                ratio = _token_set_ratio_tokens(alias_tokens, title_tokens, score_cutoff=0.88)
                 if ratio >= 0.88:
                     matches.append({"symbol": symbol, "method": "fuzzy", "score": 0.6, "matched_phrase": alias})
                     debug_counts["fuzzy"] += 1
@@ -343,54 +496,122 @@ def match_news_item(item: NewsItem, alias_map: dict) -> tuple[list[dict], dict]:
     return matches, debug_counts
 
 
+def _sector_symbol_pairs(alias_map: dict) -> tuple[tuple[str, str], ...]:
+    pairs = alias_map.get("_sector_symbols")
+    if pairs is None:
+        pairs = tuple(
+            (symbol, data["sector"]) for symbol, data in (alias_map.get("symbols") or _EMPTY).items() if data.get("sector")
+        )
+    return pairs
+
+
 def sector_match(item: NewsItem, alias_map: dict) -> list[dict]:
     matches = []
     impacts = item.sector_impacts or []
     if not impacts:
         return matches
-    for symbol, data in alias_map.get("symbols", {}).items():
-        sector = data.get("sector")
-        if not sector:
-            continue
-        for imp in impacts:
-            imp_sector = imp.get("sector") if isinstance(imp, dict) else getattr(imp, "sector", None)
-            if imp_sector == sector:
-                matches.append({
-                    "symbol": symbol,
-                    "method": "sector",
-                    "score": 0.4,
-                    "matched_phrase": sector,
-                })
+    impact_sectors = Counter(
+        imp.get("sector") if isinstance(imp, dict) else getattr(imp, "sector", None) for imp in impacts
+    )
+    for symbol, sector in _sector_symbol_pairs(alias_map):
+        for _ in range(impact_sectors.get(sector, 0)):
+            matches.append({
+                "symbol": symbol,
+                "method": "sector",
+                "score": 0.4,
+                "matched_phrase": sector,
+            })
     return matches
 
 
-def news_direction(item: NewsItem, flow_score: float | None, risk_flags: list[str]) -> float:
-    weights = {
-        "regülasyon_baskısı": -1.0,
-        "regülasyon/hukuk": -1.0,
-        "regulasyon_baskisi": -1.0,
-        "regulasyon/hukuk": -1.0,
-        "risk_primi": -0.8,
-        "büyüme": 0.8,
-        "arz_zinciri": -0.4,
-    }
+_CHANNEL_DIRECTION_WEIGHTS = {
+    "regülasyon_baskısı": -1.0,
+    "regülasyon/hukuk": -1.0,
+    "regulasyon_baskisi": -1.0,
+    "regulasyon/hukuk": -1.0,
+    "risk_primi": -0.8,
+    "büyüme": 0.8,
+    "arz_zinciri": -0.4,
+}
+
+
+def _risk_regime(risk_flags: list[str] | None) -> tuple[bool, bool]:
+    flags = risk_flags or []
+    return any("RISK_OFF" in f for f in flags), any("RISK_ON" in f for f in flags)
+
+
+def news_direction(
+    item: NewsItem,
+    flow_score: float | None,
+    risk_flags: list[str],
+    risk_regime: tuple[bool, bool] | None = None,
+) -> float:
     dir_score = 0.0
     channels = item.impact_channel or []
     for ch in channels:
-        dir_score += weights.get(ch, 0.0)
+        dir_score += _CHANNEL_DIRECTION_WEIGHTS.get(ch, 0.0)
     if "likidite" in channels:
         if flow_score is not None:
             if flow_score >= 60:
                 dir_score += 0.5
             elif flow_score <= 40:
                 dir_score -= 0.5
-    if any("RISK_OFF" in f for f in risk_flags or []):
+    risk_off, risk_on = risk_regime if risk_regime is not None else _risk_regime(risk_flags)
+    if risk_off:
         dir_score -= 0.2
-    if any("RISK_ON" in f for f in risk_flags or []):
+    if risk_on:
         dir_score += 0.2
     return max(-1.0, min(1.0, dir_score))
 
 
+NEWS_IMPACT_CACHE_TTL_S = 60
+_NEWS_IMPACT_CACHE: TTLCache = TTLCache(maxsize=32, ttl=NEWS_IMPACT_CACHE_TTL_S)
+_NEWS_IMPACT_LOCK = Lock()
+
+
+# Added to directly matched items; left out of the memo key so already-tagged items still hit.
+_PORTFOLIO_MATCH_TAGS = frozenset({"PORTFOLIO_SYMBOL_MATCH", "PORTFOLIO_NEWS"})
+
+
+def _news_impact_item_id(item: NewsItem) -> tuple:
+    # Every field the impact computation reads, without serializing the whole model.
+    return (
+        item.url,
+        item.title,
+        item.publishedAtISO,
+        item.event_type,
+        item.relevance_score,
+        item.score,
+        item.quality_score,
+        tuple(item.entities or ()),
+        tuple(item.impact_channel or ()),
+        tuple(t for t in (item.tags or ()) if t not in _PORTFOLIO_MATCH_TAGS),
+        tuple(
+            imp.get("sector") if isinstance(imp, dict) else getattr(imp, "sector", None)
+            for imp in (item.sector_impacts or ())
+        ),
+    )
+
+
+def _tag_portfolio_match(item: NewsItem) -> None:
+    tags = {t for t in (item.tags or []) if t}
+    tags.update(_PORTFOLIO_MATCH_TAGS)
+    item.tags = sorted(tags)
+
+
+def _copy_impact_row(row: dict) -> dict:
+    out = dict(row)
+    out["impact_channel"] = list(row["impact_channel"])
+    out["matchedSymbols"] = list(row["matchedSymbols"])
+    out["match_debug"] = [dict(m) for m in row["match_debug"]]
+    out["impact_by_symbol"] = dict(row["impact_by_symbol"])
+    out["impact_by_symbol_direct"] = dict(row["impact_by_symbol_direct"])
+    out["impact_by_symbol_indirect"] = dict(row["impact_by_symbol_indirect"])
+    if row["evidence"] is not None:
+        out["evidence"] = dict(row["evidence"])
+    return out
+
+
 def compute_news_impact(
     items: list[NewsItem],
     alias_map: dict,
@@ -398,11 +619,69 @@ def compute_news_impact(
     risk_flags: list[str],
     event_points: list[dict] | None,
 ) -> tuple[list[dict], dict]:
+    # Repeat requests inside the news cache window see the same items; reuse the match output.
+    # Only alias maps from load_aliases carry a _version, so ad-hoc maps always recompute. The memo keys on
+    # _version alone: never change an alias map in place while keeping its _version.
+    version = alias_map.get("_version")
+    if version is None:
+        output, matches_summary, tagged = _compute_news_impact(items, alias_map, flow_score, risk_flags, event_points)
+        for idx in tagged:
+            _tag_portfolio_match(items[idx])
+        return output, matches_summary
+    key = (
+        version,
+        tuple(_news_impact_item_id(item) for item in items),
+        flow_score,
+        tuple(sorted(set(risk_flags or ()))),
+        json.dumps(event_points, sort_keys=True, default=str) if event_points else None,
+        os.getenv("LOCAL_BIST_IMPACT_BOOST"),
+    )
+    with _NEWS_IMPACT_LOCK:
+        cached = _NEWS_IMPACT_CACHE.get(key)
+    if cached is None:
+        cached = _compute_news_impact(items, alias_map, flow_score, risk_flags, event_points)
+        with _NEWS_IMPACT_LOCK:
+            _NEWS_IMPACT_CACHE[key] = cached
+    output, matches_summary, tagged = cached
+    # The tag side effect belongs to the caller's items, so it runs on hits as well as misses.
+    for idx in tagged:
+        _tag_portfolio_match(items[idx])
+    return [_copy_impact_row(row) for row in output], dict(matches_summary)
+
+
+def _compute_news_impact(
+    items: list[NewsItem],
+    alias_map: dict,
+    flow_score: float | None,
+    risk_flags: list[str],
+    event_points: list[dict] | None,
+) -> tuple[list[dict], dict, tuple[int, ...]]:
     matches_summary = {"direct": 0, "entity": 0, "title": 0, "fuzzy": 0, "sector": 0, "guarded": 0}
     direct_methods = {"direct", "entity", "title", "fuzzy"}
     output = []
     local_bist_boost = float(os.getenv("LOCAL_BIST_IMPACT_BOOST", "1.2") or 1.2)
-    for item in items:
+    symbol_meta = alias_map.get("symbols") or _EMPTY
+    idx_to_symbol = list(symbol_meta.keys())
+    symbol_to_idx = {sym: i for i, sym in enumerate(idx_to_symbol)}
+    n_symbols = len(idx_to_symbol)
+    symbol_is_bist = np.fromiter(
+        (((symbol_meta.get(sym) or _EMPTY).get("asset_class") or "").upper() == "BIST" for sym in idx_to_symbol),
+        dtype=bool,
+        count=n_symbols,
+    )
+    now_utc = datetime.now(timezone.utc)
+    risk_regime = _risk_regime(risk_flags)
+    # Flat (structure-of-arrays) match records across all items, aggregated after the loop.
+    item_factor: list[float] = []
+    item_local_global: list[bool] = []
+    m_rows: list[int] = []
+    m_cols: list[int] = []
+    m_scores: list[float] = []
+    m_direct: list[bool] = []
+    m_sector: list[bool] = []
+    # Indices of items with a direct symbol match; the caller tags them.
+    tagged: list[int] = []
+    for item_idx, item in enumerate(items):
         matches, counts = match_news_item(item, alias_map)
         for k in matches_summary:
             matches_summary[k] += counts.get(k, 0)
@@ -414,23 +693,19 @@ def compute_news_impact(
         if not matches:
             continue
 
-        direct_symbols = {m.get("symbol") for m in matches if m.get("method") in direct_methods}
-        if direct_symbols:
-            tags = {t for t in (item.tags or []) if t}
-            tags.add("PORTFOLIO_SYMBOL_MATCH")
-            tags.add("PORTFOLIO_NEWS")
-            item.tags = sorted(tags)
+        if any(m.get("method") in direct_methods for m in matches):
+            tagged.append(item_idx)
 
         w_base = (item.relevance_score or item.score or 0) / 100.0
         w_base *= (item.quality_score or 0) / 100.0
-        w = w_base * recency_weight(item.publishedAtISO)
+        w = w_base * recency_weight(item.publishedAtISO, now_utc)
         if item.tags and "LOCAL_GLOBAL_MATCH" in item.tags:
             w *= 1.15
         low_signal = item.event_type == "OTHER" and not (item.impact_channel or [])
         if low_signal:
             w *= 0.25
 
-        dir_score = news_direction(item, flow_score, risk_flags)
+        dir_score = news_direction(item, flow_score, risk_flags, risk_regime)
         direction = "neutral"
         if dir_score > 0.05:
             direction = "positive"
@@ -439,24 +714,6 @@ def compute_news_impact(
 
         local_global = bool(item.tags and "LOCAL_GLOBAL_MATCH" in item.tags)
 
-        impact_per_symbol = {}
-        impact_per_symbol_direct = {}
-        impact_per_symbol_indirect = {}
-        for m in matches:
-            impact_per_symbol.setdefault(m["symbol"], 0.0)
-            impact = w * dir_score * m["score"]
-            if local_global:
-                sym_meta = (alias_map.get("symbols", {}) or {}).get(m["symbol"], {})
-                if (sym_meta.get("asset_class") or "").upper() == "BIST":
-                    impact *= local_bist_boost
-            impact_per_symbol[m["symbol"]] += impact
-            if m["method"] in direct_methods:
-                impact_per_symbol_direct.setdefault(m["symbol"], 0.0)
-                impact_per_symbol_direct[m["symbol"]] += impact
-            elif m["method"] == "sector":
-                impact_per_symbol_indirect.setdefault(m["symbol"], 0.0)
-                impact_per_symbol_indirect[m["symbol"]] += impact
-
         evidence = None
         if event_points:
             for ev in event_points:
@@ -468,6 +725,17 @@ def compute_news_impact(
                     }
                     break
 
+        row = len(output)
+        item_factor.append(w * dir_score)
+        item_local_global.append(local_global)
+        for m in matches:
+            method = m["method"]
+            m_rows.append(row)
+            m_cols.append(symbol_to_idx[m["symbol"]])
+            m_scores.append(m["score"])
+            m_direct.append(method in direct_methods)
+            m_sector.append(method == "sector")
+
         output.append(
             {
                 "title": item.title,
@@ -475,20 +743,58 @@ def compute_news_impact(
                 "publishedAtISO": item.publishedAtISO,
                 "event_type": item.event_type,
                 "impact_channel": item.impact_channel or [],
-                "matchedSymbols": sorted(impact_per_symbol.keys()),
+                "matchedSymbols": [],
                 "match_debug": matches,
-                "impactScore": sum(impact_per_symbol.values()),
+                "impactScore": 0.0,
                 "direction": direction,
                 "low_signal": low_signal,
-                "impact_by_symbol": impact_per_symbol,
-                "impact_by_symbol_direct": impact_per_symbol_direct,
-                "impact_by_symbol_indirect": impact_per_symbol_indirect,
+                "impact_by_symbol": {},
+                "impact_by_symbol_direct": {},
+                "impact_by_symbol_indirect": {},
                 "evidence": evidence,
                 "local_global_match": local_global,
             }
         )
 
-    return output, matches_summary
+    if not m_rows:
+        return output, matches_summary, tuple(tagged)
+
+    # Aggregate every (item, symbol) pair in one pass over flat match arrays.
+    rows = np.asarray(m_rows, dtype=np.intp)
+    cols = np.asarray(m_cols, dtype=np.intp)
+    direct_mask = np.asarray(m_direct, dtype=bool)
+    sector_mask = np.asarray(m_sector, dtype=bool)
+    impacts = np.asarray(item_factor, dtype=np.float64)[rows] * np.asarray(m_scores, dtype=np.float64)
+    boosted = np.asarray(item_local_global, dtype=bool)[rows] & symbol_is_bist[cols]
+    impacts[boosted] *= local_bist_boost
+    pair_keys, pair_idx = np.unique(rows * n_symbols + cols, return_inverse=True)
+    n_pairs = len(pair_keys)
+    pair_rows, pair_cols = np.divmod(pair_keys, n_symbols)
+    pair_rows = pair_rows.tolist()
+    pair_syms = [idx_to_symbol[col] for col in pair_cols.tolist()]
+    # Each dict is filled in first-match order, as the per-match accumulation did; presence comes from
+    # the matches themselves so zero-impact matches still register.
+    for field, mask in (
+        ("impact_by_symbol", None),
+        ("impact_by_symbol_direct", direct_mask),
+        ("impact_by_symbol_indirect", sector_mask),
+    ):
+        idx = pair_idx if mask is None else pair_idx[mask]
+        totals = np.bincount(idx, weights=impacts if mask is None else impacts[mask], minlength=n_pairs).tolist()
+        for j in _first_seen_order(idx):
+            output[pair_rows[j]][field][pair_syms[j]] = totals[j]
+    for out in output:
+        impact_per_symbol = out["impact_by_symbol"]
+        out["matchedSymbols"] = sorted(impact_per_symbol.keys())
+        out["impactScore"] = sum(impact_per_symbol.values())
+
+    return output, matches_summary, tuple(tagged)
+
+
+def _first_seen_order(ids: np.ndarray) -> list[int]:
+    """Distinct values of ids in order of first appearance."""
+    uniq, first = np.unique(ids, return_index=True)
+    return uniq[np.argsort(first, kind="stable")].tolist()
 
 
 def build_related_news(
@@ -574,16 +880,14 @@ SECTOR_KEYWORD_HINTS: dict[str, tuple[str, ...]] = {
 }
 
 
-def _theme_tags_from_title(title: str) -> list[str]:
+@lru_cache(maxsize=2048)
+def _theme_tags_from_title(title: str) -> tuple[str, ...]:
     norm = normalize(title)
-    tags: list[str] = []
-    for tag, patterns in LOCAL_THEME_PATTERNS.items():
-        if any(p in norm for p in patterns):
-            tags.append(tag)
-    return tags
+    return tuple(tag for tag, patterns in LOCAL_THEME_PATTERNS.items() if any(p in norm for p in patterns))
 
 
-def _sector_hints_from_title(title: str, portfolio_sectors: set[str]) -> set[str]:
+@lru_cache(maxsize=2048)
+def _sector_hints_from_title(title: str, portfolio_sectors: frozenset[str]) -> frozenset[str]:
     norm = normalize(title)
     hits: set[str] = set()
     for sector in portfolio_sectors:
@@ -592,29 +896,33 @@ def _sector_hints_from_title(title: str, portfolio_sectors: set[str]) -> set[str
         patterns = SECTOR_KEYWORD_HINTS.get(sector)
         if patterns and any(p in norm for p in patterns):
             hits.add(sector)
-    return hits
+    return frozenset(hits)
 
 
 def build_local_headlines_for_llm(local_news: list[NewsItem], alias_map: dict, holdings: list[dict]) -> list[dict]:
     portfolio_symbols = {(h.get("symbol") or "").upper() for h in holdings if h.get("symbol")}
     holding_sector_map = {(h.get("symbol") or "").upper(): (h.get("sector") or "").upper() for h in holdings if h.get("symbol")}
     holding_class_map = {(h.get("symbol") or "").upper(): (h.get("asset_class") or "").upper() for h in holdings if h.get("symbol")}
-    symbol_meta = alias_map.get("symbols", {}) or {}
+    symbol_meta = alias_map.get("symbols") or _EMPTY
     symbol_to_sector: dict[str, str] = {}
     symbol_to_class: dict[str, str] = {}
     for sym in portfolio_symbols:
-        meta = symbol_meta.get(sym) or {}
+        meta = symbol_meta.get(sym) or _EMPTY
         symbol_to_sector[sym] = ((meta.get("sector") or holding_sector_map.get(sym) or "")).upper()
         symbol_to_class[sym] = ((meta.get("asset_class") or holding_class_map.get(sym) or "")).upper()
-    portfolio_sector_pool = {sec for sec in symbol_to_sector.values() if sec}
+    portfolio_sector_pool = frozenset(sec for sec in symbol_to_sector.values() if sec)
     portfolio_bist_sectors = sorted({symbol_to_sector.get(sym, "") for sym in portfolio_symbols if symbol_to_class.get(sym) == "BIST" and symbol_to_sector.get(sym, "")})
 
-    rows: list[dict] = []
+    keyed_rows: list[tuple[tuple[int, int, int], dict]] = []
     for item in local_news:
         matches, _ = match_news_item(item, alias_map)
         matched_symbols = sorted({m.get("symbol") for m in matches if (m.get("symbol") or "").upper() in portfolio_symbols})
-        matched_sectors = sorted({symbol_to_sector.get(sym, "") for sym in matched_symbols if symbol_to_sector.get(sym, "")})
-        matched_sectors = sorted(set(matched_sectors).union(_sector_hints_from_title(item.title or "", portfolio_sector_pool)))
+        sector_set = set(_sector_hints_from_title(item.title or "", portfolio_sector_pool))
+        for sym in matched_symbols:
+            sector = symbol_to_sector.get(sym, "")
+            if sector:
+                sector_set.add(sector)
+        matched_sectors = sorted(sector_set)
         tags: set[str] = {t for t in (item.tags or []) if t}
         tags.add("LOCAL_TR_HEADLINE")
         if item.source in {"ekonomim.com", "dunya.com", "paraanaliz.com"}:
@@ -644,28 +952,22 @@ def build_local_headlines_for_llm(local_news: list[NewsItem], alias_map: dict, h
             relevance_hint += 1
 
         item.tags = sorted(tags)
-        rows.append(
-            {
-                "title": item.title,
-                "source": item.source,
-                "publishedAtISO": item.publishedAtISO,
-                "url": item.url,
-                "tags": item.tags,
-                "portfolioSymbols": matched_symbols[:6],
-                "portfolioSectors": matched_sectors[:4],
-                "relevanceHint": relevance_hint,
-            }
-        )
+        row_symbols = matched_symbols[:6]
+        row_sectors = matched_sectors[:4]
+        row = {
+            "title": item.title,
+            "source": item.source,
+            "publishedAtISO": item.publishedAtISO,
+            "url": item.url,
+            "tags": item.tags,
+            "portfolioSymbols": row_symbols,
+            "portfolioSectors": row_sectors,
+            "relevanceHint": relevance_hint,
+        }
+        keyed_rows.append(((relevance_hint, len(row_symbols), len(row_sectors)), row))
 
-    rows.sort(
-        key=lambda r: (
-            int(r.get("relevanceHint") or 0),
-            len(r.get("portfolioSymbols") or []),
-            len(r.get("portfolioSectors") or []),
-        ),
-        reverse=True,
-    )
-    return rows
+    keyed_rows.sort(key=itemgetter(0), reverse=True)
+    return [row for _, row in keyed_rows]
 
 
 def fetch_price(symbol: str) -> tuple[float | None, str, str | None]:
@@ -673,7 +975,40 @@ def fetch_price(symbol: str) -> tuple[float | None, str, str | None]:
     result = router.get_quote(symbol)
     if result.ok and result.data and result.data.price:
         return float(result.data.price), "quote_router", result.data.currency
-    # Fallback to Yahoo chart last close (useful for symbols not resolved by quote router)
+    return _chart_price(symbol)
+
+
+def fetch_price_batch(symbols: list[str]) -> dict[str, tuple[float | None, str, str | None]]:
+    """Batched fetch_price: one router pass for all symbols, chart fallback only for the misses."""
+    results: dict[str, tuple[float | None, str, str | None]] = {}
+    misses: list[str] = []
+    try:
+        routed = get_quote_router().get_quotes(symbols)
+    except Exception:
+        routed = {}
+    for symbol in symbols:
+        result = routed.get(symbol)
+        if result is not None and result.ok and result.data and result.data.price:
+            results[symbol] = (float(result.data.price), "quote_router", result.data.currency)
+        else:
+            misses.append(symbol)
+    if misses:
+        for symbol, price in zip(misses, _QUOTE_POOL.map(_chart_price, misses)):
+            results[symbol] = price
+    return results
+
+
+def _fetch_price_or_missing(symbol: str) -> tuple[float | None, str, str | None]:
+    try:
+        return fetch_price(symbol)
+    except Exception:
+        return None, "missing", None
+
+
+def _chart_price(symbol: str) -> tuple[float | None, str, str | None]:
+    # Fallback to Yahoo chart last close (useful for symbols not resolved by quote router).
+    # Deliberately uncached and small: a price must be current and fit the 4s budget, unlike the
+    # 6mo history that fetch_daily_history shares through _fetch_chart_cached.
     try:
         chart = _fetch_chart(symbol, "5d", "1d", 4.0)
         if chart:
@@ -687,17 +1022,151 @@ def fetch_price(symbol: str) -> tuple[float | None, str, str | None]:
     return None, "missing", None
 
 
-def fetch_daily_history(symbol: str, timeout: float = 6.0) -> list[float]:
+PRICE_FETCH_MAX_WORKERS = max(1, int(os.getenv("PORTFOLIO_PRICE_FETCH_WORKERS", "16")))
+# Shared by the chart-price fallback and history fan-out so requests don't spin up threads each time.
+_QUOTE_POOL = ThreadPoolExecutor(max_workers=PRICE_FETCH_MAX_WORKERS, thread_name_prefix="portfolio-quote")
+PRICE_CACHE_TTL_S = 30
+FX_CACHE_TTL_S = 60
+
+
+def _cached_price(cache, symbol: str) -> tuple[float | None, str, str | None] | None:
+    if cache is None:
+        return None
+    try:
+        cached = cache.get(cache_key("price", symbol))
+    except Exception:
+        return None
+    if not cached:
+        return None
+    price, source, currency = cached
+    return float(price), source, currency
+
+
+def fetch_prices(
+    symbols: list[str],
+    cache=None,
+    ttl_seconds: int = PRICE_CACHE_TTL_S,
+    ttl_overrides: dict[str, int] | None = None,
+) -> dict[str, tuple[float | None, str, str | None]]:
+    unique = list(dict.fromkeys(s for s in symbols if s))
+    results: dict[str, tuple[float | None, str, str | None]] = {}
+    pending: list[str] = []
+    for symbol in unique:
+        cached = _cached_price(cache, symbol)
+        if cached is not None:
+            results[symbol] = cached
+        else:
+            pending.append(symbol)
+    if not pending:
+        return results
+    try:
+        fetched = fetch_price_batch(pending)
+    except Exception:
+        fetched = {}
+    unresolved = [symbol for symbol in pending if symbol not in fetched]
+    if unresolved:
+        # The batch path failed outright; go symbol by symbol so one bad stage can't blank every holding.
+        for symbol, price in zip(unresolved, _QUOTE_POOL.map(_fetch_price_or_missing, unresolved)):
+            fetched[symbol] = price
+    for symbol in pending:
+        results[symbol] = fetched.get(symbol) or (None, "missing", None)
+    if cache is not None:
+        overrides = ttl_overrides or {}
+        for symbol in pending:
+            price, source, currency = results[symbol]
+            if price is None:
+                continue
+            try:
+                cache.set(cache_key("price", symbol), [price, source, currency], overrides.get(symbol, ttl_seconds))
+            except Exception:
+                pass
+    return results
+
+
+_HISTORY_CACHE: TTLCache = TTLCache(maxsize=256, ttl=CHART_CACHE_TTL_S)
+_HISTORY_CACHE_LOCK = Lock()
+
+
+def fetch_daily_history(symbol: str, timeout: float = 6.0) -> np.ndarray:
+    with _HISTORY_CACHE_LOCK:
+        cached = _HISTORY_CACHE.get(symbol)
+    if cached is not None:
+        return cached
     try:
-        result = _fetch_chart(symbol, "6mo", "1d", timeout)
+        result = _fetch_chart_cached(symbol, "6mo", "1d", timeout)
         if not result:
-            return []
+            return np.empty(0)
         df = result.get("df")
         if df is None or df.empty:
-            return []
-        return [float(v) for v in df["Close"].dropna().tolist()]
+            return np.empty(0)
+        closes = df["Close"].dropna().to_numpy(dtype=np.float64)
     except Exception:
-        return []
+        return np.empty(0)
+    # Shared between callers for the cache lifetime, so hand out a read-only array.
+    closes.flags.writeable = False
+    with _HISTORY_CACHE_LOCK:
+        _HISTORY_CACHE[symbol] = closes
+    return closes
+
+
+def fetch_histories(symbols: list[str]) -> dict[str, np.ndarray]:
+    unique = list(dict.fromkeys(s for s in symbols if s))
+    if not unique:
+        return {}
+    # Chart fetches are network-bound, so overlap them like the price fan-out.
+    return dict(zip(unique, _QUOTE_POOL.map(fetch_daily_history, unique)))
+
+
+_RISK_STATS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=CHART_CACHE_TTL_S)
+_RISK_STATS_LOCK = Lock()
+
+
+def _ret_from_hist(closes: np.ndarray, days: int) -> float | None:
+    if closes.size <= days:
+        return None
+    last = float(closes[-1])
+    prev = float(closes[-1 - days])
+    if prev == 0:
+        return None
+    return (last - prev) / prev
+
+
+def _symbol_risk_stats(closes: np.ndarray) -> dict | None:
+    if closes.size < 10:
+        return None
+    prev = closes[:-1]
+    nonzero = prev != 0
+    rets = (closes[1:][nonzero] - prev[nonzero]) / prev[nonzero]
+    if rets.size < 5:
+        return None
+    eps = 1e-9
+    vol = float(rets[-30:].std())
+    stats = {
+        "vol_30d": vol,
+        "ret_1d": _ret_from_hist(closes, 1),
+        "ret_7d": _ret_from_hist(closes, 7),
+        "ret_30d": _ret_from_hist(closes, 30),
+        "mom_z_7d": None,
+        "mom_z_30d": None,
+    }
+    if stats["ret_7d"] is not None:
+        stats["mom_z_7d"] = max(-3.0, min(3.0, stats["ret_7d"] / (max(vol, eps) * math.sqrt(7))))
+    if stats["ret_30d"] is not None:
+        stats["mom_z_30d"] = max(-3.0, min(3.0, stats["ret_30d"] / (max(vol, eps) * math.sqrt(30))))
+    return stats
+
+
+def _cached_risk_stats(symbol: str, closes: np.ndarray) -> dict | None:
+    # fetch_daily_history hands back the same memoized array until the chart TTL lapses, so stats
+    # derived from it can be reused across requests while that exact array is still current.
+    with _RISK_STATS_LOCK:
+        cached = _RISK_STATS_CACHE.get(symbol)
+    if cached is not None and cached[0] is closes:
+        return cached[1]
+    stats = _symbol_risk_stats(closes)
+    with _RISK_STATS_LOCK:
+        _RISK_STATS_CACHE[symbol] = (closes, stats)
+    return stats
 
 
 def compute_risk_metrics(holdings: list[dict], prices: dict, settings: PortfolioSettings) -> tuple[dict, list[str]]:
@@ -705,48 +1174,17 @@ def compute_risk_metrics(holdings: list[dict], prices: dict, settings: Portfolio
     weights = [h.get("weight", 0.0) for h in holdings]
     hhi = sum(w * w for w in weights)
     max_weight = max(weights) if weights else 0.0
-    eps = 1e-9
-
-    vols = []
-    def _ret_from_hist(hist: list[float], days: int) -> float | None:
-        if len(hist) <= days:
-            return None
-        last = hist[-1]
-        prev = hist[-1 - days]
-        if prev == 0:
-            return None
-        return (last - prev) / prev
 
+    histories = fetch_histories([h["yahoo_symbol"] for h in holdings])
     for h in holdings:
-        sym = h["symbol"]
-        hist = fetch_daily_history(h["yahoo_symbol"])
-        if len(hist) < 10:
-            missing.append(sym)
+        closes = histories.get(h["yahoo_symbol"])
+        if not isinstance(closes, np.ndarray):
+            closes = np.asarray(closes if closes is not None else (), dtype=np.float64)
+        stats = _cached_risk_stats(h["yahoo_symbol"], closes)
+        if stats is None:
+            missing.append(h["symbol"])
             continue
-        rets = []
-        for i in range(1, len(hist)):
-            if hist[i - 1] == 0:
-                continue
-            rets.append((hist[i] - hist[i - 1]) / hist[i - 1])
-        if len(rets) < 5:
-            missing.append(sym)
-            continue
-        vol = float(np.std(rets[-30:])) if len(rets) >= 30 else float(np.std(rets))
-        vols.append(vol)
-        h["vol_30d"] = vol
-        h["ret_1d"] = _ret_from_hist(hist, 1)
-        h["ret_7d"] = _ret_from_hist(hist, 7)
-        h["ret_30d"] = _ret_from_hist(hist, 30)
-        if h.get("ret_7d") is not None:
-            mom_z_7d = h["ret_7d"] / (max(vol, eps) * math.sqrt(7))
-            h["mom_z_7d"] = max(-3.0, min(3.0, mom_z_7d))
-        else:
-            h["mom_z_7d"] = None
-        if h.get("ret_30d") is not None:
-            mom_z_30d = h["ret_30d"] / (max(vol, eps) * math.sqrt(30))
-            h["mom_z_30d"] = max(-3.0, min(3.0, mom_z_30d))
-        else:
-            h["mom_z_30d"] = None
+        h.update(stats)
 
     weight_sum = sum(weights)
     if weight_sum > 0:
@@ -773,6 +1211,41 @@ def compute_fx_risk(allocation: dict, threshold: float = 0.50) -> tuple[float, f
     return usd_exposure, fx_risk_proxy, usd_exposure >= threshold
 
 
+# Breakdown field, coefficient key and sign for each optimizer feature column, in feature order.
+_SCORE_TERMS = (
+    ("mom", "a", 1.0),
+    ("news_direct", "b", 1.0),
+    ("news_indirect", "b2", 1.0),
+    ("news_pricing", "p", 1.0),
+    ("regime", "c", 1.0),
+    ("sector_rotation", "s", 1.0),
+    ("vol", "d", -1.0),
+    ("concentration", "e", -1.0),
+    ("fx_risk", "f", -1.0),
+    ("tcost", "g", -1.0),
+)
+_BREAKDOWN_FIELDS = tuple(field for field, _, _ in _SCORE_TERMS)
+
+
+def _stable_desc(idx: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    # Descending by score, ties by original index: same order as a stable sort with reverse=True.
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _top_k_desc(idx: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    if len(idx) > k:
+        kth = np.partition(scores[idx], len(idx) - k)[len(idx) - k]
+        idx = idx[scores[idx] >= kth]
+    return _stable_desc(idx, scores)[:k]
+
+
+def _bottom_k_desc(idx: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    if len(idx) > k:
+        kth = np.partition(scores[idx], k - 1)[k - 1]
+        idx = idx[scores[idx] <= kth]
+    return _stable_desc(idx, scores)[-k:]
+
+
 def build_optimizer(
     holdings: list[dict],
     news_impact: dict,
@@ -808,83 +1281,78 @@ def build_optimizer(
     ]
     tcost_by_class = {"BIST": 0.0015, "NASDAQ": 0.0005, "CRYPTO": 0.0010}
 
-    def _clamp(val: float, lo: float = -1.0, hi: float = 1.0) -> float:
-        return max(lo, min(hi, val))
+    if hold_gate:
+        return [
+            {
+                "period": period,
+                "actions": [],
+                "status": "hold",
+                "notes": [hold_reason],
+                "turnover_cap": turnover_cap,
+                "mode": "HOLD",
+                "hold_reason": hold_reason,
+            }
+            for period, turnover_cap in periods
+        ]
 
     results = []
     risk_off = any("RISK_OFF" in f for f in risk_flags or [])
-    for period, turnover_cap in periods:
-        if hold_gate:
-            results.append(
-                {
-                    "period": period,
-                    "actions": [],
-                    "status": "hold",
-                    "notes": [hold_reason],
-                    "turnover_cap": turnover_cap,
-                    "mode": "HOLD",
-                    "hold_reason": hold_reason,
-                }
-            )
-            continue
-        cset = coeffs.get(period, coeffs["daily"])
-        scored = []
-        for h in holdings:
-            mom_raw = h.get("mom_z_7d")
-            mom = _clamp((mom_raw or 0.0) / 3.0)
-            news_dir = _clamp(news_direct.get(h["symbol"], 0.0))
-            news_ind = _clamp(news_indirect.get(h["symbol"], 0.0))
-            news_px = _clamp((news_pricing or {}).get(h["symbol"], 0.0))
-            regime = -0.3 if risk_off and h["asset_class"] == "CRYPTO" else 0.1
-            regime = _clamp(regime)
-            sector_rotation = 0.0
-            vol = h.get("vol_30d", 0.0) or 0.0
-            vol_norm = _clamp(vol / 0.10, 0.0, 1.0)
-            concentration = h.get("weight", 0.0) ** 2
-            max_w = settings.max_weight or 0.30
-            conc_norm = _clamp(concentration / (max_w * max_w), 0.0, 1.0)
-            fx_penalty = fx_risk_proxy if h.get("currency") == "USD" else 0.0
-            fx_penalty = _clamp(fx_penalty, 0.0, 1.0)
-            tcost = tcost_by_class.get(h.get("asset_class"), 0.0010)
-            tcost_norm = _clamp(tcost / 0.002, 0.0, 1.0)
-
-            score = (
-                cset["a"] * mom
-                + cset["b"] * news_dir
-                + cset["b2"] * news_ind
-                + cset["p"] * news_px
-                + cset["c"] * regime
-                + cset["s"] * sector_rotation
-                - cset["d"] * vol_norm
-                - cset["e"] * conc_norm
-                - cset["f"] * fx_penalty
-                - cset["g"] * tcost_norm
-            )
-            breakdown = {
-                "mom": mom,
-                "news_direct": news_dir,
-                "news_indirect": news_ind,
-                "news_pricing": news_px,
-                "regime": regime,
-                "sector_rotation": sector_rotation,
-                "vol": vol_norm,
-                "concentration": conc_norm,
-                "fx_risk": fx_penalty,
-                "tcost": tcost_norm,
-                "total": score,
-            }
-            scored.append((score, h, breakdown))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        increases = [s for s in scored if s[0] > 0][:3]
-        decreases = [s for s in scored if s[0] < 0][-3:]
+
+    # Per-holding features do not depend on the period, so build them once as arrays.
+    n = len(holdings)
+    symbols = [h["symbol"] for h in holdings]
+    pricing = news_pricing or {}
+    is_crypto = np.fromiter((h["asset_class"] == "CRYPTO" for h in holdings), dtype=bool, count=n)
+    is_usd = np.fromiter((h.get("currency") == "USD" for h in holdings), dtype=bool, count=n)
+    mom_arr = np.fromiter(((h.get("mom_z_7d") or 0.0) for h in holdings), dtype=np.float64, count=n)
+    vol_arr = np.fromiter(((h.get("vol_30d", 0.0) or 0.0) for h in holdings), dtype=np.float64, count=n)
+    weight_arr = np.fromiter((h.get("weight", 0.0) for h in holdings), dtype=np.float64, count=n)
+    tcost_arr = np.fromiter(
+        (tcost_by_class.get(h.get("asset_class"), 0.0010) for h in holdings), dtype=np.float64, count=n
+    )
+    mom = np.clip(mom_arr / 3.0, -1.0, 1.0)
+    news_dir = np.clip(np.fromiter((news_direct.get(s, 0.0) for s in symbols), dtype=np.float64, count=n), -1.0, 1.0)
+    news_ind = np.clip(np.fromiter((news_indirect.get(s, 0.0) for s in symbols), dtype=np.float64, count=n), -1.0, 1.0)
+    news_px = np.clip(np.fromiter((pricing.get(s, 0.0) for s in symbols), dtype=np.float64, count=n), -1.0, 1.0)
+    regime = np.where(is_crypto, -0.3, 0.1) if risk_off else np.full(n, 0.1)
+    sector_rotation = np.zeros(n)
+    vol_norm = np.clip(vol_arr / 0.10, 0.0, 1.0)
+    max_w = settings.max_weight or 0.30
+    conc_norm = np.clip(weight_arr**2 / (max_w * max_w), 0.0, 1.0)
+    fx_penalty = np.where(is_usd, min(1.0, max(0.0, fx_risk_proxy)), 0.0)
+    tcost_norm = np.clip(tcost_arr / 0.002, 0.0, 1.0)
+
+    # Score every period in one pass: (holdings x features) @ (features x periods).
+    features = np.column_stack(
+        (mom, news_dir, news_ind, news_px, regime, sector_rotation, vol_norm, conc_norm, fx_penalty, tcost_norm)
+    )
+    coeff_matrix = np.array(
+        [
+            [sign * coeffs.get(period, coeffs["daily"])[key] for period, _ in periods]
+            for _, key, sign in _SCORE_TERMS
+        ]
+    )
+
+    def _breakdown(i: int, score: float) -> dict:
+        breakdown = dict(zip(_BREAKDOWN_FIELDS, features[i].tolist()))
+        breakdown["total"] = score
+        return breakdown
+    period_scores = features @ coeff_matrix
+    base_crypto_weight = float(weight_arr[is_crypto].sum())
+
+    for col, (period, turnover_cap) in enumerate(periods):
+        score_arr = period_scores[:, col]
+        top_idx = _top_k_desc(np.flatnonzero(score_arr > 0), score_arr, 3)
+        bottom_idx = _bottom_k_desc(np.flatnonzero(score_arr < 0), score_arr, 3)
         actions = []
         delta = min(turnover_cap / 2.0, 0.03)
-        for score, h, breakdown in increases:
+        for i in top_idx:
+            score = float(score_arr[i])
+            h = holdings[i]
             if h["weight"] + delta > settings.max_weight:
                 continue
-            if h["asset_class"] == "CRYPTO":
-                crypto_weight = sum(x["weight"] for x in holdings if x["asset_class"] == "CRYPTO")
-                if crypto_weight + delta > settings.max_crypto_weight:
+            if is_crypto[i]:
+                if base_crypto_weight + delta > settings.max_crypto_weight:
                     continue
             actions.append(
                 {
@@ -896,10 +1364,12 @@ def build_optimizer(
                         f"newsImpact={round(news_impact.get(h['symbol'],0.0),3)}",
                     ],
                     "confidence": int(60 + min(30, abs(score) * 100)),
-                    "score_breakdown": breakdown,
+                    "score_breakdown": _breakdown(i, score),
                 }
             )
-        for score, h, breakdown in decreases:
+        for i in bottom_idx:
+            score = float(score_arr[i])
+            h = holdings[i]
             actions.append(
                 {
                     "symbol": h["symbol"],
@@ -910,7 +1380,7 @@ def build_optimizer(
                         f"newsImpact={round(news_impact.get(h['symbol'],0.0),3)}",
                     ],
                     "confidence": int(60 + min(30, abs(score) * 100)),
-                    "score_breakdown": breakdown,
+                    "score_breakdown": _breakdown(i, score),
                 }
             )
         results.append(
@@ -926,7 +1396,14 @@ def build_optimizer(
     return results
 
 
-def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "24h") -> dict:
+def build_portfolio(
+    pipeline,
+    base_currency: str = "TRY",
+    news_horizon: str = "24h",
+    include_debug: bool | None = None,
+) -> dict:
+    if include_debug is None:
+        include_debug = _truthy(os.getenv("PORTFOLIO_DEBUG_NOTES"), default=True)
     alias_map = load_aliases()
     settings = PortfolioSettings()
     start = time.time()
@@ -934,6 +1411,10 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
     portfolio_terms = _build_portfolio_watchlist(alias_map, holdings_seed)
     watchlist_terms = sorted(set(portfolio_terms))
     wl_key = ",".join(watchlist_terms)
+    news_key_primary = cache_key("news", news_horizon, wl_key)
+    news_key_all = cache_key("news", news_horizon, "all")
+    local_key_primary = cache_key("news_local", news_horizon, wl_key)
+    local_key_all = cache_key("news_local", news_horizon, "all")
 
     # News/flow/risk: prefer cached news to avoid slow pipeline on portfolio requests
     top_news: list[NewsItem] = []
@@ -952,8 +1433,8 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
     if getattr(pipeline, "cache", None) is not None:
         cached = None
         keys = [
-            ("primary", cache_key("news", news_horizon, wl_key)),
-            ("all", cache_key("news", news_horizon, "all")),
+            ("primary", news_key_primary),
+            ("all", news_key_all),
             ("empty", cache_key("news", news_horizon, "")),
         ]
         for name, key in keys:
@@ -967,13 +1448,13 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                 cache_hit = name
                 break
         if cached:
-            top_news = [NewsItem(**n) for n in cached]
+            top_news = NEWS_ITEM_LIST.validate_python(cached)
             used_cache = True
 
-    if not used_cache and os.getenv("PORTFOLIO_PIPELINE_ENABLED", "false").lower() in ("1", "true", "yes", "on"):
+    if not used_cache and _truthy(os.getenv("PORTFOLIO_PIPELINE_ENABLED"), default=False):
         pipeline_error = None
-        use_fast_mode = os.getenv("PORTFOLIO_NEWS_FAST_MODE", "true").lower() in ("1", "true", "yes", "on")
-        fast_long_only = os.getenv("PORTFOLIO_NEWS_FAST_LONG_ONLY", "true").lower() in ("1", "true", "yes", "on")
+        use_fast_mode = _truthy(os.getenv("PORTFOLIO_NEWS_FAST_MODE"), default=True)
+        fast_long_only = _truthy(os.getenv("PORTFOLIO_NEWS_FAST_LONG_ONLY"), default=True)
         use_fast = use_fast_mode and (news_horizon.endswith("d") or not fast_long_only)
         if use_fast:
             try:
@@ -985,7 +1466,9 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                 news_watchlist = watchlist_terms[:watchlist_cap] if watchlist_cap > 0 else watchlist_terms
                 rank_weights = getattr(getattr(pipeline, "settings", None), "news_rank_weights", None)
                 total_timeout = float(os.getenv("PORTFOLIO_NEWS_TOTAL_TIMEOUT", "20"))
-                news_ex = ThreadPoolExecutor(max_workers=1)
+                # Per-request executor: a fetch still running after the timeout only holds its own thread,
+                # never a worker that later requests would queue behind.
+                news_ex = ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio-news")
                 future = news_ex.submit(
                     fetch_news,
                     "",
@@ -1003,7 +1486,14 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                     notes = []
                     used_span = news_horizon
                     fallback_notes = ["portfolio_news_fallback=timeout"]
-                    fh = fetch_finnhub_company_news(news_watchlist, news_horizon, min(timeout, 6))
+                    # Fetch both fallbacks together (own pool, so they don't queue behind the stuck primary).
+                    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="portfolio-news-fallback") as fallback_ex:
+                        fh_future = fallback_ex.submit(fetch_finnhub_company_news, news_watchlist, news_horizon, min(timeout, 6))
+                        rss_future = fallback_ex.submit(
+                            fetch_rss, " ".join(news_watchlist[:6]) or "markets", maxrecords, min(timeout, 6), news_horizon
+                        )
+                        fh = fh_future.result()
+                        rss = rss_future.result()
                     fallback_items: list[NewsItem] = []
                     if fh.ok and fh.data:
                         fallback_items.extend(normalize_finnhub(fh.data))
@@ -1011,7 +1501,6 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                     else:
                         fallback_notes.append("portfolio_news_fallback=finnhub_empty")
                     if not fallback_items:
-                        rss = fetch_rss(" ".join(news_watchlist[:6]) or "markets", maxrecords, min(timeout, 6), news_horizon)
                         if rss.ok and rss.data:
                             fallback_items.extend(normalize_rss(rss.data))
                             fallback_notes.append("portfolio_news_fallback=rss")
@@ -1031,18 +1520,20 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                     news_ex.shutdown(wait=False, cancel_futures=True)
                 if getattr(pipeline, "cache", None) is not None:
                     try:
-                        pipeline.cache.set(cache_key("news", news_horizon, wl_key), [n.model_dump() for n in top_news], 90)
-                        pipeline.cache.set(cache_key("news", news_horizon, "all"), [n.model_dump() for n in top_news], 90)
+                        dumped = NEWS_ITEM_LIST.dump_python(top_news)
+                        pipeline.cache.set(news_key_primary, dumped, 90)
+                        pipeline.cache.set(news_key_all, dumped, 90)
                     except Exception:
                         pass
                 used_pipeline = True
-                news_debug_notes = [
-                    "portfolio_news_fast_mode=true",
-                    f"portfolio_news_fast_span={used_span}",
-                    f"portfolio_news_fast_timeout={timeout}",
-                    f"portfolio_news_fast_total_timeout={total_timeout}",
-                    f"portfolio_news_fast_watchlist_cap={watchlist_cap}",
-                ]
+                if include_debug:
+                    news_debug_notes = [
+                        "portfolio_news_fast_mode=true",
+                        f"portfolio_news_fast_span={used_span}",
+                        f"portfolio_news_fast_timeout={timeout}",
+                        f"portfolio_news_fast_total_timeout={total_timeout}",
+                        f"portfolio_news_fast_watchlist_cap={watchlist_cap}",
+                    ]
             except Exception as exc:
                 cache_hit = "miss"
                 used_pipeline = False
@@ -1063,8 +1554,9 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                     event_points = []
                 if getattr(pipeline, "cache", None) is not None:
                     try:
-                        pipeline.cache.set(cache_key("news", news_horizon, wl_key), [n.model_dump() for n in top_news], 90)
-                        pipeline.cache.set(cache_key("news", news_horizon, "all"), [n.model_dump() for n in top_news], 90)
+                        dumped = NEWS_ITEM_LIST.dump_python(top_news)
+                        pipeline.cache.set(news_key_primary, dumped, 90)
+                        pipeline.cache.set(news_key_all, dumped, 90)
                     except Exception:
                         pass
                 used_pipeline = True
@@ -1083,8 +1575,8 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
     if getattr(pipeline, "cache", None) is not None:
         local_cached = None
         local_keys = [
-            ("primary", cache_key("news_local", news_horizon, wl_key)),
-            ("all", cache_key("news_local", news_horizon, "all")),
+            ("primary", local_key_primary),
+            ("all", local_key_all),
         ]
         for name, key in local_keys:
             if not key:
@@ -1097,15 +1589,15 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                 local_cache_hit = name
                 break
         if local_cached:
-            local_news = [NewsItem(**n) for n in local_cached]
+            local_news = NEWS_ITEM_LIST.validate_python(local_cached)
             local_used_cache = True
 
-    if not local_used_cache and os.getenv("PORTFOLIO_LOCAL_NEWS_ENABLED", "true").lower() in ("1", "true", "yes", "on"):
+    if not local_used_cache and _truthy(os.getenv("PORTFOLIO_LOCAL_NEWS_ENABLED"), default=True):
         try:
             local_max = int(os.getenv("PORTFOLIO_LOCAL_NEWS_MAX", "24") or 24)
             local_timeout = float(os.getenv("PORTFOLIO_LOCAL_NEWS_TIMEOUT", "4") or 4)
             local_total_timeout = float(os.getenv("PORTFOLIO_LOCAL_NEWS_TOTAL_TIMEOUT", "12") or 12)
-            local_ex = ThreadPoolExecutor(max_workers=1)
+            local_ex = ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio-local-news")
             future = local_ex.submit(collect_local_news, watchlist_terms, news_horizon, local_max, local_timeout)
             try:
                 local_news, local_notes, local_counts = future.result(timeout=local_total_timeout)
@@ -1118,66 +1610,53 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                 local_ex.shutdown(wait=False, cancel_futures=True)
             if local_notes:
                 local_news_debug_notes.extend(local_notes)
-            if local_counts:
+            if local_counts and include_debug:
                 local_news_debug_notes.append(f"portfolio_local_news_tr={local_counts.get('tr', 0)}")
                 local_news_debug_notes.append(f"portfolio_local_news_tr_scrape={local_counts.get('tr_scrape', 0)}")
             if getattr(pipeline, "cache", None) is not None:
                 try:
-                    pipeline.cache.set(
-                        cache_key("news_local", news_horizon, wl_key),
-                        [n.model_dump() for n in local_news],
-                        300,
-                    )
-                    pipeline.cache.set(
-                        cache_key("news_local", news_horizon, "all"),
-                        [n.model_dump() for n in local_news],
-                        300,
-                    )
+                    dumped = NEWS_ITEM_LIST.dump_python(local_news)
+                    pipeline.cache.set(local_key_primary, dumped, 300)
+                    pipeline.cache.set(local_key_all, dumped, 300)
                 except Exception:
                     pass
         except Exception as exc:
             local_news = []
             local_news_debug_notes.append(f"portfolio_local_news_error={type(exc).__name__}")
 
-    fx_symbol = alias_map.get("fx", {}).get("USDTRY", "USDTRY=X")
-    fx_price, fx_source, _ = fetch_price(fx_symbol)
+    fx_symbol = (alias_map.get("fx") or _EMPTY).get("USDTRY", "USDTRY=X")
+    # FX rides in the same fan-out as the holdings so its round trip overlaps theirs.
+    holding_meta = [_holding_meta(alias_map, h["symbol"]) for h in holdings_seed]
+    price_results = fetch_prices(
+        [fx_symbol] + [meta[0] for meta in holding_meta],
+        getattr(pipeline, "cache", None),
+        ttl_overrides={fx_symbol: FX_CACHE_TTL_S},
+    )
+    fx_price, fx_source, _ = price_results.get(fx_symbol, (None, "missing", None))
     fx_rate = fx_price or 0.0
     fx_status = "ok" if fx_rate else "missing"
+    # (base_currency, holding currency) -> multiplier into the base; same-currency pairs default to 1.0.
+    fx_multipliers = {
+        ("TRY", "USD"): fx_rate,
+        ("USD", "TRY"): 1.0 / fx_rate if fx_rate else 0.0,
+    }
 
     holdings = []
+    n_holdings = len(holdings_seed)
+    prices_arr = np.zeros(n_holdings)
+    qtys_arr = np.zeros(n_holdings)
+    fx_arr = np.ones(n_holdings)
     missing_prices = []
-    total_value = 0.0
-    price_results: dict[str, tuple[float | None, str, str | None]] = {}
-    with ThreadPoolExecutor(max_workers=6) as ex:
-        futures = {}
-        for h in holdings_seed:
-            symbol = h["symbol"]
-            data = alias_map.get("symbols", {}).get(symbol, {})
-            yahoo_symbol = data.get("yahoo", symbol)
-            futures[ex.submit(fetch_price, yahoo_symbol)] = yahoo_symbol
-        for fut in as_completed(futures):
-            yahoo_symbol = futures[fut]
-            try:
-                price_results[yahoo_symbol] = fut.result()
-            except Exception:
-                price_results[yahoo_symbol] = (None, "missing", None)
 
-    for h in holdings_seed:
+    for i, (h, (yahoo_symbol, currency, asset_class, sector)) in enumerate(zip(holdings_seed, holding_meta)):
         symbol = h["symbol"]
-        data = alias_map.get("symbols", {}).get(symbol, {})
-        yahoo_symbol = data.get("yahoo", symbol)
-        currency = data.get("currency", "USD")
         price, price_source, quote_ccy = price_results.get(yahoo_symbol, (None, "missing", None))
         if price is None:
             missing_prices.append(symbol)
             price = 0.0
-        if base_currency == "TRY" and currency == "USD":
-            mkt_value = price * h["qty"] * (fx_rate or 0.0)
-        elif base_currency == "USD" and currency == "TRY":
-            mkt_value = price * h["qty"] / (fx_rate or 0.0) if fx_rate else 0.0
-        else:
-            mkt_value = price * h["qty"]
-        total_value += mkt_value
+        prices_arr[i] = price
+        qtys_arr[i] = h["qty"]
+        fx_arr[i] = fx_multipliers.get((base_currency, currency), 1.0)
         holdings.append(
             {
                 "symbol": symbol,
@@ -1185,23 +1664,28 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                 "price": price,
                 "currency": currency,
                 "yahoo_symbol": yahoo_symbol,
-                "asset_class": data.get("asset_class", "UNKNOWN"),
-                "sector": data.get("sector"),
-                "mkt_value_base": mkt_value,
+                "asset_class": asset_class,
+                "sector": sector,
+                "mkt_value_base": 0.0,
                 "data_status": "missing" if price_source == "missing" else "ok",
             }
         )
 
-    for h in holdings:
-        h["weight"] = (h["mkt_value_base"] / total_value) if total_value else 0.0
-
+    values_arr = prices_arr * qtys_arr * fx_arr
+    total_value = float(values_arr.sum())
+    weights = values_arr / total_value if total_value else np.zeros_like(values_arr)
+    by_asset_class: defaultdict[str, float] = defaultdict(float)
+    by_currency: defaultdict[str, float] = defaultdict(float)
+    # Per-holding value/weight are filled from the vectorized arrays once, after all prices are known.
+    for h, mkt_value, weight in zip(holdings, values_arr.tolist(), weights.tolist()):
+        h["mkt_value_base"] = mkt_value
+        h["weight"] = weight
+        by_asset_class[h["asset_class"]] += weight
+        by_currency[h["currency"]] += weight
     allocation = {
-        "by_asset_class": {},
-        "by_currency": {},
+        "by_asset_class": dict(by_asset_class),
+        "by_currency": dict(by_currency),
     }
-    for h in holdings:
-        allocation["by_asset_class"][h["asset_class"]] = allocation["by_asset_class"].get(h["asset_class"], 0.0) + h["weight"]
-        allocation["by_currency"][h["currency"]] = allocation["by_currency"].get(h["currency"], 0.0) + h["weight"]
 
     risk, missing_vol = compute_risk_metrics(holdings, {}, settings)
 
@@ -1213,34 +1697,27 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
         risk_flags.append("FX_RISK_UP")
 
     news_items, match_summary = compute_news_impact(top_news, alias_map, flow_score, risk_flags, event_points)
-    asset_news = {}
-    asset_news_direct = {}
-    asset_news_indirect = {}
+    asset_news_acc: defaultdict[str, float] = defaultdict(float)
+    asset_news_direct_acc: defaultdict[str, float] = defaultdict(float)
+    asset_news_indirect_acc: defaultdict[str, float] = defaultdict(float)
     low_signal_count = 0
     for n in news_items:
-        if n.get("low_signal"):
-            low_signal_count += 1
-        for sym, score in n.get("impact_by_symbol", {}).items():
-            asset_news[sym] = asset_news.get(sym, 0.0) + score
-        for sym, score in n.get("impact_by_symbol_direct", {}).items():
-            asset_news_direct[sym] = asset_news_direct.get(sym, 0.0) + score
-        for sym, score in n.get("impact_by_symbol_indirect", {}).items():
-            asset_news_indirect[sym] = asset_news_indirect.get(sym, 0.0) + score
+        low_signal_count += bool(n.get("low_signal"))
+        for sym, score in (n.get("impact_by_symbol") or _EMPTY).items():
+            asset_news_acc[sym] += score
+        for sym, score in (n.get("impact_by_symbol_direct") or _EMPTY).items():
+            asset_news_direct_acc[sym] += score
+        for sym, score in (n.get("impact_by_symbol_indirect") or _EMPTY).items():
+            asset_news_indirect_acc[sym] += score
+    asset_news = dict(asset_news_acc)
+    asset_news_direct = dict(asset_news_direct_acc)
+    asset_news_indirect = dict(asset_news_indirect_acc)
 
     related_news = build_related_news(news_items, holdings, per_symbol_limit=4)
     related_news_for_llm = compact_related_news_for_llm(related_news, symbol_limit=8, per_symbol_limit=2)
     news_period = "daily" if news_horizon == "24h" else "weekly" if news_horizon == "7d" else "monthly"
     top_news_limit = 40 if news_period == "monthly" else 20
     local_news_limit = 40 if news_period == "monthly" else 20
-    top_news_brief = [
-        {
-            "title": n.title,
-            "source": n.source,
-            "publishedAtISO": n.publishedAtISO,
-            "url": n.url,
-        }
-        for n in top_news[:top_news_limit]
-    ]
     news_headlines = [
         {
             "title": n.title,
@@ -1250,6 +1727,8 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
         }
         for n in top_news
     ]
+    # The LLM brief is a prefix of the headlines; both views share the same (read-only) rows.
+    top_news_brief = news_headlines[:top_news_limit]
     local_headlines = build_local_headlines_for_llm(local_news, alias_map, holdings)
     local_headlines_brief = local_headlines[:local_news_limit]
     top_titles_sent = len(top_news_brief)
@@ -1260,11 +1739,8 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
     low_signal_ratio = (low_signal_count / max(1, len(news_items))) if news_items else 0.0
     announcement_tracker = build_announcement_tracker(top_news, local_news, holdings, alias_map, news_horizon)
     pricing_model = compute_news_pricing_model(news_items, holdings, announcement_tracker)
-    news_pricing_scores = {
-        str(row.get("symbol") or "").upper(): float(row.get("pressure_score") or 0.0)
-        for row in (pricing_model.get("symbol_pricing") or [])
-        if row.get("symbol")
-    }
+    # symbol_pricing rows carry non-empty, uppercased symbols and float pressure scores.
+    news_pricing_scores = {row["symbol"]: row["pressure_score"] for row in pricing_model.get("symbol_pricing") or ()}
     recs = build_optimizer(
         holdings,
         asset_news,
@@ -1279,71 +1755,20 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
         fx_risk_proxy=fx_risk_proxy,
     )
 
-    mom_z_weighted = 0.0
-    for h in holdings:
-        mom = h.get("mom_z_7d")
-        if mom is None:
-            continue
-        mom_z_weighted += (h.get("weight") or 0.0) * mom
-
-    debug_notes = [
-        f"portfolio_price_source=yahoo",
-        f"portfolio_news_cache={'hit' if used_cache else 'miss'}",
-        f"portfolio_news_cache_hit={cache_hit if used_cache else 'miss'}",
-        f"portfolio_news_watchlist_size={len(watchlist_terms)}",
-        f"portfolio_news_cache_key_primary_len={len(wl_key)}",
-        f"portfolio_local_news_cache={'hit' if local_used_cache else 'miss'}",
-        f"portfolio_local_news_cache_hit={local_cache_hit if local_used_cache else 'miss'}",
-        f"portfolio_local_news_count={len(local_news)}",
-        f"portfolio_pipeline_enabled_env={os.getenv('PORTFOLIO_PIPELINE_ENABLED', '')}",
-        f"portfolio_pipeline_used={used_pipeline}",
-        f"portfolio_news_fetched_total={len(top_news)}",
-        f"gemini_titles_sent_top={top_titles_sent}",
-        f"gemini_titles_sent_local={local_titles_sent}",
-        f"gemini_titles_sent_total={total_titles_sent}",
-        f"portfolio_missing_prices={len(missing_prices)}",
-        f"portfolio_fx_status={fx_status}",
-        f"portfolio_news_matched={len(news_items)}",
-        f"portfolio_upcoming_announcements={len((announcement_tracker.get('portfolio_upcoming') or []))}",
-        f"portfolio_monthly_plan_items={len(((announcement_tracker.get('monthly_plan') or {}).get('items') or []))}",
-        f"portfolio_ceo_statement_signals={len((announcement_tracker.get('sector_ceo_statements') or []))}",
-        f"news_pricing_regime={pricing_model.get('market_regime', 'NEUTRAL')}",
-        f"news_pricing_market_score={pricing_model.get('market_pressure_score', 0.0)}",
-        f"portfolio_news_match_methods={match_summary}",
-        f"portfolio_news_false_positive_guard_hits={match_summary.get('guarded', 0)}",
-        f"portfolio_opt_status=ok" if recs else "portfolio_opt_status=partial",
-        f"coverage_ratio={coverage_ratio:.3f}",
-        f"low_signal_ratio={low_signal_ratio:.3f}",
-        f"fx_usd_exposure={usd_exposure:.3f}",
-        f"portfolio_time_ms={int((time.time()-start)*1000)}",
-    ]
-    if news_debug_notes:
-        debug_notes.extend(news_debug_notes)
-    if local_news_debug_notes:
-        debug_notes.extend(local_news_debug_notes)
-    daily_rec = next((r for r in recs if r.get("period") == "daily"), None)
-    if daily_rec and daily_rec.get("mode") == "HOLD":
-        debug_notes.append("optimizer_hold_gate=true")
-        if daily_rec.get("hold_reason"):
-            debug_notes.append(f"optimizer_hold_reason={daily_rec.get('hold_reason')}")
-    else:
-        debug_notes.append("optimizer_hold_gate=false")
-    effective_turnover_cap = settings.turnover_daily * min(1.0, max(0.3, coverage_ratio))
-    debug_notes.append(f"effective_turnover_cap={effective_turnover_cap:.3f}")
-    if pipeline_error:
-        debug_notes.append(f"portfolio_pipeline_error={pipeline_error}")
-
-    gemini_summary = None
+    # Start the Gemini summary now so its network round trip overlaps with the remaining response assembly.
+    gemini_future = None
     gemini_error = None
+    gemini_timeout = float(os.getenv("GEMINI_PORTFOLIO_TIMEOUT", "8") or 8)
     gemini_enabled = _truthy(os.getenv("ENABLE_GEMINI_PORTFOLIO_SUMMARY"), default=True) and bool(
         os.getenv("GEMINI_API_KEY")
     )
     if gemini_enabled:
         try:
-            top_holdings = sorted(holdings, key=lambda h: h.get("weight", 0.0), reverse=True)[:12]
+            top_holdings = heapq.nlargest(12, holdings, key=lambda h: h.get("weight", 0.0))
+            classified = {h.get("symbol"): _classify_holding(h) for h in holdings}
             classified_holdings = []
             for h in holdings:
-                meta = _classify_holding(h)
+                meta = classified[h.get("symbol")]
                 classified_holdings.append(
                     {
                         "symbol": h.get("symbol"),
@@ -1392,10 +1817,10 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                         "symbol": h.get("symbol"),
                         "weight": h.get("weight"),
                         "mkt_value_base": h.get("mkt_value_base"),
-                        "asset_class": _classify_holding(h).get("asset_class"),
-                        "sector": _classify_holding(h).get("sector"),
-                        "is_precious_metal": _classify_holding(h).get("is_precious_metal"),
-                        "is_crypto": _classify_holding(h).get("is_crypto"),
+                        "asset_class": classified[h.get("symbol")].get("asset_class"),
+                        "sector": classified[h.get("symbol")].get("sector"),
+                        "is_precious_metal": classified[h.get("symbol")].get("is_precious_metal"),
+                        "is_crypto": classified[h.get("symbol")].get("is_crypto"),
                         "currency": h.get("currency"),
                     }
                     for h in top_holdings
@@ -1423,17 +1848,81 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
                     "news_titles_sent_total": total_titles_sent,
                 },
             }
-            timeout = float(os.getenv("GEMINI_PORTFOLIO_TIMEOUT", "8") or 8)
-            gemini_summary, gemini_error = generate_portfolio_summary(payload, timeout=timeout)
+            gemini_future = _SUMMARY_POOL.submit(generate_portfolio_summary, payload, timeout=gemini_timeout)
+        except Exception as exc:
+            gemini_error = type(exc).__name__
+
+    mom_arr = np.array([np.nan if h.get("mom_z_7d") is None else h["mom_z_7d"] for h in holdings], dtype=float)
+    mom_z_weighted = float(np.nansum(weights * mom_arr)) if holdings else 0.0
+
+    debug_notes: list[str] = []
+    if include_debug:
+        debug_notes = [
+            _NOTE_PRICE_SOURCE,
+            f"portfolio_news_cache={'hit' if used_cache else 'miss'}",
+            f"portfolio_news_cache_hit={cache_hit if used_cache else 'miss'}",
+            f"portfolio_news_watchlist_size={len(watchlist_terms)}",
+            f"portfolio_news_cache_key_primary_len={len(wl_key)}",
+            f"portfolio_local_news_cache={'hit' if local_used_cache else 'miss'}",
+            f"portfolio_local_news_cache_hit={local_cache_hit if local_used_cache else 'miss'}",
+            f"portfolio_local_news_count={len(local_news)}",
+            f"portfolio_pipeline_enabled_env={os.getenv('PORTFOLIO_PIPELINE_ENABLED', '')}",
+            f"portfolio_pipeline_used={used_pipeline}",
+            f"portfolio_news_fetched_total={len(top_news)}",
+            f"gemini_titles_sent_top={top_titles_sent}",
+            f"gemini_titles_sent_local={local_titles_sent}",
+            f"gemini_titles_sent_total={total_titles_sent}",
+            f"portfolio_missing_prices={len(missing_prices)}",
+            f"portfolio_fx_status={fx_status}",
+            f"portfolio_news_matched={len(news_items)}",
+            f"portfolio_upcoming_announcements={len((announcement_tracker.get('portfolio_upcoming') or []))}",
+            f"portfolio_monthly_plan_items={len(((announcement_tracker.get('monthly_plan') or {}).get('items') or []))}",
+            f"portfolio_ceo_statement_signals={len((announcement_tracker.get('sector_ceo_statements') or []))}",
+            f"news_pricing_regime={pricing_model.get('market_regime', 'NEUTRAL')}",
+            f"news_pricing_market_score={pricing_model.get('market_pressure_score', 0.0)}",
+            f"portfolio_news_match_methods={match_summary}",
+            f"portfolio_news_false_positive_guard_hits={match_summary.get('guarded', 0)}",
+            _NOTE_OPT_OK if recs else _NOTE_OPT_PARTIAL,
+            f"coverage_ratio={coverage_ratio:.3f}",
+            f"low_signal_ratio={low_signal_ratio:.3f}",
+            f"fx_usd_exposure={usd_exposure:.3f}",
+            f"portfolio_time_ms={int((time.time()-start)*1000)}",
+        ]
+        if news_debug_notes:
+            debug_notes.extend(news_debug_notes)
+        if local_news_debug_notes:
+            debug_notes.extend(local_news_debug_notes)
+        daily_rec = next((r for r in recs if r.get("period") == "daily"), None)
+        if daily_rec and daily_rec.get("mode") == "HOLD":
+            debug_notes.append("optimizer_hold_gate=true")
+            if daily_rec.get("hold_reason"):
+                debug_notes.append(f"optimizer_hold_reason={daily_rec.get('hold_reason')}")
+        else:
+            debug_notes.append("optimizer_hold_gate=false")
+        effective_turnover_cap = settings.turnover_daily * min(1.0, max(0.3, coverage_ratio))
+        debug_notes.append(f"effective_turnover_cap={effective_turnover_cap:.3f}")
+        if pipeline_error:
+            debug_notes.append(f"portfolio_pipeline_error={pipeline_error}")
+
+    gemini_summary = None
+    if gemini_future is not None:
+        try:
+            gemini_summary, gemini_error = gemini_future.result(timeout=gemini_timeout + SUMMARY_JOIN_SLACK_S)
             if gemini_summary:
                 if gemini_error:
                     debug_notes.append(f"gemini_portfolio_fallback={gemini_error}")
-                debug_notes.append("gemini_portfolio_summary=ok")
+                debug_notes.append(_NOTE_GEMINI_OK)
             elif gemini_error:
                 debug_notes.append(f"gemini_portfolio_error={gemini_error}")
+        except FuturesTimeoutError:
+            gemini_future.cancel()
+            gemini_error = "timeout"
+            debug_notes.append("gemini_portfolio_error=timeout")
         except Exception as exc:
             gemini_error = type(exc).__name__
             debug_notes.append(f"gemini_portfolio_exception={gemini_error}")
+    elif gemini_error:
+        debug_notes.append(f"gemini_portfolio_exception={gemini_error}")
 
     summary_error = ""
     if gemini_summary and gemini_error:
@@ -1484,5 +1973,5 @@ def build_portfolio(pipeline, base_currency: str = "TRY", news_horizon: str = "2
         },
         "recommendations": recs,
         "optimizer_inputs": {"mom_z_weighted": mom_z_weighted},
-        "debug_notes": debug_notes,
+        "debug_notes": debug_notes if include_debug else [],
     }
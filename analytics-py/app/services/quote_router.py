@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import atexit
+import heapq
+import importlib.util
 import logging
+import math
 import os
+import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
+from threading import Event, Lock
 from typing import Any, Callable
 
 import httpx
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 from app.infra.cache import now_iso
 from app.providers.base import ProviderResult
 
@@ -19,6 +32,22 @@ logger = logging.getLogger("quote_router")
 STALE_AFTER_S = 6 * 60 * 60
 NEGATIVE_CACHE_TTL_S = 45 * 60
 LAST_GOOD_TTL_S = 120
+LAST_GOOD_TTL_MIN_S = 30
+# last_good is only a degraded fallback, so stretching it saves no provider calls; keep hot symbols near the base.
+LAST_GOOD_TTL_MAX_S = 180
+ACCESS_WINDOW_S = 15 * 60
+# Headroom on top of the owner's worst case (one HTTP timeout per enabled provider) for in-flight waiters.
+IN_FLIGHT_WAIT_SLACK_S = 1.0
+# Transport and upstream-capacity failures: provider backoff, never the per-symbol negative cache.
+PROVIDER_ERROR_CODES = frozenset({"http_429", "http_5xx", "network_error"})
+
+_PROVIDER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="quote-provider")
+HTTP_TIMEOUT_S = 4.0
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# HTTP/2 lets concurrent batches to one host share a connection; httpx needs the optional h2 package for it.
+HTTP2_ENABLED = os.getenv("QUOTE_HTTP2", "true").strip().lower() in {"1", "true", "yes", "on"} and (
+    importlib.util.find_spec("h2") is not None
+)
 
 
 @dataclass
@@ -28,6 +57,8 @@ class Quote:
     ts_utc: str
     currency: str | None
     meta: dict[str, Any]
+    # Epoch seconds behind ts_utc when the provider reports one, so freshness checks skip ISO parsing.
+    ts_epoch: float | None = None
 
 
 class TokenBucket:
@@ -37,50 +68,85 @@ class TokenBucket:
         self.tokens = float(capacity)
         self.last_ts = now_fn()
         self.now_fn = now_fn
+        self._lock = Lock()
 
     def take(self, amount: float = 1.0) -> bool:
-        now = self.now_fn()
-        elapsed = max(0.0, now - self.last_ts)
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_s)
-        self.last_ts = now
-        if self.tokens < amount:
-            return False
-        self.tokens -= amount
-        return True
+        # The router (and its buckets) is a process-wide singleton shared by worker threads.
+        with self._lock:
+            now = self.now_fn()
+            elapsed = max(0.0, now - self.last_ts)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_s)
+            self.last_ts = now
+            if self.tokens < amount:
+                return False
+            self.tokens -= amount
+            return True
 
 
 class TTLCache:
-    def __init__(self, ttl_s: int, now_fn: Callable[[], float]):
+    """Per-key TTL cache with lazy expiry.
+
+    Expiry times are kept in a min-heap, so each call only pays for the entries that
+    actually expired. ``max_size`` caps the store by dropping the soonest-expiring keys.
+    """
+
+    def __init__(self, ttl_s: int, now_fn: Callable[[], float], max_size: int | None = 4096):
         self.ttl_s = ttl_s
         self.now_fn = now_fn
+        self.max_size = max_size
         self.store: dict[str, tuple[float, Any]] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._lock = Lock()
 
     def get(self, key: str) -> Any | None:
-        entry = self.store.get(key)
-        if not entry:
-            return None
-        expires_at, value = entry
-        if self.now_fn() > expires_at:
-            self.store.pop(key, None)
-            return None
-        return value
+        with self._lock:
+            entry = self.store.get(key)
+            if not entry:
+                return None
+            expires_at, value = entry
+            if self.now_fn() > expires_at:
+                self._evict_expired(self.now_fn())
+                return None
+            return value
 
     def set(self, key: str, value: Any, ttl_s: int | None = None) -> None:
         ttl = self.ttl_s if ttl_s is None else ttl_s
-        self.store[key] = (self.now_fn() + ttl, value)
+        with self._lock:
+            now = self.now_fn()
+            self._evict_expired(now)
+            expires_at = now + ttl
+            self.store[key] = (expires_at, value)
+            heapq.heappush(self._heap, (expires_at, key))
+            if self.max_size is not None:
+                while len(self.store) > self.max_size and self._pop_soonest():
+                    pass
+            # Overwritten keys leave stale heap entries behind; rebuild before they pile up.
+            if len(self._heap) > 2 * len(self.store) + 64:
+                self._heap = [(exp, k) for k, (exp, _) in self.store.items()]
+                heapq.heapify(self._heap)
 
     def snapshot(self) -> dict[str, Any]:
-        now = self.now_fn()
-        out: dict[str, Any] = {}
-        expired: list[str] = []
-        for key, (expires_at, value) in self.store.items():
-            if now > expires_at:
-                expired.append(key)
-                continue
-            out[key] = value
-        for key in expired:
-            self.store.pop(key, None)
-        return out
+        with self._lock:
+            self._evict_expired(self.now_fn())
+            return {key: value for key, (_, value) in self.store.items()}
+
+    def _evict_expired(self, now: float) -> None:
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.store.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self.store[key]
+
+    def _pop_soonest(self) -> bool:
+        heap = self._heap
+        while heap:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.store.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self.store[key]
+                return True
+        return False
 
 
 class SymbolResolver:
@@ -129,8 +195,15 @@ class SymbolResolver:
             },
         }
 
+        # Static maps flattened to one (provider, symbol) lookup so known symbols skip the TTL cache probe.
+        self._static = {
+            (sys.intern(provider), sys.intern(symbol)): sys.intern(resolved)
+            for provider, mapping in self.maps.items()
+            for symbol, resolved in mapping.items()
+        }
+
     def resolve(self, symbol: str, provider: str, searcher: Callable[[str], str | None] | None) -> str:
-        mapped = self.maps.get(provider, {}).get(symbol)
+        mapped = self._static.get((provider, symbol))
         if mapped:
             return mapped
         cache_key = f"{provider}:{symbol}"
@@ -148,43 +221,85 @@ class SymbolResolver:
 
 class QuoteProvider:
     name = "provider"
+    # Max symbols per upstream request; providers without a multi-symbol endpoint use 1.
+    batch_size = 1
 
     def __init__(self, enabled: bool = True):
         self.enabled = enabled
+        self._client: httpx.Client | None = None
+        self._client_lock = Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        # One keep-alive client per provider, so repeat calls to the same host skip the TCP/TLS handshake.
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=HTTP_TIMEOUT_S, limits=HTTP_LIMITS, http2=HTTP2_ENABLED)
+                    atexit.register(self.close)
+        return self._client
+
+    def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            client.close()
 
     def get_quote(self, symbol: str) -> ProviderResult[Quote]:
         raise NotImplementedError
 
+    def get_quotes(self, symbols: list[str]) -> dict[str, ProviderResult[Quote]]:
+        return {symbol: self.get_quote(symbol) for symbol in symbols}
+
     def search(self, symbol: str) -> str | None:
         return None
 
 
 class YahooQuoteProvider(QuoteProvider):
     name = "yahoo"
+    batch_size = 10
 
     def get_quote(self, symbol: str) -> ProviderResult[Quote]:
-        started = time.time()
+        return self.get_quotes([symbol])[symbol]
+
+    def get_quotes(self, symbols: list[str]) -> dict[str, ProviderResult[Quote]]:
+        started = time.monotonic()
         url = "https://query1.finance.yahoo.com/v7/finance/quote"
-        params = {"symbols": symbol}
+        params = {"symbols": ",".join(symbols)}
         headers = {"User-Agent": "Mozilla/5.0"}
+
+        def _fail(code: str, msg: str | None) -> dict[str, ProviderResult[Quote]]:
+            return {s: ProviderResult(False, self.name, None, _latency_ms(started), False, code, msg) for s in symbols}
+
         try:
-            with httpx.Client(timeout=4.0) as client:
-                res = client.get(url, params=params, headers=headers)
-                status = res.status_code
-                if status >= 500:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_5xx", res.text)
-                if status == 429:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_429", "rate_limited")
-                if status >= 300:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_error", res.text)
-                payload = res.json()
+            res = self.client.get(url, params=params, headers=headers)
+            status = res.status_code
+            if status >= 500:
+                return _fail("http_5xx", res.text)
+            if status == 429:
+                return _fail("http_429", "rate_limited")
+            if status >= 300:
+                return _fail("http_error", res.text)
+            payload = _json(res)
         except Exception as exc:
-            return ProviderResult(False, self.name, None, _latency_ms(started), False, "network_error", str(exc))
+            return _fail("network_error", str(exc))
 
-        result = (payload.get("quoteResponse") or {}).get("result") or []
-        if not result:
+        nodes = {
+            node.get("symbol"): node
+            for node in (payload.get("quoteResponse") or _EMPTY).get("result") or _EMPTY_LIST
+            if isinstance(node, dict)
+        }
+        out: dict[str, ProviderResult[Quote]] = {}
+        for symbol in symbols:
+            node = nodes.get(symbol)
+            if node is None and len(symbols) == 1 and len(nodes) == 1:
+                # Single-symbol requests may come back under a canonicalized symbol.
+                node = next(iter(nodes.values()))
+            out[symbol] = self._parse_node(node, started)
+        return out
+
+    def _parse_node(self, node: dict | None, started: float) -> ProviderResult[Quote]:
+        if not node:
             return ProviderResult(False, self.name, None, _latency_ms(started), False, "empty", "no_result")
-        node = result[0]
         price = node.get("regularMarketPrice")
         if price is None or price == 0:
             return ProviderResult(False, self.name, None, _latency_ms(started), False, "missing_price", "no_price")
@@ -198,6 +313,7 @@ class YahooQuoteProvider(QuoteProvider):
             ts_utc=ts_iso,
             currency=currency,
             meta={},
+            ts_epoch=_epoch_or_none(ts),
         )
         return ProviderResult(True, self.name, quote, _latency_ms(started), False, None, None)
 
@@ -212,20 +328,19 @@ class FinnhubQuoteProvider(QuoteProvider):
     def get_quote(self, symbol: str) -> ProviderResult[Quote]:
         if not self.api_key:
             return ProviderResult(False, self.name, None, 0, False, "disabled", "missing_api_key")
-        started = time.time()
+        started = time.monotonic()
         url = "https://finnhub.io/api/v1/quote"
         params = {"symbol": symbol, "token": self.api_key}
         try:
-            with httpx.Client(timeout=4.0) as client:
-                res = client.get(url, params=params)
-                status = res.status_code
-                if status >= 500:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_5xx", res.text)
-                if status == 429:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_429", "rate_limited")
-                if status >= 300:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_error", res.text)
-                payload = res.json()
+            res = self.client.get(url, params=params)
+            status = res.status_code
+            if status >= 500:
+                return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_5xx", res.text)
+            if status == 429:
+                return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_429", "rate_limited")
+            if status >= 300:
+                return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_error", res.text)
+            payload = _json(res)
         except Exception as exc:
             return ProviderResult(False, self.name, None, _latency_ms(started), False, "network_error", str(exc))
 
@@ -241,6 +356,7 @@ class FinnhubQuoteProvider(QuoteProvider):
             ts_utc=ts_iso,
             currency=None,
             meta={},
+            ts_epoch=_epoch_or_none(ts),
         )
         return ProviderResult(True, self.name, quote, _latency_ms(started), False, None, None)
 
@@ -250,11 +366,10 @@ class FinnhubQuoteProvider(QuoteProvider):
         url = "https://finnhub.io/api/v1/search"
         params = {"q": symbol, "token": self.api_key}
         try:
-            with httpx.Client(timeout=4.0) as client:
-                res = client.get(url, params=params)
-                if res.status_code >= 300:
-                    return None
-                payload = res.json()
+            res = self.client.get(url, params=params)
+            if res.status_code >= 300:
+                return None
+            payload = _json(res)
         except Exception:
             return None
         results = payload.get("result") or []
@@ -276,20 +391,19 @@ class TwelveDataQuoteProvider(QuoteProvider):
     def get_quote(self, symbol: str) -> ProviderResult[Quote]:
         if not self.api_key:
             return ProviderResult(False, self.name, None, 0, False, "disabled", "missing_api_key")
-        started = time.time()
+        started = time.monotonic()
         url = "https://api.twelvedata.com/quote"
         params = {"symbol": symbol, "apikey": self.api_key}
         try:
-            with httpx.Client(timeout=4.0) as client:
-                res = client.get(url, params=params)
-                status = res.status_code
-                if status >= 500:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_5xx", res.text)
-                if status == 429:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_429", "rate_limited")
-                if status >= 300:
-                    return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_error", res.text)
-                payload = res.json()
+            res = self.client.get(url, params=params)
+            status = res.status_code
+            if status >= 500:
+                return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_5xx", res.text)
+            if status == 429:
+                return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_429", "rate_limited")
+            if status >= 300:
+                return ProviderResult(False, self.name, None, _latency_ms(started), False, "http_error", res.text)
+            payload = _json(res)
         except Exception as exc:
             return ProviderResult(False, self.name, None, _latency_ms(started), False, "network_error", str(exc))
 
@@ -316,11 +430,10 @@ class TwelveDataQuoteProvider(QuoteProvider):
         url = "https://api.twelvedata.com/symbol_search"
         params = {"symbol": symbol, "apikey": self.api_key}
         try:
-            with httpx.Client(timeout=4.0) as client:
-                res = client.get(url, params=params)
-                if res.status_code >= 300:
-                    return None
-                payload = res.json()
+            res = self.client.get(url, params=params)
+            if res.status_code >= 300:
+                return None
+            payload = _json(res)
         except Exception:
             return None
         items = payload.get("data") or []
@@ -347,11 +460,19 @@ class QuoteRouter:
         negative_ttl_s: int = NEGATIVE_CACHE_TTL_S,
         stale_after_s: int = STALE_AFTER_S,
         last_good_ttl_s: int = LAST_GOOD_TTL_S,
+        wall_fn: Callable[[], float] | None = None,
     ):
-        self.now_fn = now_fn or time.time
+        # now_fn drives internal timing (TTLs, rate limits, backoff) and must not jump with NTP
+        # adjustments; wall_fn is only for comparing provider epoch timestamps (freshness).
+        # An injected now_fn doubles as the wall clock unless wall_fn is given.
+        self.now_fn = now_fn or time.monotonic
+        self.wall_fn = wall_fn or now_fn or time.time
         self.providers = providers
         self.negative_cache = TTLCache(negative_ttl_s, self.now_fn)
         self.last_good = TTLCache(last_good_ttl_s, self.now_fn)
+        self.last_good_ttl_s = last_good_ttl_s
+        # symbol -> (window start, requests seen in the window); drives dynamic_ttl.
+        self.access_counts = TTLCache(ACCESS_WINDOW_S, self.now_fn)
         self.symbol_meta = TTLCache(24 * 60 * 60, self.now_fn)
         self.stale_after_s = stale_after_s
         self.resolver = SymbolResolver(self.now_fn)
@@ -363,6 +484,10 @@ class QuoteRouter:
             "backoff_hits": 0,
             "disabled_providers": {},
         }
+        self._in_flight: dict[str, Future] = {}
+        # The owner walks the provider chain in order, each request bounded by HTTP_TIMEOUT_S.
+        self.in_flight_wait_s = HTTP_TIMEOUT_S * max(1, sum(1 for p in providers if p.enabled)) + IN_FLIGHT_WAIT_SLACK_S
+        self._in_flight_lock = Lock()
         self.provider_state: dict[str, ProviderState] = {}
         for provider in providers:
             if provider.name == "twelvedata":
@@ -386,54 +511,175 @@ class QuoteRouter:
         }
 
     def get_quote(self, symbol: str) -> ProviderResult[Quote]:
-        last_good = self.last_good.get(symbol)
+        return self.get_quotes([symbol])[symbol]
+
+    def get_quotes(self, symbols: list[str]) -> dict[str, ProviderResult[Quote]]:
+        """Quote several symbols, walking the provider chain once for the whole set.
+
+        Each provider only sees the symbols still unresolved by the ones before it, in
+        requests of up to ``provider.batch_size`` symbols (one rate-limit token each).
+        """
+        unique = list(dict.fromkeys(symbols))
+        for symbol in unique:
+            self._record_access(symbol)
+        # In-flight dedup: a symbol another thread is already fetching waits for that result
+        # instead of issuing a second upstream call.
+        owned: dict[str, Future] = {}
+        waiting: dict[str, Future] = {}
+        with self._in_flight_lock:
+            for symbol in unique:
+                fut = self._in_flight.get(symbol)
+                if fut is None:
+                    owned[symbol] = self._in_flight[symbol] = Future()
+                else:
+                    waiting[symbol] = fut
+        out: dict[str, ProviderResult[Quote]] = {}
+        try:
+            if owned:
+                out.update(self._fetch_quotes(list(owned)))
+        finally:
+            with self._in_flight_lock:
+                for symbol, fut in owned.items():
+                    self._in_flight.pop(symbol, None)
+                    fut.set_result(out.get(symbol) or ProviderResult(False, "router", None, 0, False, "all_failed", "no_quote"))
+        for symbol, fut in waiting.items():
+            out[symbol] = self._await_in_flight(symbol, fut)
+        return {symbol: out[symbol] for symbol in unique}
+
+    def _await_in_flight(self, symbol: str, fut: Future) -> ProviderResult[Quote]:
+        try:
+            return fut.result(timeout=self.in_flight_wait_s)
+        except Exception:
+            # last_good is read after the wait, so it holds the owner's quote if the fetch landed meanwhile.
+            return self._degraded(symbol, self.last_good.get(symbol))
+
+    def _fetch_quotes(self, pending: list[str]) -> dict[str, ProviderResult[Quote]]:
+        last_good = {symbol: self.last_good.get(symbol) for symbol in pending}
+        out: dict[str, ProviderResult[Quote]] = {}
         for idx, provider in enumerate(self.providers):
+            if not pending:
+                break
             if not provider.enabled:
                 disabled = self.stats["disabled_providers"].setdefault(provider.name, 0)
                 self.stats["disabled_providers"][provider.name] = disabled + 1
                 continue
             state = self.provider_state[provider.name]
-            now = self.now_fn()
-            if now < state.backoff_until:
-                self.stats["backoff_hits"] += 1
-                continue
-            if not state.bucket.take(1.0):
-                self.stats["rate_limit_hits"] += 1
-                continue
-            neg_key = f"{provider.name}:{symbol}"
-            if self.negative_cache.get(neg_key):
-                self.stats["negative_cache_hits"] += 1
-                continue
-
-            resolved = self.resolver.resolve(symbol, provider.name, provider.search)
-            result = provider.get_quote(resolved)
-            if result.ok and result.data:
-                freshness = _freshness_seconds(result.data.ts_utc, self.now_fn)
-                if freshness is not None and freshness > self.stale_after_s:
-                    self.negative_cache.set(neg_key, True)
+            candidates: list[str] = []
+            for symbol in pending:
+                if self.negative_cache.get(f"{provider.name}:{symbol}"):
+                    self.stats["negative_cache_hits"] += 1
+                else:
+                    candidates.append(symbol)
+            step = max(1, provider.batch_size)
+            chunks = [candidates[start:start + step] for start in range(0, len(candidates), step)]
+            halted = Event()
+
+            def _request(chunk: list[str], provider=provider, state=state, halted=halted):
+                # Backoff and rate-limit checks run as each request starts, so a 429/5xx answer to one
+                # request stops the ones that have not gone out yet. Skips return the stats counter to bump;
+                # this may run on a pool thread, so the counters are updated by the caller.
+                if halted.is_set() or self.now_fn() < state.backoff_until:
+                    return "backoff_hits"
+                if not state.bucket.take(1.0):
+                    return "rate_limit_hits"
+                by_resolved: dict[str, list[str]] = {}
+                for symbol in chunk:
+                    resolved = self.resolver.resolve(symbol, provider.name, provider.search)
+                    by_resolved.setdefault(resolved, []).append(symbol)
+                results = provider.get_quotes(list(by_resolved))
+                if any(r.error_code in PROVIDER_ERROR_CODES for r in results.values()):
+                    halted.set()
+                return by_resolved, results
+
+            # Upstream requests for one provider are independent (e.g. per-symbol fallbacks), so
+            # issue them together; results are applied afterwards on this thread.
+            if len(chunks) > 1:
+                responses = list(_PROVIDER_POOL.map(_request, chunks))
+            else:
+                responses = [_request(chunk) for chunk in chunks]
+            if halted.is_set():
+                # One backoff step per round, however many concurrent requests hit the same burst.
+                self._backoff(state)
+            for response in responses:
+                if isinstance(response, str):
+                    self.stats[response] += 1
                     continue
-                result.data.meta = _quote_meta(
-                    provider.name,
-                    is_fallback=idx > 0,
-                    freshness_seconds=freshness,
-                    degraded_mode=False,
-                )
-                self._record_hit(provider.name, idx > 0)
-                self.last_good.set(symbol, result.data)
-                self.symbol_meta.set(symbol, result.data.meta)
-                return result
-
-            if result.error_code in ("http_429", "http_5xx"):
-                state.backoff_exp = min(state.backoff_exp + 1, 5)
-                backoff_s = min(300, 2 ** state.backoff_exp)
-                state.backoff_until = self.now_fn() + backoff_s
-            self.negative_cache.set(neg_key, True)
+                by_resolved, results = response
+                for resolved, originals in by_resolved.items():
+                    result = results.get(resolved) or ProviderResult(
+                        False, provider.name, None, 0, False, "empty", "no_result"
+                    )
+                    if halted.is_set() and not result.ok:
+                        # Misses that raced a 429/5xx burst are not trusted for the negative cache.
+                        continue
+                    for symbol in originals:
+                        if self._accept(provider, idx, symbol, result):
+                            out[symbol] = result
+            pending = [symbol for symbol in pending if symbol not in out]
+
+        for symbol in pending:
+            out[symbol] = self._degraded(symbol, last_good[symbol])
+        return out
+
+    def _accept(
+        self,
+        provider: QuoteProvider,
+        idx: int,
+        symbol: str,
+        result: ProviderResult[Quote],
+    ) -> bool:
+        neg_key = f"{provider.name}:{symbol}"
+        if result.ok and result.data:
+            freshness = _freshness_seconds(result.data.ts_utc, self.wall_fn, result.data.ts_epoch)
+            if freshness is not None and freshness > self.stale_after_s:
+                self.negative_cache.set(neg_key, True)
+                return False
+            result.data.meta = _quote_meta(
+                provider.name,
+                is_fallback=idx > 0,
+                freshness_seconds=freshness,
+                degraded_mode=False,
+            )
+            self._record_hit(provider.name, idx > 0)
+            self.last_good.set(symbol, result.data, ttl_s=self.dynamic_ttl(symbol))
+            self.symbol_meta.set(symbol, result.data.meta)
+            return True
 
+        if result.error_code in PROVIDER_ERROR_CODES:
+            # Says nothing about the symbol; _fetch_quotes backs the whole provider off instead.
+            return False
+        self.negative_cache.set(neg_key, True)
+        return False
+
+    def _backoff(self, state: ProviderState) -> None:
+        state.backoff_exp = min(state.backoff_exp + 1, 5)
+        backoff_s = min(300, 2 ** state.backoff_exp)
+        state.backoff_until = self.now_fn() + backoff_s
+
+    def dynamic_ttl(self, symbol: str) -> int:
+        """last_good TTL for ``symbol``: the base TTL, stretched logarithmically for frequently requested symbols."""
+        entry = self.access_counts.get(symbol)
+        count = entry[1] if entry else 1
+        ttl = self.last_good_ttl_s * (1.0 + math.log(max(count, 1)))
+        return int(min(LAST_GOOD_TTL_MAX_S, max(LAST_GOOD_TTL_MIN_S, ttl)))
+
+    def _record_access(self, symbol: str) -> None:
+        now = self.now_fn()
+        entry = self.access_counts.get(symbol)
+        if entry is None:
+            self.access_counts.set(symbol, (now, 1))
+            return
+        started, count = entry
+        # Keep the window anchored at its first request so counts reset every ACCESS_WINDOW_S.
+        remaining = max(1, int(started + ACCESS_WINDOW_S - now))
+        self.access_counts.set(symbol, (started, count + 1), ttl_s=remaining)
+
+    def _degraded(self, symbol: str, last_good: Quote | None) -> ProviderResult[Quote]:
         if last_good:
             last_good.meta = _quote_meta(
                 last_good.meta.get("source", "cache"),
                 is_fallback=True,
-                freshness_seconds=_freshness_seconds(last_good.ts_utc, self.now_fn),
+                freshness_seconds=_freshness_seconds(last_good.ts_utc, self.wall_fn, last_good.ts_epoch),
                 degraded_mode=True,
             )
             self.symbol_meta.set(symbol, last_good.meta)
@@ -453,11 +699,12 @@ class QuoteRouter:
     def patch_snapshot(self, snapshot: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
         meta: dict[str, Any] = {"used_fallback": False, "providers": {}}
         patched = dict(snapshot)
-        for key, cfg in SNAPSHOT_PATCH_MAP.items():
-            value = snapshot.get(key, 0)
-            if value not in (0, None):
-                continue
-            result = self.get_quote(cfg["symbol"])
+        missing = {key: cfg for key, cfg in SNAPSHOT_PATCH_MAP.items() if snapshot.get(key, 0) in (0, None)}
+        if not missing:
+            return patched, meta
+        results = self.get_quotes([cfg["symbol"] for cfg in missing.values()])
+        for key, cfg in missing.items():
+            result = results[cfg["symbol"]]
             if not result.ok or not result.data:
                 continue
             patched[key] = result.data.price
@@ -508,8 +755,18 @@ def get_quote_router() -> QuoteRouter:
     return _ROUTER
 
 
+_EMPTY: dict[str, Any] = {}
+_EMPTY_LIST: tuple = ()
+
+
+def _json(res: httpx.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(res.content)
+    return res.json()
+
+
 def _latency_ms(started: float) -> int:
-    return int((time.time() - started) * 1000)
+    return int((time.monotonic() - started) * 1000)
 
 
 def _ts_from_epoch(epoch: int | float) -> str:
@@ -530,14 +787,29 @@ def _ts_from_string(value: str) -> str:
         return now_iso()
 
 
-def _freshness_seconds(ts_utc: str, now_fn: Callable[[], float]) -> int | None:
+def _freshness_seconds(ts_utc: str, now_fn: Callable[[], float], ts_epoch: float | None = None) -> int | None:
+    if ts_epoch is None:
+        ts_epoch = _iso_to_epoch(ts_utc)
+        if ts_epoch is None:
+            return None
+    return int(now_fn() - ts_epoch)
+
+
+@lru_cache(maxsize=4096)
+def _iso_to_epoch(ts_utc: str) -> float | None:
     try:
-        dt = datetime.fromisoformat(ts_utc.replace("Z", "+00:00"))
-        return int(now_fn() - dt.timestamp())
+        return datetime.fromisoformat(ts_utc.replace("Z", "+00:00")).timestamp()
     except Exception:
         return None
 
 
+def _epoch_or_none(epoch: Any) -> float | None:
+    try:
+        return float(epoch) if epoch else None
+    except (TypeError, ValueError):
+        return None
+
+
 def _quote_meta(source: str, is_fallback: bool, freshness_seconds: int | None, degraded_mode: bool) -> dict[str, Any]:
     return {
         "source": source,
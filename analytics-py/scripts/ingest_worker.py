@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
@@ -21,6 +22,35 @@ def _parse_watchlist(raw: str) -> list[str]:
     return [p.strip() for p in raw.split(",") if p.strip()]
 
 
+async def _run_once(pipeline: IntelPipelineService, req: IntelRequest, lock: asyncio.Lock) -> None:
+    async with lock:
+        started = time.time()
+        try:
+            await asyncio.to_thread(pipeline.run, req)
+            elapsed = time.time() - started
+            logger.info("ingest_worker run ok (%.2fs)", elapsed)
+        except Exception as exc:
+            logger.exception("ingest_worker run failed: %s", exc)
+
+
+async def _schedule(pipeline: IntelPipelineService, req: IntelRequest, interval_s: int) -> None:
+    # Fixed-rate ticks: a slow run no longer pushes every later run back by its own duration.
+    # The lock keeps runs from overlapping; at most one tick waits behind a run still in flight.
+    lock = asyncio.Lock()
+    tasks: set[asyncio.Task] = set()
+    loop = asyncio.get_running_loop()
+    next_run = loop.time()
+    while True:
+        if len(tasks) > 1:
+            logger.warning("ingest_worker tick skipped: previous run still in progress")
+        else:
+            task = asyncio.create_task(_run_once(pipeline, req, lock))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        next_run += interval_s
+        await asyncio.sleep(max(0.0, next_run - loop.time()))
+
+
 def main() -> None:
     settings = load_settings()
     cache = init_cache(settings.redis_url, settings.cache_ttl_seconds)
@@ -33,16 +63,8 @@ def main() -> None:
     watchlist = _parse_watchlist(os.getenv("INGEST_WATCHLIST", ""))
 
     logger.info("ingest_worker starting: interval=%ss timeframe=%s newsTimespan=%s watch=%s", interval_s, timeframe, news_span, watchlist)
-    while True:
-        started = time.time()
-        try:
-            req = IntelRequest(timeframe=timeframe, newsTimespan=news_span, watchlist=watchlist)
-            pipeline.run(req)
-            elapsed = time.time() - started
-            logger.info("ingest_worker run ok (%.2fs)", elapsed)
-        except Exception as exc:
-            logger.exception("ingest_worker run failed: %s", exc)
-        time.sleep(max(10, interval_s))
+    req = IntelRequest(timeframe=timeframe, newsTimespan=news_span, watchlist=watchlist)
+    asyncio.run(_schedule(pipeline, req, max(10, interval_s)))
 
 
 if __name__ == "__main__":
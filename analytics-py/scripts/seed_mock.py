@@ -1,30 +1,33 @@
 from __future__ import annotations
 
-import random
 from datetime import datetime, timedelta, timezone
+from itertools import chain
+
+import numpy as np
 
 from app.config import load_settings
 from app.infra.db import init_db
 
+MAX_SQL_PARAMS = 900
+
 
 def _iso(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    s = dt.astimezone(timezone.utc).isoformat()
+    return s[:-6] + "Z" if s.endswith("+00:00") else s
 
 
-def seed_prices(db):
+def seed_prices(db, rng: np.random.Generator):
     now = datetime.now(timezone.utc)
     start = now - timedelta(hours=48)
-    ts = start
-    price = 45000.0
-    rows = []
-    while ts <= now:
-        drift = random.uniform(-0.002, 0.002)
-        price *= 1 + drift
-        high = price * (1 + random.uniform(0.0, 0.0015))
-        low = price * (1 - random.uniform(0.0, 0.0015))
-        close = price
-        rows.append(("BTC", _iso(ts), price, high, low, close, random.uniform(1200, 5200)))
-        ts += timedelta(minutes=15)
+    n = 48 * 4 + 1
+    prices = 45000.0 * np.cumprod(1 + rng.uniform(-0.002, 0.002, n))
+    highs = prices * (1 + rng.uniform(0.0, 0.0015, n))
+    lows = prices * (1 - rng.uniform(0.0, 0.0015, n))
+    volumes = rng.uniform(1200, 5200, n)
+    # Same ISO format as the event rows, fractional seconds included, so ts_utc strings compare consistently.
+    stamps = [_iso(start + timedelta(minutes=15 * i)) for i in range(n)]
+    price_list = prices.tolist()
+    rows = list(zip(["BTC"] * n, stamps, price_list, highs.tolist(), lows.tolist(), price_list, volumes.tolist()))
 
     db.executemany(
         """
@@ -35,66 +38,95 @@ def seed_prices(db):
     )
 
 
-def seed_events(db):
+def seed_events(db, rng: np.random.Generator):
     now = datetime.now(timezone.utc)
-    rows = []
-    asset_rows = []
-    for i in range(20):
-        ts = now - timedelta(hours=random.uniform(1, 48))
-        cluster_id = f"cluster_{i:02d}"
-        event_id = f"event_{i:02d}"
-        impact = round(random.uniform(0.3, 0.9), 4)
-        credibility = round(random.uniform(0.6, 0.95), 3)
-        severity = round(random.uniform(0.4, 0.9), 3)
-        direction = random.choice([-1, 1])
-        rows.append(
-            (
-                event_id,
-                _iso(ts),
-                "reuters.com",
-                "tier1",
-                f"Mock headline {i}",
-                "Mock body text",
-                "https://example.com/mock",
-                '["Macro","ETF"]',
-                f"dedup_{i}",
-                cluster_id,
-                credibility,
-                severity,
-                impact,
-                "MACRO",
-                "kripto",
-                direction,
-            )
+    n = 20
+    ts_iso = [_iso(now - timedelta(hours=h)) for h in rng.uniform(1, 48, n).tolist()]
+    impacts = np.round(rng.uniform(0.3, 0.9, n), 4).tolist()
+    credibilities = np.round(rng.uniform(0.6, 0.95, n), 3).tolist()
+    severities = np.round(rng.uniform(0.4, 0.9, n), 3).tolist()
+    directions = rng.choice([-1, 1], size=n).tolist()
+    event_ids = [f"event_{i:02d}" for i in range(n)]
+    rows = [
+        (
+            event_ids[i],
+            ts_iso[i],
+            "reuters.com",
+            "tier1",
+            f"Mock headline {i}",
+            "Mock body text",
+            "https://example.com/mock",
+            '["Macro","ETF"]',
+            f"dedup_{i}",
+            f"cluster_{i:02d}",
+            credibilities[i],
+            severities[i],
+            impacts[i],
+            "MACRO",
+            "kripto",
+            directions[i],
         )
-        asset_rows.append((event_id, "BTC", 0.8))
-        asset_rows.append((event_id, "ALTS", 0.5))
+        for i in range(n)
+    ]
+    asset_rows = list(chain.from_iterable(((eid, "BTC", 0.8), (eid, "ALTS", 0.5)) for eid in event_ids))
 
-    db.executemany(
+    _insert_multirow(
+        db,
         """
         INSERT OR REPLACE INTO events (
             event_id, ts_utc, source, source_tier, headline, body, url, tags_json,
             dedup_hash, cluster_id, credibility_score, severity_score, impact_score,
             event_type, category, direction
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ) VALUES
         """,
         rows,
     )
-    db.executemany(
-        """
-        INSERT OR REPLACE INTO event_asset_map (event_id, asset_or_sector, relevance_score)
-        VALUES (?, ?, ?)
-        """,
+    _insert_multirow(
+        db,
+        "INSERT OR REPLACE INTO event_asset_map (event_id, asset_or_sector, relevance_score) VALUES",
         asset_rows,
     )
 
 
+def _insert_multirow(db, head: str, rows: list[tuple]) -> None:
+    """Insert rows with one multi-row VALUES statement per chunk instead of one statement per row."""
+    if not rows:
+        return
+    width = len(rows[0])
+    placeholder = "(" + ", ".join(["?"] * width) + ")"
+    # Stay under SQLite's default 999 bound-parameter limit.
+    per_stmt = max(1, MAX_SQL_PARAMS // width)
+    for i in range(0, len(rows), per_stmt):
+        chunk = rows[i : i + per_stmt]
+        db.execute(f"{head} {', '.join([placeholder] * len(chunk))}", tuple(chain.from_iterable(chunk)))
+
+
+# Seed data is disposable; skip fsyncs and the on-disk rollback journal for the bulk inserts.
+_FAST_SEED_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "temp_store": "MEMORY"}
+
+
+def _set_pragmas(db, pragmas: dict) -> dict:
+    """Apply pragmas and return their previous values so they can be restored."""
+    previous = {}
+    for name, value in pragmas.items():
+        row = db.fetchone(f"PRAGMA {name}")
+        previous[name] = row[name]
+        db.execute(f"PRAGMA {name}={value}")
+    return previous
+
+
 def main():
-    random.seed(42)
     settings = load_settings()
     db = init_db(settings.database_url)
-    seed_prices(db)
-    seed_events(db)
+    previous = _set_pragmas(db, _FAST_SEED_PRAGMAS) if db.dialect == "sqlite" else {}
+    try:
+        rng = np.random.default_rng(42)
+        seed_prices(db, rng)
+        seed_events(db, rng)
+    finally:
+        # journal_mode changes persist on WAL databases, so put the real settings back.
+        if previous:
+            _set_pragmas(db, previous)
     print("seeded mock data")
 
 
@@ -6,13 +6,21 @@ from app.models import NewsItem
 
 
 def _iso(dt: datetime) -> str:
-    return dt.isoformat().replace("+00:00", "Z")
+    s = dt.isoformat()
+    return s[:-6] + "Z" if s.endswith("+00:00") else s
+
+
+def _meta_from_items(items: list[NewsItem]) -> dict[int, dict]:
+    # publishedAtISO always comes from _iso, so the trailing "Z" is swapped by slicing.
+    return {id(it): {"published": datetime.fromisoformat(it.publishedAtISO[:-1] + "+00:00")} for it in items}
 
 
 class DedupeStabilityTests(unittest.TestCase):
+    NOW = datetime.now(timezone.utc)
+
     def test_canonical_url_dedup(self):
         base = "https://example.com/story/123"
-        now = datetime.now(timezone.utc)
+        now = self.NOW
         items = [
             NewsItem(title="Story A", url=f"{base}?utm_source=twitter", source="a.com", publishedAtISO=_iso(now)),
             NewsItem(title="Story A updated", url=f"{base}?utm_campaign=foo", source="b.com", publishedAtISO=_iso(now + timedelta(hours=3))),
@@ -25,20 +33,17 @@ class DedupeStabilityTests(unittest.TestCase):
         self.assertEqual(deduped[0].dedup_cluster_id, build_cluster_id(f"url::{canon}"))
 
     def test_representative_selection_order(self):
-        now = datetime.now(timezone.utc)
+        now = self.NOW
         items = [
             NewsItem(title="A", url="http://ex.com/a", source="a.com", relevance_score=60, quality_score=80, publishedAtISO=_iso(now)),
             NewsItem(title="B", url="http://ex.com/b", source="b.com", relevance_score=70, quality_score=80, publishedAtISO=_iso(now - timedelta(hours=1))),
             NewsItem(title="C", url="http://ex.com/c", source="c.com", relevance_score=70, quality_score=70, publishedAtISO=_iso(now + timedelta(hours=1))),
         ]
-        meta = {}
-        for item in items:
-            meta[id(item)] = {"published": datetime.fromisoformat(item.publishedAtISO.replace("Z", "+00:00"))}
-        rep = select_representative(items, meta)
+        rep = select_representative(items, _meta_from_items(items))
         self.assertEqual(rep.title, "B")
 
     def test_entity_group_cluster_id_is_stable_per_group(self):
-        now = datetime.now(timezone.utc)
+        now = self.NOW
         items = [
             NewsItem(title="Alpha headline", url="https://ex.com/a", source="a.com", quality_score=80, relevance_score=70, publishedAtISO=_iso(now)),
             NewsItem(title="Beta headline", url="https://ex.com/b", source="b.com", quality_score=80, relevance_score=70, publishedAtISO=_iso(now)),
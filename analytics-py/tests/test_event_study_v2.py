@@ -7,17 +7,21 @@ from app.engine.event_study import compute_event_study
 from app.models import NewsItem
 
 
+def _build_candles(start: datetime, periods: int, volume_cycle: int | None = None) -> pd.DataFrame:
+    idx = pd.date_range(start=start, periods=periods, freq="15min", tz="UTC")
+    close = [100 + i for i in range(periods)]
+    volume = [1000 + (i % volume_cycle if volume_cycle else i) for i in range(periods)]
+    return pd.DataFrame({"Close": close, "Volume": volume}, index=idx)
+
+
 class EventStudyV2Tests(unittest.TestCase):
-    def _build_candles(self, start: datetime, periods: int):
-        idx = pd.date_range(start=start, periods=periods, freq="15min", tz="UTC")
-        close = pd.Series([100 + i for i in range(periods)], index=idx)
-        volume = pd.Series([1000 + (i % 10) for i in range(periods)], index=idx)
-        df = pd.DataFrame({"Close": close, "Volume": volume})
-        return df
+    @classmethod
+    def setUpClass(cls):
+        # compute_event_study only reads candles, so one frame per class is shared across tests.
+        cls.df = _build_candles(datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc), 200, volume_cycle=10)
 
     def test_event_windows_and_tsi(self):
-        start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
-        df = self._build_candles(start, 200)
+        df = self.df
         event_time = df.index[10].to_pydatetime()
         news = [
             NewsItem(
@@ -52,13 +56,13 @@ class EventStudyV2Tests(unittest.TestCase):
 
 
 class EventStudyMissingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.df = _build_candles(datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc), 10, volume_cycle=5)
+
     def test_missing_around_window(self):
-        start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
-        idx = pd.date_range(start=start, periods=10, freq="15min", tz="UTC")
-        close = pd.Series([100 + i for i in range(10)], index=idx)
-        volume = pd.Series([1000 + (i % 5) for i in range(10)], index=idx)
-        df = pd.DataFrame({"Close": close, "Volume": volume})
-        event_time = idx[8].to_pydatetime()
+        df = self.df
+        event_time = df.index[8].to_pydatetime()
         news = [
             NewsItem(
                 title="Missing around",
@@ -77,12 +81,12 @@ class EventStudyMissingTests(unittest.TestCase):
 
 
 class EventStudyAlignmentTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.df = _build_candles(datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc), 20)
+
     def test_alignment_floor_15m(self):
-        start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
-        idx = pd.date_range(start=start, periods=20, freq="15min", tz="UTC")
-        close = pd.Series([100 + i for i in range(20)], index=idx)
-        volume = pd.Series([1000 + i for i in range(20)], index=idx)
-        df = pd.DataFrame({"Close": close, "Volume": volume})
+        df = self.df
         # t0 at 12:07 should align to 12:00 (index 0)
         event_time = datetime(2025, 1, 1, 12, 7, tzinfo=timezone.utc)
         news = [
@@ -30,8 +30,9 @@ def _settings() -> Settings:
 
 
 class ForecastNewsScoreTests(unittest.TestCase):
+    NOW_ISO = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
     def test_news_score_nonzero_with_clusters(self):
-        now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         cluster = ClusterImpact(
             cluster_id="c1",
             headline="Major regulatory update",
@@ -41,7 +42,7 @@ class ForecastNewsScoreTests(unittest.TestCase):
             impact=80.0,
             credibility=0.8,
             severity=0.7,
-            ts_utc=now_iso,
+            ts_utc=self.NOW_ISO,
             targets=[("BTC", 0.7), ("ETH", 0.5), ("ALTS", 0.8), ("STABLES", 0.9)],
         )
         score, top, contribs = _aggregate_news_signal([cluster], _settings(), "BTC", RiskPanel())
@@ -50,7 +51,6 @@ class ForecastNewsScoreTests(unittest.TestCase):
         self.assertTrue(contribs)
 
     def test_neutral_clusters_do_not_add_directional_bias(self):
-        now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         cluster = ClusterImpact(
             cluster_id="c2",
             headline="Uncertain policy commentary",
@@ -60,7 +60,7 @@ class ForecastNewsScoreTests(unittest.TestCase):
             impact=85.0,
             credibility=0.9,
             severity=0.7,
-            ts_utc=now_iso,
+            ts_utc=self.NOW_ISO,
             targets=[("BTC", 0.8)],
         )
         score, top, contribs = _aggregate_news_signal([cluster], _settings(), "BTC", RiskPanel())
@@ -1,6 +1,7 @@
 import json
 import os
 import unittest
+from contextlib import ExitStack, contextmanager
 from unittest.mock import patch
 
 import requests
@@ -108,7 +109,31 @@ def _good_summary_text() -> str:
     )
 
 
+def _candidates_payload(text: str) -> dict:
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+# Fake responses are never mutated by the client, so tests share these instances.
+OK_RESPONSE = _FakeResponse(200, payload=_candidates_payload(_good_summary_text()))
+RATE_LIMITED = _FakeResponse(429, text="rate limited")
+
+
+@contextmanager
+def gemini_env(side_effect):
+    """Patch in a Gemini key, a fake requests.post and a no-op retry sleep; yields the post mock."""
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False))
+        post = stack.enter_context(patch("app.llm.gemini_client.requests.post", side_effect=side_effect))
+        stack.enter_context(patch("app.llm.gemini_client.time.sleep"))
+        yield post
+
+
 class GeminiClientTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # _prepare_payload and the prompt/summary builders only read their input, so tests share one copy.
+        cls.prepared = gemini_client._prepare_payload(_payload(), budget_chars=5000)
+
     def test_prepare_payload_compacts_and_keeps_news(self):
         payload = _payload()
         payload["topNews"] = payload["topNews"] * 30
@@ -120,73 +145,39 @@ class GeminiClientTests(unittest.TestCase):
         self.assertLessEqual(len(prepared["topNews"]), gemini_client.TOP_NEWS_MAX)
 
     def test_ensure_sections_adds_required_blocks(self):
-        prepared = gemini_client._prepare_payload(_payload(), budget_chars=5000)
-        text = gemini_client._ensure_sections("Kisa bir metin.", prepared)
+        text = gemini_client._ensure_sections("Kisa bir metin.", self.prepared)
         self.assertIn("Haber Temelli Icgoruler", text)
         self.assertIn("Model Fikirleri", text)
 
     def test_generate_retries_after_rate_limit(self):
-        ok_payload = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [{"text": _good_summary_text()}]
-                    }
-                }
-            ]
-        }
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post") as post, patch("app.llm.gemini_client.time.sleep"):
-                post.side_effect = [
-                    _FakeResponse(429, text="rate limited"),
-                    _FakeResponse(200, payload=ok_payload),
-                ]
-                with patch("app.llm.gemini_client._call_openrouter_fallback") as fallback:
-                    summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
-                    self.assertIsNotNone(summary)
-                    self.assertIsNone(err)
-                    self.assertEqual(post.call_count, 2)
-                    fallback.assert_not_called()
+        with gemini_env([RATE_LIMITED, OK_RESPONSE]) as post:
+            with patch("app.llm.gemini_client._call_openrouter_fallback") as fallback:
+                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+                self.assertIsNotNone(summary)
+                self.assertIsNone(err)
+                self.assertEqual(post.call_count, 2)
+                fallback.assert_not_called()
 
     def test_generate_uses_openrouter_after_final_rate_limit(self):
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post") as post, patch("app.llm.gemini_client.time.sleep"):
-                post.side_effect = [
-                    _FakeResponse(429, text="rate limited"),
-                    _FakeResponse(429, text="rate limited"),
-                ]
-                with patch("app.llm.gemini_client._call_openrouter_fallback", return_value=(_good_summary_text(), None)):
-                    summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
-                    self.assertIsNotNone(summary)
-                    self.assertEqual(err, "fallback_openrouter")
-                    self.assertIn("Model Fikirleri", summary)
+        with gemini_env([RATE_LIMITED, RATE_LIMITED]):
+            with patch("app.llm.gemini_client._call_openrouter_fallback", return_value=(_good_summary_text(), None)):
+                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+                self.assertIsNotNone(summary)
+                self.assertEqual(err, "fallback_openrouter")
+                self.assertIn("Model Fikirleri", summary)
 
     def test_generate_retries_without_system_instruction_after_400(self):
         call_log: list[tuple[str, bool]] = []
-        ok_payload = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [
-                            {
-                                "text": _good_summary_text()
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
 
         def _fake_post(url, headers=None, json=None, timeout=None):  # noqa: A002
             has_system = isinstance(json, dict) and "systemInstruction" in json
             call_log.append((url, has_system))
             if len(call_log) == 1:
                 return _FakeResponse(400, text="invalid field: systemInstruction")
-            return _FakeResponse(200, payload=ok_payload)
+            return OK_RESPONSE
 
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post", side_effect=_fake_post):
-                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+        with gemini_env(_fake_post):
+            summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
         self.assertIsNotNone(summary)
         self.assertIsNone(err)
         self.assertEqual(len(call_log), 2)
@@ -195,29 +186,15 @@ class GeminiClientTests(unittest.TestCase):
 
     def test_generate_switches_v1beta_to_v1_after_404(self):
         call_log: list[str] = []
-        ok_payload = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [
-                            {
-                                "text": _good_summary_text()
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
 
         def _fake_post(url, headers=None, json=None, timeout=None):  # noqa: A002
             call_log.append(url)
             if len(call_log) == 1:
                 return _FakeResponse(404, text="not found")
-            return _FakeResponse(200, payload=ok_payload)
+            return OK_RESPONSE
 
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post", side_effect=_fake_post):
-                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+        with gemini_env(_fake_post):
+            summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
         self.assertIsNotNone(summary)
         self.assertIsNone(err)
         self.assertEqual(len(call_log), 2)
@@ -225,29 +202,22 @@ class GeminiClientTests(unittest.TestCase):
         self.assertIn("/v1/models", call_log[1])
 
     def test_generate_uses_openrouter_after_timeout(self):
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post", side_effect=requests.Timeout):
-                with patch("app.llm.gemini_client._call_openrouter_fallback", return_value=(_good_summary_text(), None)):
-                    summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+        with gemini_env(requests.Timeout):
+            with patch("app.llm.gemini_client._call_openrouter_fallback", return_value=(_good_summary_text(), None)):
+                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
         self.assertIsNotNone(summary)
         self.assertEqual(err, "fallback_openrouter")
         self.assertIn("Model Fikirleri", summary)
 
     def test_generate_returns_rule_based_when_fallback_fails(self):
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post") as post, patch("app.llm.gemini_client.time.sleep"):
-                post.side_effect = [
-                    _FakeResponse(429, text="rate limited"),
-                    _FakeResponse(429, text="rate limited"),
-                ]
-                with patch("app.llm.gemini_client._call_openrouter_fallback", return_value=(None, "missing_openrouter_key")):
-                    summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+        with gemini_env([RATE_LIMITED, RATE_LIMITED]):
+            with patch("app.llm.gemini_client._call_openrouter_fallback", return_value=(None, "missing_openrouter_key")):
+                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
         self.assertIsNotNone(summary)
         self.assertTrue((err or "").startswith("fallback_rule_based:"))
 
     def test_build_prompt_contains_contract_sections(self):
-        prepared = gemini_client._prepare_payload(_payload(), budget_chars=5000)
-        prompt = gemini_client._build_prompt(prepared)
+        prompt = gemini_client._build_prompt(self.prepared)
         self.assertIn("ZORUNLU CIKTI BASLIKLARI", prompt)
         self.assertIn("Haber Temelli Icgoruler", prompt)
         self.assertIn("Model Fikirleri (Varsayim)", prompt)
@@ -257,16 +227,14 @@ class GeminiClientTests(unittest.TestCase):
         self.assertIn("newsPricingModel", prompt)
 
     def test_prepare_payload_keeps_local_portfolio_tags(self):
-        prepared = gemini_client._prepare_payload(_payload(), budget_chars=5000)
-        self.assertTrue(prepared["localHeadlines"])
-        row = prepared["localHeadlines"][0]
+        self.assertTrue(self.prepared["localHeadlines"])
+        row = self.prepared["localHeadlines"][0]
         self.assertIn("PORTFOLIO_SYMBOL_MATCH", row.get("tags") or [])
         self.assertEqual(row.get("portfolioSymbols"), ["ASTOR"])
         self.assertEqual(row.get("portfolioSectors"), ["UTILITIES"])
 
     def test_prepare_payload_keeps_tracker_fund_constituent_signals(self):
-        prepared = gemini_client._prepare_payload(_payload(), budget_chars=5000)
-        tracker = prepared.get("announcementTracker") or {}
+        tracker = self.prepared.get("announcementTracker") or {}
         rows = tracker.get("portfolio_upcoming") or []
         self.assertTrue(rows)
         row = rows[0]
@@ -289,30 +257,16 @@ class GeminiClientTests(unittest.TestCase):
         self.assertEqual(err, "missing_key")
 
     def test_generate_uses_rule_based_summary_when_model_output_low_quality(self):
-        low_quality = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [{"text": "Haber Temelli Icgoruler\n- [KANIT:T1] kisa not"}]
-                    }
-                }
-            ]
-        }
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "x"}, clear=False):
-            with patch("app.llm.gemini_client.requests.post") as post:
-                post.side_effect = [
-                    _FakeResponse(200, payload=low_quality),
-                    _FakeResponse(200, payload=low_quality),
-                ]
-                summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
+        low_quality = _FakeResponse(200, payload=_candidates_payload("Haber Temelli Icgoruler\n- [KANIT:T1] kisa not"))
+        with gemini_env([low_quality, low_quality]):
+            summary, err = gemini_client.generate_portfolio_summary(_payload(), timeout=0.1)
         self.assertIsNotNone(summary)
         self.assertTrue((err or "").startswith("fallback_rule_based:"))
         self.assertIn("Portfoy Hisse Etkisi", summary)
         self.assertIn("ASTOR", summary)
 
     def test_build_rule_based_summary_has_sections(self):
-        prepared = gemini_client._prepare_payload(_payload(), budget_chars=5000)
-        text = gemini_client._build_rule_based_summary(prepared)
+        text = gemini_client._build_rule_based_summary(self.prepared)
         self.assertIn("Haber Temelli Icgoruler", text)
         self.assertIn("Sektor Etkisi", text)
         self.assertIn("Model Fikirleri (Varsayim)", text)
@@ -1,112 +1,169 @@
-import unittest
+import pytest
 
 from app.models import NewsItem
-from app.services.portfolio_engine import build_local_headlines_for_llm, compute_news_impact
+from app.services.portfolio_engine import _compile_alias_map, build_local_headlines_for_llm, compute_news_impact
 
+_EXPECTED_TAGS = frozenset(
+    {
+        "LOCAL_TR_HEADLINE",
+        "LOCAL_SCRAPE",
+        "PORTFOLIO_SYMBOL_MATCH",
+        "PORTFOLIO_NEWS",
+        "PORTFOLIO_SECTOR_MATCH",
+        "BIST_SYMBOL_MATCH",
+        "HALKA_ARZ_THEME",
+    }
+)
 
-class LocalHeadlineTaggingTests(unittest.TestCase):
-    def test_build_local_headlines_assigns_symbol_sector_and_theme_tags(self):
-        alias_map = {
-            "symbols": {
-                "ASTOR": {
-                    "aliases": ["ASTOR", "Astor Enerji"],
-                    "asset_class": "BIST",
-                    "sector": "UTILITIES",
-                },
-                "SOKM": {
-                    "aliases": ["SOKM", "Sok Market"],
-                    "asset_class": "BIST",
-                    "sector": "RETAIL",
-                },
-            }
-        }
-        holdings = [
-            {"symbol": "ASTOR", "asset_class": "BIST", "sector": "UTILITIES", "weight": 0.30},
-            {"symbol": "SOKM", "asset_class": "BIST", "sector": "RETAIL", "weight": 0.20},
-        ]
-        rows = build_local_headlines_for_llm(
-            [
-                NewsItem(
-                    title="Astor Enerji halka arz kararini revize etti",
-                    url="https://www.ekonomim.com/finans/haberler/borsa/astor-enerji-halka-arz-haberi-1",
-                    source="ekonomim.com",
-                )
-            ],
-            alias_map,
-            holdings,
-        )
 
-        self.assertEqual(len(rows), 1)
-        row = rows[0]
-        tags = set(row.get("tags") or [])
-        self.assertIn("LOCAL_TR_HEADLINE", tags)
-        self.assertIn("LOCAL_SCRAPE", tags)
-        self.assertIn("PORTFOLIO_SYMBOL_MATCH", tags)
-        self.assertIn("PORTFOLIO_NEWS", tags)
-        self.assertIn("PORTFOLIO_SECTOR_MATCH", tags)
-        self.assertIn("BIST_SYMBOL_MATCH", tags)
-        self.assertIn("HALKA_ARZ_THEME", tags)
-        self.assertEqual(row.get("portfolioSymbols"), ["ASTOR"])
-        self.assertEqual(row.get("portfolioSectors"), ["UTILITIES"])
-        self.assertGreater(int(row.get("relevanceHint") or 0), 0)
-
-    def test_build_local_headlines_prioritizes_portfolio_matches(self):
-        alias_map = {
-            "symbols": {
-                "ASTOR": {
-                    "aliases": ["ASTOR", "Astor Enerji"],
-                    "asset_class": "BIST",
-                    "sector": "UTILITIES",
-                }
-            }
-        }
-        holdings = [{"symbol": "ASTOR", "asset_class": "BIST", "sector": "UTILITIES", "weight": 0.30}]
-        rows = build_local_headlines_for_llm(
-            [
-                NewsItem(
-                    title="Kuresel piyasalarda karisik seyir",
-                    url="https://www.paraanaliz.com/2026/borsa/kuresel-piyasalarda-karisik-seyir-g-11/",
-                    source="paraanaliz.com",
-                ),
-                NewsItem(
-                    title="Astor Enerji icin SPK onayi",
-                    url="https://www.paraanaliz.com/2026/sirketler/astor-enerji-icin-spk-onayi-g-12/",
-                    source="paraanaliz.com",
-                ),
-            ],
-            alias_map,
-            holdings,
-        )
+def _versioned(alias_map: dict, *version) -> dict:
+    # Compiled and versioned like load_aliases output, so matching goes through the impact memo.
+    alias_map = _compile_alias_map(alias_map)
+    alias_map["_version"] = ("test_local_headline_tagging", *version)
+    return alias_map
 
-        self.assertEqual(rows[0]["portfolioSymbols"], ["ASTOR"])
-        self.assertGreaterEqual(rows[0].get("relevanceHint", 0), rows[1].get("relevanceHint", 0))
 
-    def test_compute_news_impact_adds_portfolio_news_tag_on_direct_match(self):
-        alias_map = {
+def _astor_alias_map(sector: str) -> dict:
+    return _versioned(
+        {
             "symbols": {
                 "ASTOR": {
                     "aliases": ["ASTOR", "Astor Enerji"],
                     "asset_class": "BIST",
-                    "sector": "INDUSTRIALS",
+                    "sector": sector,
                 }
-            }
-        }
-        items = [
+            },
+        },
+        "ASTOR",
+        sector,
+    )
+
+
+@pytest.fixture(scope="module")
+def bist_alias_map():
+    alias_map = _astor_alias_map("UTILITIES")
+    alias_map["symbols"]["SOKM"] = {
+        "aliases": ["SOKM", "Sok Market"],
+        "asset_class": "BIST",
+        "sector": "RETAIL",
+    }
+    return _versioned(alias_map, "ASTOR+SOKM", "UTILITIES")
+
+
+@pytest.fixture(scope="module")
+def bist_holdings():
+    return [
+        {"symbol": "ASTOR", "asset_class": "BIST", "sector": "UTILITIES", "weight": 0.30},
+        {"symbol": "SOKM", "asset_class": "BIST", "sector": "RETAIL", "weight": 0.20},
+    ]
+
+
+def test_build_local_headlines_assigns_symbol_sector_and_theme_tags(bist_alias_map, bist_holdings):
+    rows = build_local_headlines_for_llm(
+        [
             NewsItem(
-                title="Astor Enerji yeni yatirim planini acikladi",
-                url="https://www.ekonomim.com/finans/haberler/borsa/astor-enerji-yatirim-planini-acikladi-haberi-1",
+                title="Astor Enerji halka arz kararini revize etti",
+                url="https://www.ekonomim.com/finans/haberler/borsa/astor-enerji-halka-arz-haberi-1",
                 source="ekonomim.com",
-                relevance_score=70,
-                quality_score=70,
             )
-        ]
-        out, summary = compute_news_impact(items, alias_map, flow_score=None, risk_flags=[], event_points=None)
-        self.assertEqual(len(out), 1)
-        self.assertIn("ASTOR", out[0]["matchedSymbols"])
-        self.assertIn("direct", summary)
-        self.assertIn("PORTFOLIO_NEWS", items[0].tags)
-        self.assertIn("PORTFOLIO_SYMBOL_MATCH", items[0].tags)
+        ],
+        bist_alias_map,
+        bist_holdings,
+    )
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert _EXPECTED_TAGS.issubset(row.get("tags") or ()), _EXPECTED_TAGS.difference(row.get("tags") or ())
+    assert row.get("portfolioSymbols") == ["ASTOR"]
+    assert row.get("portfolioSectors") == ["UTILITIES"]
+    assert int(row.get("relevanceHint") or 0) > 0
+
+
+def test_build_local_headlines_prioritizes_portfolio_matches():
+    holdings = [{"symbol": "ASTOR", "asset_class": "BIST", "sector": "UTILITIES", "weight": 0.30}]
+    rows = build_local_headlines_for_llm(
+        [
+            NewsItem(
+                title="Kuresel piyasalarda karisik seyir",
+                url="https://www.paraanaliz.com/2026/borsa/kuresel-piyasalarda-karisik-seyir-g-11/",
+                source="paraanaliz.com",
+            ),
+            NewsItem(
+                title="Astor Enerji icin SPK onayi",
+                url="https://www.paraanaliz.com/2026/sirketler/astor-enerji-icin-spk-onayi-g-12/",
+                source="paraanaliz.com",
+            ),
+        ],
+        _astor_alias_map("UTILITIES"),
+        holdings,
+    )
+
+    assert rows[0]["portfolioSymbols"] == ["ASTOR"]
+    assert rows[0].get("relevanceHint", 0) >= rows[1].get("relevanceHint", 0)
+
+
+def test_compute_news_impact_adds_portfolio_news_tag_on_direct_match():
+    items = [
+        NewsItem(
+            title="Astor Enerji yeni yatirim planini acikladi",
+            url="https://www.ekonomim.com/finans/haberler/borsa/astor-enerji-yatirim-planini-acikladi-haberi-1",
+            source="ekonomim.com",
+            relevance_score=70,
+            quality_score=70,
+        )
+    ]
+    alias_map = _astor_alias_map("INDUSTRIALS")
+    out, summary = compute_news_impact(items, alias_map, flow_score=None, risk_flags=[], event_points=None)
+    assert len(out) == 1
+    assert "ASTOR" in out[0]["matchedSymbols"]
+    assert "direct" in summary
+    assert "PORTFOLIO_NEWS" in items[0].tags
+    assert "PORTFOLIO_SYMBOL_MATCH" in items[0].tags
+
+    # A memo hit on fresh items tags them too and hands back rows the caller can mutate freely.
+    out[0]["impact_by_symbol"].clear()
+    fresh = [items[0].model_copy(update={"tags": []})]
+    again, _ = compute_news_impact(fresh, alias_map, flow_score=None, risk_flags=[], event_points=None)
+    assert "ASTOR" in again[0]["impact_by_symbol"]
+    assert {"PORTFOLIO_NEWS", "PORTFOLIO_SYMBOL_MATCH"}.issubset(fresh[0].tags)
+
+
+def test_compute_news_impact_keys_follow_first_match_order(bist_alias_map):
+    # SOKM matches directly and ASTOR only through sectors, so ASTOR is inserted after SOKM
+    # even though it comes first in the alias map.
+    items = [
+        NewsItem(
+            title="Sok Market magaza agini buyutuyor",
+            url="https://www.ekonomim.com/finans/haberler/borsa/sok-market-magaza-agi-haberi-1",
+            source="ekonomim.com",
+            relevance_score=70,
+            quality_score=70,
+            sector_impacts=[
+                {"sector": "UTILITIES", "direction": "UP", "impact_score": 60},
+                {"sector": "RETAIL", "direction": "UP", "impact_score": 50},
+            ],
+        )
+    ]
+    out, _ = compute_news_impact(items, bist_alias_map, flow_score=None, risk_flags=[], event_points=None)
+    assert list(out[0]["impact_by_symbol"]) == ["SOKM", "ASTOR"]
+    assert list(out[0]["impact_by_symbol_direct"]) == ["SOKM"]
+    assert list(out[0]["impact_by_symbol_indirect"]) == ["ASTOR"]
+
+
+def test_compute_news_impact_memo_separates_alias_map_versions(bist_alias_map):
+    item = NewsItem(
+        title="Sok Market yeni magazalar acti",
+        url="https://www.ekonomim.com/finans/haberler/borsa/sok-market-yeni-magazalar-haberi-1",
+        source="ekonomim.com",
+        relevance_score=70,
+        quality_score=70,
+    )
+    first, _ = compute_news_impact([item], _astor_alias_map("UTILITIES"), flow_score=None, risk_flags=[], event_points=None)
+    assert not any(row["matchedSymbols"] for row in first)
+    again, _ = compute_news_impact([item], bist_alias_map, flow_score=None, risk_flags=[], event_points=None)
+    assert again[0]["matchedSymbols"] == ["SOKM"]
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_compile_alias_map_drops_stale_version():
+    alias_map = _astor_alias_map("UTILITIES")
+    assert "_version" not in _compile_alias_map(alias_map)
@@ -5,8 +5,19 @@ from app.engine.news_engine import ambiguous_ticker_allowed, has_strong_symbol_c
 from app.providers.rss import _filter_items
 
 
+_WEEKDAY = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# The timespan filter compares against the wall clock, so "now" is read once at import rather than per test.
+_NOW = datetime.now(timezone.utc)
+_OLD = _NOW - timedelta(days=10)
+
+
 def _rfc822(dt: datetime) -> str:
-    return dt.strftime("%a, %d %b %Y %H:%M:%S GMT")
+    # Fixed English names keep the format independent of the process locale, unlike strftime's %a/%b.
+    return (
+        f"{_WEEKDAY[dt.weekday()]}, {dt.day:02d} {_MONTH[dt.month - 1]} {dt.year} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} GMT"
+    )
 
 
 class NewsFormulaSearchFixesTests(unittest.TestCase):
@@ -25,11 +36,9 @@ class NewsFormulaSearchFixesTests(unittest.TestCase):
         self.assertIn("q5", selected)
 
     def test_rss_filter_respects_timespan_for_dated_items(self):
-        now = datetime.now(timezone.utc)
-        old = now - timedelta(days=10)
         items = [
-            {"title": "fresh item", "url": "https://ex.com/fresh", "published": _rfc822(now)},
-            {"title": "old item", "url": "https://ex.com/old", "published": _rfc822(old)},
+            {"title": "fresh item", "url": "https://ex.com/fresh", "published": _rfc822(_NOW)},
+            {"title": "old item", "url": "https://ex.com/old", "published": _rfc822(_OLD)},
         ]
         out = _filter_items(items, "item", max_items=10, strict=False, timespan="24h")
         titles = {it["title"] for it in out}
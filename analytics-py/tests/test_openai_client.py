@@ -1,33 +1,44 @@
 from __future__ import annotations
 
 import os
+from types import SimpleNamespace
+
+import pytest
+from cachetools import TTLCache
 
 from app.llm import openai_client
 
 
-def test_summarize_article_openai_basic(monkeypatch):
-    class DummyResp:
-        def __init__(self, parsed):
-            self.output_parsed = parsed
+@pytest.fixture
+def isolated_summary_cache(monkeypatch):
+    # Swap in an empty cache for the test instead of clearing the shared one; monkeypatch restores it.
+    cache = TTLCache(maxsize=openai_client._SUMMARY_CACHE.maxsize, ttl=openai_client._SUMMARY_TTL)
+    monkeypatch.setattr(openai_client, "_SUMMARY_CACHE", cache)
+    return cache
+
+
+# Validated once at import. summarize_article_openai rewrites data_missing on the parsed model,
+# so parse() hands out an unvalidated copy rather than the shared instance.
+_DUMMY_SUMMARY = openai_client.ArticleSummary(
+    summary_tr="Ozet metni.",
+    why_it_matters="Kisa piyasa etkisi.",
+    key_points=["madde1", "madde2", "madde3"],
+    confidence=80,
+    data_missing=[],
+)
+
+
+class DummyClient:
+    def __init__(self, **kwargs):
+        self.responses = self
 
-    class DummyClient:
-        def __init__(self, **kwargs):
-            self.responses = self
+    def parse(self, **kwargs):
+        return SimpleNamespace(output_parsed=_DUMMY_SUMMARY.model_copy(deep=True))
 
-        def parse(self, **kwargs):
-            return DummyResp(
-                openai_client.ArticleSummary(
-                    summary_tr="Ozet metni.",
-                    why_it_matters="Kisa piyasa etkisi.",
-                    key_points=["madde1", "madde2", "madde3"],
-                    confidence=80,
-                    data_missing=[],
-                )
-            )
 
+def test_summarize_article_openai_basic(monkeypatch, isolated_summary_cache):
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     monkeypatch.setattr(openai_client, "OpenAI", DummyClient)
-    openai_client._SUMMARY_CACHE.clear()
 
     out = openai_client.summarize_article_openai(
         title="Ornek Baslik",
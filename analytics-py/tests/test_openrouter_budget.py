@@ -13,8 +13,9 @@ def test_openrouter_local_budget_exceeded(monkeypatch):
     monkeypatch.setenv("OPENROUTER_FREE_DAILY_BUDGET", "1")
     day = dp._today_key()
     minute = dp._minute_bucket()
-    dp._free_daily_count_by_day[day] = 1
-    dp._free_rpm_bucket[minute] = 1
+    # Swap in private counters so the module-level budget state is restored after the test.
+    monkeypatch.setattr(dp, "_free_daily_count_by_day", {day: 1})
+    monkeypatch.setattr(dp, "_free_rpm_bucket", {minute: 1})
     allowed, reason = dp._check_free_budget()
     assert allowed is False
     assert reason in ("daily_budget_exceeded", "rpm_budget_exceeded")
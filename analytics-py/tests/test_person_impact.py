@@ -1,13 +1,18 @@
-import unittest
 from datetime import datetime, timezone
 
+import pytest
+
 from app.engine.person_impact import extract_person_event, score_person_impact
 from app.engine.news_engine import final_rank_score
 from app.models import NewsItem
 
 
+_FROZEN_NOW = datetime(2026, 2, 8, 12, 0, tzinfo=timezone.utc)
+_FROZEN_ISO = _FROZEN_NOW.isoformat().replace("+00:00", "Z")
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return _FROZEN_ISO
 
 
 def _item(title: str, tags: list[str], entities: list[str]):
@@ -21,88 +26,88 @@ def _item(title: str, tags: list[str], entities: list[str]):
     }
 
 
-class PersonImpactTests(unittest.TestCase):
-    def test_central_bank_hawkish(self):
-        item = _item(
+@pytest.mark.parametrize(
+    "title,tags,entities,expected_stance,expected_bias",
+    [
+        (
             "Jerome Powell says rate hike likely as inflation persistent",
             ["PERSONAL", "CENTRAL_BANK_HEADS"],
             ["Jerome Powell"],
-        )
-        event = extract_person_event(item)
-        self.assertIsNotNone(event)
-        self.assertEqual(event["stance"], "HAWKISH")
-        self.assertIn("risk_off", event["asset_class_bias"])
-        impact, _ = score_person_impact(event, item)
-        self.assertGreaterEqual(impact, 70)
-
-    def test_central_bank_dovish(self):
-        item = _item(
+            "HAWKISH",
+            "risk_off",
+        ),
+        (
             "Christine Lagarde signals rate cut soon and easing",
             ["PERSONAL", "CENTRAL_BANK_HEADS"],
             ["Christine Lagarde"],
-        )
-        event = extract_person_event(item)
-        self.assertEqual(event["stance"], "DOVISH")
-        self.assertIn("risk_on", event["asset_class_bias"])
-
-    def test_regulator_enforcement(self):
-        item = _item(
+            "DOVISH",
+            "risk_on",
+        ),
+        (
             "Gary Gensler announces enforcement lawsuit against crypto exchange",
             ["PERSONAL", "REGULATORS"],
             ["Gary Gensler"],
-        )
-        event = extract_person_event(item)
-        self.assertEqual(event["stance"], "RISK_ESCALATE")
-        self.assertIn("crypto_reg_risk", event["asset_class_bias"])
-
-    def test_regulator_relief(self):
-        item = _item(
+            "RISK_ESCALATE",
+            "crypto_reg_risk",
+        ),
+        (
             "Rostin Behnam says approval framework for crypto licenses",
             ["PERSONAL", "REGULATORS"],
             ["Rostin Behnam"],
-        )
-        event = extract_person_event(item)
-        self.assertEqual(event["stance"], "RISK_DEESCALATE")
-        self.assertIn("risk_on", event["asset_class_bias"])
-
-    def test_energy_cut(self):
-        item = _item(
+            "RISK_DEESCALATE",
+            "risk_on",
+        ),
+        (
             "Prince Abdulaziz bin Salman says OPEC will cut output by 1 million bpd",
             ["PERSONAL", "ENERGY_MINISTERS"],
             ["Prince Abdulaziz bin Salman"],
-        )
-        event = extract_person_event(item)
-        self.assertEqual(event["stance"], "RISK_ESCALATE")
-        self.assertIn("energy_up", event["asset_class_bias"])
-
-    def test_energy_increase(self):
-        item = _item(
+            "RISK_ESCALATE",
+            "energy_up",
+        ),
+        (
             "Haitham Al Ghais says OPEC to increase output next month",
             ["PERSONAL", "ENERGY_MINISTERS"],
             ["Haitham Al Ghais"],
-        )
-        event = extract_person_event(item)
-        self.assertEqual(event["stance"], "RISK_DEESCALATE")
-        self.assertIn("energy_down", event["asset_class_bias"])
-
-    def test_rank_score_uses_impact_potential(self):
-        base = NewsItem(
-            title="Test",
-            url="http://example.com",
-            source="example.com",
-            relevance_score=80,
-            quality_score=80,
-        )
-        high = NewsItem(
-            title="Test 2",
-            url="http://example.com/2",
-            source="example.com",
-            relevance_score=80,
-            quality_score=80,
-            impact_potential=100,
-        )
-        self.assertGreater(final_rank_score(high), final_rank_score(base))
-
-
-if __name__ == "__main__":
-    unittest.main()
+            "RISK_DEESCALATE",
+            "energy_down",
+        ),
+    ],
+    ids=["cb_hawkish", "cb_dovish", "reg_enforcement", "reg_relief", "energy_cut", "energy_increase"],
+)
+def test_person_event_stance_and_bias(title, tags, entities, expected_stance, expected_bias):
+    event = extract_person_event(_item(title, tags, entities))
+    assert event is not None
+    assert event["stance"] == expected_stance
+    assert expected_bias in event["asset_class_bias"]
+
+
+def test_central_bank_hawkish_impact_score():
+    item = _item(
+        "Jerome Powell says rate hike likely as inflation persistent",
+        ["PERSONAL", "CENTRAL_BANK_HEADS"],
+        ["Jerome Powell"],
+    )
+    impact, _ = score_person_impact(extract_person_event(item), item)
+    assert impact >= 70
+
+
+# Read-only rank inputs, validated once at import.
+_RANK_BASE = NewsItem(
+    title="Test",
+    url="http://example.com",
+    source="example.com",
+    relevance_score=80,
+    quality_score=80,
+)
+_RANK_HIGH = NewsItem(
+    title="Test 2",
+    url="http://example.com/2",
+    source="example.com",
+    relevance_score=80,
+    quality_score=80,
+    impact_potential=100,
+)
+
+
+def test_rank_score_uses_impact_potential():
+    assert final_rank_score(_RANK_HIGH) > final_rank_score(_RANK_BASE)
@@ -1,7 +1,11 @@
 import os
+import threading
 import unittest
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
 
 from app.infra.cache import cache_key
 from app.services import portfolio_engine as pe
@@ -33,58 +37,51 @@ class DummyPipeline:
         return SimpleNamespace(top_news=self._top_news, flow=flow, risk=risk)
 
 
+_NEWS_DICT = {
+    "title": "Test headline",
+    "url": "http://example.com",
+    "source": "example.com",
+    "relevance_score": 50,
+    "quality_score": 50,
+}
+# Validated once and shared; it matches no alias, so build_portfolio never tags it.
+_NEWS_ITEM = NewsItem(**_NEWS_DICT)
+
+
 def _news_item():
-    return {
-        "title": "Test headline",
-        "url": "http://example.com",
-        "source": "example.com",
-        "relevance_score": 50,
-        "quality_score": 50,
-    }
+    # Cache readers re-validate into fresh NewsItems and never write back, so the dict is shared.
+    return _NEWS_DICT
 
 
 @patch("app.services.portfolio_engine.fetch_daily_history", return_value=list(range(1, 40)))
-@patch("app.services.portfolio_engine.fetch_price", return_value=(100.0, "test", "USD"))
+@patch("app.services.portfolio_engine.fetch_price_batch", side_effect=lambda symbols: {s: (100.0, "test", "USD") for s in symbols})
 @patch("app.services.portfolio_engine.load_portfolio_holdings", return_value=[{"symbol": "ASTOR", "qty": 10.0}])
 class PortfolioCacheTests(unittest.TestCase):
-    def test_portfolio_news_cache_fallback_order(self, *_):
+    @classmethod
+    def setUpClass(cls):
         alias_map = pe.load_aliases()
         wl_key = ",".join(sorted(set(pe._build_portfolio_watchlist(alias_map, [{"symbol": "ASTOR", "qty": 10.0}]))))
-        key_primary = cache_key("news", "24h", wl_key)
-        key_all = cache_key("news", "24h", "all")
-        key_empty = cache_key("news", "24h", "")
+        cls.key_primary = cache_key("news", "24h", wl_key)
+        cls.key_all = cache_key("news", "24h", "all")
+        cls.key_empty = cache_key("news", "24h", "")
 
+    def test_portfolio_news_cache_fallback_order(self, *_):
         with patch.dict(os.environ, {"PORTFOLIO_PIPELINE_ENABLED": "false"}):
-            cache = DummyCache()
-            cache.store[key_empty] = [_news_item()]
-            pipeline = DummyPipeline(cache)
-            out = pe.build_portfolio(pipeline, base_currency="TRY", news_horizon="24h")
-            self.assertIn("portfolio_news_cache_hit=empty", out.get("debug_notes", []))
-            self.assertEqual(out.get("newsImpact", {}).get("coverage", {}).get("total"), 1)
-
-            cache = DummyCache()
-            cache.store[key_all] = [_news_item()]
-            pipeline = DummyPipeline(cache)
-            out = pe.build_portfolio(pipeline, base_currency="TRY", news_horizon="24h")
-            self.assertIn("portfolio_news_cache_hit=all", out.get("debug_notes", []))
-
-            cache = DummyCache()
-            cache.store[key_primary] = [_news_item()]
-            pipeline = DummyPipeline(cache)
-            out = pe.build_portfolio(pipeline, base_currency="TRY", news_horizon="24h")
-            self.assertIn("portfolio_news_cache_hit=primary", out.get("debug_notes", []))
+            for key, expected in ((self.key_empty, "empty"), (self.key_all, "all"), (self.key_primary, "primary")):
+                with self.subTest(expected=expected):
+                    cache = DummyCache()
+                    cache.store[key] = [_news_item()]
+                    out = pe.build_portfolio(DummyPipeline(cache), base_currency="TRY", news_horizon="24h")
+                    self.assertIn(f"portfolio_news_cache_hit={expected}", out.get("debug_notes", []))
+                    self.assertEqual(out.get("newsImpact", {}).get("coverage", {}).get("total"), 1)
 
     def test_portfolio_pipeline_writes_primary_cache(self, *_):
-        alias_map = pe.load_aliases()
-        wl_key = ",".join(sorted(set(pe._build_portfolio_watchlist(alias_map, [{"symbol": "ASTOR", "qty": 10.0}]))))
-        key_primary = cache_key("news", "24h", wl_key)
-
         with patch.dict(os.environ, {"PORTFOLIO_PIPELINE_ENABLED": "true"}):
             cache = DummyCache()
-            pipeline = DummyPipeline(cache, top_news=[NewsItem(**_news_item())])
+            pipeline = DummyPipeline(cache, top_news=[_NEWS_ITEM])
             out = pe.build_portfolio(pipeline, base_currency="TRY", news_horizon="24h")
             self.assertTrue(pipeline.run_called)
-            self.assertIn(key_primary, cache.store)
+            self.assertIn(self.key_primary, cache.store)
             self.assertIn("portfolio_pipeline_used=True", out.get("debug_notes", []))
 
     def test_pipeline_disabled_cache_miss_explained(self, *_):
@@ -96,6 +93,128 @@ class PortfolioCacheTests(unittest.TestCase):
             self.assertIn("portfolio_pipeline_used=False", out.get("debug_notes", []))
             self.assertEqual(out.get("newsImpact", {}).get("coverage", {}).get("total"), 0)
 
+    def test_slow_gemini_summary_join_times_out(self, *_):
+        release = threading.Event()
+
+        def _slow_summary(payload, timeout):
+            release.wait(5)
+            return "late", None
+
+        env = {
+            "PORTFOLIO_PIPELINE_ENABLED": "false",
+            "PORTFOLIO_LOCAL_NEWS_ENABLED": "false",
+            "GEMINI_API_KEY": "test",
+            "GEMINI_PORTFOLIO_TIMEOUT": "0.05",
+        }
+        with patch.dict(os.environ, env), patch.object(pe, "SUMMARY_JOIN_SLACK_S", 0.05), patch(
+            "app.services.portfolio_engine.generate_portfolio_summary", side_effect=_slow_summary
+        ):
+            try:
+                out = pe.build_portfolio(DummyPipeline(DummyCache()), base_currency="TRY", news_horizon="24h")
+            finally:
+                release.set()
+        self.assertIn("gemini_portfolio_error=timeout", out.get("debug_notes", []))
+
+    def test_debug_notes_can_be_disabled(self, *_):
+        with patch.dict(os.environ, {"PORTFOLIO_PIPELINE_ENABLED": "false", "PORTFOLIO_DEBUG_NOTES": "false"}):
+            pipeline = DummyPipeline(DummyCache())
+            out = pe.build_portfolio(pipeline, base_currency="TRY", news_horizon="24h")
+            self.assertEqual(out.get("debug_notes"), [])
+
+
+class PriceCacheTests(unittest.TestCase):
+    @staticmethod
+    def _batch(price):
+        return lambda symbols: {s: price for s in symbols}
+
+    def test_fetch_prices_reuses_cached_quotes(self):
+        cache = DummyCache()
+        with patch("app.services.portfolio_engine.fetch_price_batch", side_effect=self._batch((10.0, "test", "USD"))) as fetch:
+            first = pe.fetch_prices(["AMD", "AMD", "PLTR"], cache)
+            second = pe.fetch_prices(["AMD", "PLTR"], cache)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(fetch.call_args.args[0], ["AMD", "PLTR"])
+        self.assertEqual(first, second)
+        self.assertEqual(second["AMD"], (10.0, "test", "USD"))
+
+    def test_fetch_prices_does_not_cache_missing(self):
+        cache = DummyCache()
+        with patch("app.services.portfolio_engine.fetch_price_batch", side_effect=self._batch((None, "missing", None))) as fetch:
+            pe.fetch_prices(["AMD"], cache)
+            pe.fetch_prices(["AMD"], cache)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_fetch_prices_applies_ttl_overrides(self):
+        cache = DummyCache()
+        cache.set = MagicMock()
+        with patch("app.services.portfolio_engine.fetch_price_batch", side_effect=self._batch((10.0, "test", "USD"))):
+            pe.fetch_prices(["USDTRY=X", "AMD"], cache, ttl_seconds=30, ttl_overrides={"USDTRY=X": 60})
+        ttls = {call.args[0]: call.args[2] for call in cache.set.call_args_list}
+        self.assertEqual(ttls, {cache_key("price", "USDTRY=X"): 60, cache_key("price", "AMD"): 30})
+
+    def test_fetch_prices_falls_back_per_symbol_when_batch_fails(self):
+        with patch("app.services.portfolio_engine.fetch_price_batch", side_effect=RuntimeError("router down")), patch(
+            "app.services.portfolio_engine.fetch_price", side_effect=lambda s: (5.0, "yahoo_chart", "USD") if s == "AMD" else (None, "missing", None)
+        ):
+            prices = pe.fetch_prices(["AMD", "PLTR"])
+        self.assertEqual(prices, {"AMD": (5.0, "yahoo_chart", "USD"), "PLTR": (None, "missing", None)})
+
+    def test_fetch_price_batch_uses_chart_when_router_raises(self):
+        router = MagicMock()
+        router.get_quotes.side_effect = RuntimeError("router down")
+        with patch("app.services.portfolio_engine.get_quote_router", return_value=router), patch(
+            "app.services.portfolio_engine._chart_price", return_value=(7.0, "yahoo_chart", "USD")
+        ):
+            prices = pe.fetch_price_batch(["AMD"])
+        self.assertEqual(prices, {"AMD": (7.0, "yahoo_chart", "USD")})
+
+    def test_chart_price_fallback_skips_history_cache(self):
+        df = pd.DataFrame({"Close": [1.0, 2.5]})
+        with patch("app.services.portfolio_engine._fetch_chart", return_value={"df": df}) as fetch, patch(
+            "app.services.portfolio_engine._fetch_chart_cached"
+        ) as cached:
+            price = pe._chart_price("MEMO")
+        self.assertEqual(price, (2.5, "yahoo_chart", None))
+        self.assertEqual(fetch.call_args.args, ("MEMO", "5d", "1d", 4.0))
+        cached.assert_not_called()
+
+    def test_fetch_daily_history_is_memoized(self):
+        df = pd.DataFrame({"Close": [1.0, None, 2.0]})
+        pe._HISTORY_CACHE.pop("MEMO", None)
+        with patch("app.services.portfolio_engine._fetch_chart_cached", return_value={"df": df}) as fetch:
+            first = pe.fetch_daily_history("MEMO")
+            second = pe.fetch_daily_history("MEMO")
+        self.assertEqual(fetch.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(first.tolist(), [1.0, 2.0])
+        self.assertFalse(first.flags.writeable)
+
+    def test_risk_stats_reused_for_same_history(self):
+        closes = np.linspace(100.0, 120.0, 40)
+        holdings = [{"symbol": "MEMO", "yahoo_symbol": "MEMO", "weight": 1.0}]
+        pe._RISK_STATS_CACHE.pop("MEMO", None)
+        with patch("app.services.portfolio_engine.fetch_histories", return_value={"MEMO": closes}), patch(
+            "app.services.portfolio_engine._symbol_risk_stats", wraps=pe._symbol_risk_stats
+        ) as stats:
+            first, _ = pe.compute_risk_metrics([dict(h) for h in holdings], {}, pe.PortfolioSettings())
+            second, _ = pe.compute_risk_metrics([dict(h) for h in holdings], {}, pe.PortfolioSettings())
+        self.assertEqual(stats.call_count, 1)
+        self.assertEqual(first, second)
+
+
+class NewsImpactCacheTests(unittest.TestCase):
+    def test_news_impact_memoized_for_versioned_alias_map(self):
+        alias_map = pe.load_aliases()
+        items = [_NEWS_ITEM]
+        pe._NEWS_IMPACT_CACHE.clear()
+        with patch("app.services.portfolio_engine._compute_news_impact", wraps=pe._compute_news_impact) as compute:
+            first = pe.compute_news_impact(items, alias_map, 0.1, [], None)
+            second = pe.compute_news_impact([_NEWS_ITEM], alias_map, 0.1, [], None)
+            pe.compute_news_impact(items, alias_map, -0.1, [], None)
+            pe.compute_news_impact(items, {k: v for k, v in alias_map.items() if k != "_version"}, 0.1, [], None)
+        self.assertEqual(compute.call_count, 3)
+        self.assertEqual(first, second)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from app.infra.db import init_db
+from app.services.portfolio_engine import (
+    load_portfolio_holdings,
+    upsert_portfolio_holding,
+    upsert_portfolio_holdings_bulk,
+)
+
+
+class PortfolioHoldingsTests(unittest.TestCase):
+    def test_bulk_upsert_inserts_and_updates_in_place(self):
+        db = init_db("sqlite:///:memory:")
+        upsert_portfolio_holdings_bulk(db, [("AMD", 1.0), ("PLTR", 2.0)])
+        created = db.fetchone("SELECT created_at FROM portfolio_holdings WHERE symbol = ?", ("AMD",))["created_at"]
+
+        upsert_portfolio_holdings_bulk(db, [("AMD", 3.5), ("BTC", 0.1)])
+        upsert_portfolio_holding(db, "PLTR", 4.0)
+
+        holdings = {h["symbol"]: h["qty"] for h in load_portfolio_holdings(db, seed_defaults=False)}
+        self.assertEqual(holdings, {"AMD": 3.5, "PLTR": 4.0, "BTC": 0.1})
+        row = db.fetchone("SELECT created_at FROM portfolio_holdings WHERE symbol = ?", ("AMD",))
+        self.assertEqual(row["created_at"], created)
+
+    def test_bulk_upsert_empty_is_noop(self):
+        db = init_db("sqlite:///:memory:")
+        upsert_portfolio_holdings_bulk(db, [])
+        self.assertEqual(load_portfolio_holdings(db, seed_defaults=False), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
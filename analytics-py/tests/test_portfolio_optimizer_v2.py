@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from app.models import NewsItem
-from app.services.portfolio_engine import compute_news_impact, build_optimizer, compute_fx_risk, PortfolioSettings
+from app.services.portfolio_engine import compute_news_impact, build_optimizer, compute_fx_risk, match_news_item, PortfolioSettings
 
 
 def _now_iso():
@@ -119,3 +119,56 @@ def test_fx_risk_flag_threshold():
     assert usd_exposure == 0.60
     assert fx_proxy == 0.60
     assert flag is True
+
+
+def test_fuzzy_match_survives_token_anchor_prefilter():
+    alias_map = {
+        "symbols": {
+            "SOKM": {"aliases": ["Sok Marketler Ticaret"], "sector": "RETAIL"},
+            "ABC": {"aliases": ["Alpha Beta Gamma"], "sector": "SECTOR1"},
+        },
+        "fx": {},
+    }
+    item = NewsItem(title="Marketler Sok ticaret hacmini artirdi", url="http://example.com/b")
+    matches, counts = match_news_item(item, alias_map)
+    assert [m["symbol"] for m in matches] == ["SOKM"]
+    assert matches[0]["method"] == "fuzzy"
+    assert counts["fuzzy"] == 1
+
+
+def _crypto_increases(weight: float) -> dict[str, list[str]]:
+    holdings = [
+        {"symbol": sym, "weight": weight, "asset_class": "CRYPTO", "currency": "USD", "mom_z_7d": 3.0, "vol_30d": 0.01}
+        for sym in ("BTC", "ETH", "SOL")
+    ]
+    impact = {"BTC": 0.9, "ETH": 0.8, "SOL": 0.7}
+    recs = build_optimizer(
+        holdings,
+        impact,
+        impact,
+        {sym: 0.0 for sym in impact},
+        [],
+        PortfolioSettings(),
+        coverage_ratio=1.0,
+        coverage_total=10,
+        low_signal_ratio=0.0,
+        fx_risk_proxy=0.0,
+    )
+    return {r["period"]: [a["symbol"] for a in r["actions"] if a["action"] == "increase"] for r in recs}
+
+
+def test_crypto_cap_checks_current_crypto_weight():
+    # Each crypto candidate is checked against the held crypto weight plus its own delta.
+    increases = _crypto_increases(0.05)
+    assert increases["daily"] == ["BTC", "ETH", "SOL"]
+    assert increases["weekly"] == ["BTC", "ETH", "SOL"]
+    assert _crypto_increases(0.06)["weekly"] == []
+
+
+def test_normalized_title_cache_tracks_title_changes():
+    alias_map = {"symbols": {"ABC": {"aliases": ["Alpha"], "sector": "SECTOR1"}}, "fx": {}}
+    item = NewsItem(title="Alpha earnings beat", url="http://example.com/c")
+    assert [m["symbol"] for m in match_news_item(item, alias_map)[0]] == ["ABC"]
+    assert "_norm_cache" not in item.model_dump()
+    item.title = "Unrelated headline"
+    assert match_news_item(item, alias_map)[0] == []
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import httpx
+
 from app.providers.base import ProviderResult
-from app.services.quote_router import Quote, QuoteProvider, QuoteRouter
+from app.services.quote_router import HTTP_TIMEOUT_S, LAST_GOOD_TTL_MAX_S, Quote, QuoteProvider, QuoteRouter, TTLCache, YahooQuoteProvider
 
 
 def _iso_from_ts(ts: float) -> str:
@@ -119,3 +124,231 @@ def test_last_good_served_when_all_fail() -> None:
     assert second.data is not None
     assert second.data.price == 404.0
     assert second.data.meta["degraded_mode"] is True
+
+
+class BatchProvider(QuoteProvider):
+    batch_size = 2
+
+    def __init__(self, name: str, prices: dict[str, float], ts_iso: str):
+        super().__init__()
+        self.name = name
+        self._prices = prices
+        self._ts_iso = ts_iso
+        self.batches: list[list[str]] = []
+
+    def get_quote(self, symbol: str) -> ProviderResult[Quote]:
+        return self.get_quotes([symbol])[symbol]
+
+    def get_quotes(self, symbols: list[str]) -> dict[str, ProviderResult[Quote]]:
+        self.batches.append(list(symbols))
+        out = {}
+        for symbol in symbols:
+            price = self._prices.get(symbol)
+            if price is None:
+                out[symbol] = _err(self.name)
+            else:
+                out[symbol] = _ok(self.name, Quote(price=price, change_pct=None, ts_utc=self._ts_iso, currency=None, meta={}))
+        return out
+
+
+def test_get_quotes_batches_and_falls_back_per_miss() -> None:
+    now = 1_700_000_000.0
+    ts_iso = _iso_from_ts(now)
+    yahoo = BatchProvider("yahoo", {"AAA": 1.0, "BBB": 2.0}, ts_iso)
+    fallback = StubProvider("finnhub", [_ok("finnhub", Quote(price=3.0, change_pct=None, ts_utc=ts_iso, currency=None, meta={}))])
+
+    router = QuoteRouter([yahoo, fallback], now_fn=lambda: now)
+    results = router.get_quotes(["AAA", "BBB", "CCC", "AAA"])
+
+    assert sorted(yahoo.batches) == [["AAA", "BBB"], ["CCC"]]
+    assert fallback.calls == 1
+    assert {s: r.data.price for s, r in results.items()} == {"AAA": 1.0, "BBB": 2.0, "CCC": 3.0}
+    assert results["CCC"].data.meta["is_fallback"] is True
+
+
+def test_get_quotes_runs_single_symbol_fallbacks_in_parallel() -> None:
+    now = 1_700_000_000.0
+    quote = Quote(price=9.0, change_pct=None, ts_utc=_iso_from_ts(now), currency=None, meta={}, ts_epoch=now)
+    barrier = threading.Barrier(3, timeout=2)
+
+    class BarrierProvider(StubProvider):
+        def get_quote(self, symbol: str) -> ProviderResult[Quote]:
+            barrier.wait()
+            return super().get_quote(symbol)
+
+    provider = BarrierProvider("stub", [_ok("stub", quote)])
+    router = QuoteRouter([provider], now_fn=lambda: now)
+    results = router.get_quotes(["A", "B", "C"])
+
+    assert all(r.ok for r in results.values())
+
+
+def test_patch_snapshot_fetches_missing_fields_in_one_batch() -> None:
+    now = 1_700_000_000.0
+    provider = BatchProvider("stub", {"BTC": 50_000.0, "ETH": 3_000.0}, _iso_from_ts(now))
+    provider.batch_size = 20
+
+    router = QuoteRouter([provider], now_fn=lambda: now)
+    patched, meta = router.patch_snapshot({"btc": 0, "eth": None, "nasdaq": 15_000.0})
+
+    assert len(provider.batches) == 1
+    assert "^IXIC" not in provider.batches[0]
+    assert patched["btc"] == 50_000.0
+    assert patched["eth"] == 3_000.0
+    assert patched["nasdaq"] == 15_000.0
+    assert meta["used_fallback"] is True
+
+
+def test_ttl_cache_expires_lazily_and_caps_size() -> None:
+    clock = {"now": 1_000.0}
+    cache = TTLCache(10, lambda: clock["now"], max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_s=30)
+    cache.set("a", 3, ttl_s=60)
+    assert cache.get("a") == 3
+
+    clock["now"] += 20
+    cache.set("c", 4)
+    assert cache.snapshot() == {"a": 3, "c": 4}
+
+    clock["now"] += 100
+    assert cache.snapshot() == {}
+    assert cache.store == {}
+
+
+def test_stale_check_uses_quote_epoch() -> None:
+    now = 1_700_000_000.0
+    stale_epoch = now - 7 * 60 * 60
+    quote = Quote(price=1.0, change_pct=None, ts_utc=_iso_from_ts(stale_epoch), currency=None, meta={}, ts_epoch=stale_epoch)
+    fresh = Quote(price=2.0, change_pct=None, ts_utc=_iso_from_ts(now), currency=None, meta={}, ts_epoch=now)
+
+    router = QuoteRouter([StubProvider("yahoo", [_ok("yahoo", quote)]), StubProvider("finnhub", [_ok("finnhub", fresh)])], now_fn=lambda: now)
+    result = router.get_quote("SPY")
+
+    assert result.data is not None
+    assert result.data.price == 2.0
+    assert result.data.meta["freshness_seconds"] == 0
+
+
+def test_dynamic_ttl_extends_for_hot_symbols() -> None:
+    now = 1_700_000_000.0
+    quote = Quote(price=1.0, change_pct=None, ts_utc=_iso_from_ts(now), currency=None, meta={}, ts_epoch=now)
+    router = QuoteRouter([StubProvider("stub", [_ok("stub", quote)])], now_fn=lambda: now, last_good_ttl_s=120)
+
+    # Zipf-like traffic: rank-k symbol requested ~60/k times.
+    for rank, symbol in enumerate(["HOT", "WARM", "COOL", "COLD"], start=1):
+        for _ in range(60 // rank if rank < 4 else 1):
+            router.get_quote(symbol)
+
+    ttls = [router.dynamic_ttl(symbol) for symbol in ("HOT", "WARM", "COOL", "COLD")]
+    assert ttls == sorted(ttls, reverse=True)
+    assert ttls[-1] == 120
+    assert ttls[0] <= LAST_GOOD_TTL_MAX_S
+    assert router.dynamic_ttl("UNSEEN") == 120
+
+
+def test_concurrent_requests_share_in_flight_fetch() -> None:
+    now = 1_700_000_000.0
+    quote = Quote(price=5.0, change_pct=None, ts_utc=_iso_from_ts(now), currency=None, meta={}, ts_epoch=now)
+    started = threading.Event()
+    waiting = threading.Event()
+
+    class SlowProvider(StubProvider):
+        def get_quote(self, symbol: str) -> ProviderResult[Quote]:
+            started.set()
+            # Hold the owner's fetch until the second request has joined it as a waiter.
+            waiting.wait(2)
+            return super().get_quote(symbol)
+
+    class WaitSignalRouter(QuoteRouter):
+        def _await_in_flight(self, symbol, fut):
+            waiting.set()
+            return super()._await_in_flight(symbol, fut)
+
+    provider = SlowProvider("stub", [_ok("stub", quote)])
+    router = WaitSignalRouter([provider], now_fn=lambda: now)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        first = ex.submit(router.get_quote, "X")
+        assert started.wait(2)
+        second = ex.submit(router.get_quote, "X")
+        results = [first.result(2), second.result(2)]
+
+    assert waiting.is_set()
+    assert provider.calls == 1
+    assert [r.data.price for r in results] == [5.0, 5.0]
+
+
+def test_in_flight_wait_covers_provider_chain() -> None:
+    providers = [StubProvider("yahoo", [_err("yahoo")]), StubProvider("finnhub", [_err("finnhub")])]
+    router = QuoteRouter(providers + [DisabledProvider("twelvedata")], now_fn=lambda: 0.0)
+
+    assert router.in_flight_wait_s > 2 * HTTP_TIMEOUT_S
+
+
+def test_default_clocks_split_timing_and_freshness() -> None:
+    wall_now = time.time()
+    quote = Quote(price=7.0, change_pct=None, ts_utc=_iso_from_ts(wall_now), currency=None, meta={}, ts_epoch=wall_now)
+    router = QuoteRouter([StubProvider("stub", [_ok("stub", quote)])])
+
+    result = router.get_quote("MONO")
+
+    assert router.now_fn is time.monotonic
+    assert result.data is not None
+    assert 0 <= result.data.meta["freshness_seconds"] < 60
+
+
+def test_yahoo_batch_response_parsed_per_symbol() -> None:
+    body = (
+        b'{"quoteResponse":{"result":['
+        b'{"symbol":"AAA","regularMarketPrice":1.5,"regularMarketTime":1700000000,"currency":"USD"},'
+        b'{"symbol":"BBB","regularMarketPrice":0}]}}'
+    )
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["symbols"])
+        return httpx.Response(200, content=body)
+
+    provider = YahooQuoteProvider()
+    provider._client = httpx.Client(transport=httpx.MockTransport(handler))
+    results = provider.get_quotes(["AAA", "BBB", "CCC"])
+
+    assert requested == ["AAA,BBB,CCC"]
+    assert results["AAA"].ok and results["AAA"].data.price == 1.5
+    assert results["AAA"].data.ts_epoch == 1700000000.0
+    assert results["BBB"].error_code == "missing_price"
+    assert results["CCC"].error_code == "empty"
+
+
+def test_batch_rate_limit_backs_off_provider_without_negative_caching() -> None:
+    now = 1_700_000_000.0
+    quote = Quote(price=8.0, change_pct=None, ts_utc=_iso_from_ts(now), currency=None, meta={}, ts_epoch=now)
+    yahoo = StubProvider("yahoo", [_err("yahoo", "http_429")])
+    yahoo.batch_size = 10
+    fallback = StubProvider("finnhub", [_ok("finnhub", quote)])
+
+    router = QuoteRouter([yahoo, fallback], now_fn=lambda: now)
+    results = router.get_quotes(["A", "B", "C"])
+
+    assert all(r.ok for r in results.values())
+    assert router.provider_state["yahoo"].backoff_exp == 1
+    assert router.provider_state["yahoo"].backoff_until > now
+    assert router.negative_cache.get("yahoo:A") is None
+    assert router.negative_cache.get("yahoo:C") is None
+
+
+def test_rate_limit_burst_stops_remaining_concurrent_requests() -> None:
+    now = 1_700_000_000.0
+    provider = StubProvider("stub", [_err("stub", "http_429")])
+    router = QuoteRouter([provider], now_fn=lambda: now)
+    symbols = [f"S{i}" for i in range(12)]
+
+    results = router.get_quotes(symbols)
+
+    # A request only starts once a worker is free, i.e. after an earlier one saw the 429.
+    assert provider.calls < len(symbols)
+    # Every skipped request is counted once, on the calling thread.
+    assert provider.calls + router.stats["backoff_hits"] == len(symbols)
+    assert router.provider_state["stub"].backoff_exp == 1
+    assert all(router.negative_cache.get(f"stub:{s}") is None for s in symbols)
+    assert all(not r.ok for r in results.values())
@@ -3,15 +3,22 @@ import unittest
 from app.engine.sector_impact import attach_scope_and_sectors
 
 
+# attach_scope_and_sectors writes its outputs into the item, so each test gets a shallow copy.
+_ITEM_BASE = {
+    "title": "",
+    "description": "",
+    "event_type": None,
+    "entities": (),
+    "tags": (),
+    "publishedAtISO": "2025-01-01T00:00:00Z",
+}
+
+
 def _item(title: str, event_type: str | None = None, entities=None):
-    return {
-        "title": title,
-        "description": "",
-        "event_type": event_type,
-        "entities": entities or [],
-        "tags": [],
-        "publishedAtISO": "2025-01-01T00:00:00Z",
-    }
+    item = {**_ITEM_BASE, "title": title, "event_type": event_type}
+    if entities:
+        item["entities"] = entities
+    return item
 
 
 class ScopeSectorTests(unittest.TestCase):
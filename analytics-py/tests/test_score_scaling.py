@@ -8,8 +8,12 @@ from app.models import NewsItem
 from app.services.event_store import store_events
 
 
+# Read once at import; the event-store test only needs a recent timestamp, not a per-call one.
+_NOW_ISO = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return _NOW_ISO
 
 
 def _settings() -> Settings:
@@ -36,6 +40,20 @@ def _settings() -> Settings:
 
 
 class ScoreScalingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One in-memory DB per class; tearDown empties the event tables so tests stay isolated.
+        cls.settings = _settings()
+        cls.db = init_db(cls.settings.database_url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.conn.close()
+
+    def tearDown(self):
+        self.db.execute("DELETE FROM event_asset_map")
+        self.db.execute("DELETE FROM events")
+
     def test_rank_score_impacts_order(self):
         base = NewsItem(
             title="Test",
@@ -73,8 +91,6 @@ class ScoreScalingTests(unittest.TestCase):
         self.assertAlmostEqual(score, 100.0, places=2)
 
     def test_event_impact_scaled_to_100(self):
-        settings = _settings()
-        db = init_db(settings.database_url)
         item = NewsItem(
             title="War risk escalates in region",
             url="http://example.com/war",
@@ -83,9 +99,9 @@ class ScoreScalingTests(unittest.TestCase):
             event_type="SANCTIONS_GEOPOLITICS",
             publishedAtISO=_now_iso(),
         )
-        stored = store_events(db, [item], settings)
+        stored = store_events(self.db, [item], self.settings)
         self.assertEqual(stored, 1)
-        row = db.fetchone("SELECT impact_score FROM events LIMIT 1")
+        row = self.db.fetchone("SELECT impact_score FROM events LIMIT 1")
         self.assertIsNotNone(row)
         impact = float(row["impact_score"] or 0.0)
         self.assertGreaterEqual(impact, 1.0)
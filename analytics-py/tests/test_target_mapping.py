@@ -3,76 +3,53 @@ import unittest
 from app.models import NewsItem
 from app.services.event_store import _relevance_targets
 
+_ALL_ASSETS = ("BTC", "ETH", "ALTS", "STABLES")
 
-def _targets(item: NewsItem) -> dict[str, float]:
-    return {asset: score for asset, score in _relevance_targets(item)}
 
+def _news(title: str, slug: str, **extra) -> NewsItem:
+    return NewsItem(title=title, url=f"http://example.com{slug}", source="example.com", **extra)
 
-class TargetMappingTests(unittest.TestCase):
-    def test_stablecoin_regulation_targets(self):
-        item = NewsItem(
-            title="SEC enforcement action targets stablecoin issuer",
-            url="http://example.com",
-            source="example.com",
+
+# case -> (item, predicate over the asset -> score mapping)
+_CASES = {
+    "stablecoin_regulation": (
+        _news(
+            "SEC enforcement action targets stablecoin issuer",
+            "",
             event_type="REGULATION_LEGAL",
             tags=["Reg", "Stablecoin"],
-        )
-        t = _targets(item)
-        self.assertTrue(all(k in t for k in ("BTC", "ETH", "ALTS", "STABLES")))
-        self.assertGreater(t["STABLES"], t["BTC"])
-        self.assertGreaterEqual(t["STABLES"], t["ALTS"])
-
-    def test_etf_flow_targets_btc(self):
-        item = NewsItem(
-            title="Spot ETF inflow accelerates after approval",
-            url="http://example.com/etf",
-            source="example.com",
-            tags=["ETF"],
-        )
-        t = _targets(item)
-        self.assertGreater(t["BTC"], t["ALTS"])
-        self.assertGreater(t["BTC"], t["ETH"])
+        ),
+        lambda t: all(k in t for k in _ALL_ASSETS) and t["STABLES"] > t["BTC"] and t["STABLES"] >= t["ALTS"],
+    ),
+    "etf_flow_btc": (
+        _news("Spot ETF inflow accelerates after approval", "/etf", tags=["ETF"]),
+        lambda t: t["BTC"] > t["ALTS"] and t["BTC"] > t["ETH"],
+    ),
+    "l2_defi_alts": (
+        _news("Arbitrum L2 rollup activity surges in DeFi", "/l2"),
+        lambda t: t["ALTS"] > t["ETH"] and t["ALTS"] > t["BTC"],
+    ),
+    "btc_specific": (
+        _news("Bitcoin climbs as BTC demand rises", "/btc"),
+        lambda t: t["BTC"] > t["ETH"] and t["BTC"] > t["ALTS"],
+    ),
+    "exchange_regulation_stables": (
+        _news("Regulators tighten exchange custody requirements", "/exchange", tags=["Reg"]),
+        lambda t: t["STABLES"] > t["BTC"],
+    ),
+    "defaults_present": (
+        _news("Minor corporate update", "/minor", news_scope="COMPANY"),
+        lambda t: all(k in t for k in _ALL_ASSETS) and all(0 <= v <= 1 for v in t.values()),
+    ),
+}
 
-    def test_l2_defi_targets_alts(self):
-        item = NewsItem(
-            title="Arbitrum L2 rollup activity surges in DeFi",
-            url="http://example.com/l2",
-            source="example.com",
-        )
-        t = _targets(item)
-        self.assertGreater(t["ALTS"], t["ETH"])
-        self.assertGreater(t["ALTS"], t["BTC"])
 
-    def test_btc_specific_targets(self):
-        item = NewsItem(
-            title="Bitcoin climbs as BTC demand rises",
-            url="http://example.com/btc",
-            source="example.com",
-        )
-        t = _targets(item)
-        self.assertGreater(t["BTC"], t["ETH"])
-        self.assertGreater(t["BTC"], t["ALTS"])
-
-    def test_exchange_regulation_targets_stables(self):
-        item = NewsItem(
-            title="Regulators tighten exchange custody requirements",
-            url="http://example.com/exchange",
-            source="example.com",
-            tags=["Reg"],
-        )
-        t = _targets(item)
-        self.assertGreater(t["STABLES"], t["BTC"])
-
-    def test_defaults_present(self):
-        item = NewsItem(
-            title="Minor corporate update",
-            url="http://example.com/minor",
-            source="example.com",
-            news_scope="COMPANY",
-        )
-        t = _targets(item)
-        self.assertTrue(all(k in t for k in ("BTC", "ETH", "ALTS", "STABLES")))
-        self.assertTrue(all(0 <= v <= 1 for v in t.values()))
+class TargetMappingTests(unittest.TestCase):
+    def test_relevance_targets_cases(self):
+        for name, (item, check) in _CASES.items():
+            targets = dict(_relevance_targets(item))
+            with self.subTest(case=name):
+                self.assertTrue(check(targets), targets)
 
 
 if __name__ == "__main__":
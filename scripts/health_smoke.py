@@ -2,6 +2,7 @@
 import json
 import sys
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 BACKEND_URL = "http://localhost:8080/api/v1/health"
 ANALYTICS_URL = "http://localhost:8001/health"
@@ -34,19 +35,19 @@ def validate(resp, label: str):
 
 
 def main():
-    try:
-        backend = fetch_json(BACKEND_URL)
-        validate(backend, "backend")
-    except Exception as exc:
-        print(f"backend health check failed: {exc}")
-        sys.exit(1)
-
-    try:
-        analytics = fetch_json(ANALYTICS_URL)
-        validate(analytics, "analytics")
-    except Exception as exc:
-        print(f"analytics health check failed: {exc}")
-        sys.exit(1)
+    # The probes are independent, so run them together; wall time is the slower probe, not the sum.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            "backend": pool.submit(fetch_json, BACKEND_URL),
+            "analytics": pool.submit(fetch_json, ANALYTICS_URL),
+        }
+        # Report in a fixed order so the first failure message matches the sequential run.
+        for label, future in futures.items():
+            try:
+                validate(future.result(), label)
+            except Exception as exc:
+                print(f"{label} health check failed: {exc}")
+                sys.exit(1)
 
     print("health smoke test ok")
 